@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from __future__ import division, print_function
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+__description__ = \
+"""
+Benchmark of import time of application modules, each measured in a fresh interpreter so
+modules already imported by an earlier measurement are not free
+""".strip()
+
+# Define variables used for timing
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+REPEATS = 5
+
+# Statements timed, each after interpreter has started. Lazily imported dependencies are
+# timed separately by their first use
+STATEMENTS = [
+    ('utils',             "import utils"),
+    ('plots',             "import plots"),
+    ('compare',           "import compare"),
+    ('sweep',             "import sweep"),
+    ('streaming',         "import streaming"),
+    ('cache',             "import cache"),
+    ('cli',               "import cli"),
+    ('main',              "import main"),
+    ('first get_model',   "import utils; utils.get_model('Random Forests', 'Classification')"),
+    ('first plot canvas', "import visual")
+]
+
+# Runs in child interpreter, printing seconds taken by statement
+TIMER = """
+import sys, time
+sys.path.insert(0, %r)
+start = time.time()
+exec(%r)
+print(time.time() - start)
+"""
+
+
+def time_statement(statement, repeats=REPEATS):
+    """Times a statement in fresh interpreters
+
+    Parameters
+    ----------
+    statement : str
+        Python statement
+
+    repeats : int
+        Number of interpreters started
+
+    Returns
+    -------
+    dict
+        Seconds of each run, with best and median run, or error if statement failed
+    """
+    runs = []
+    for _ in range(repeats):
+        process = subprocess.Popen([sys.executable, '-c', TIMER % (SRC_DIR, statement)],
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=SRC_DIR)
+        out, err = process.communicate()
+        if process.returncode != 0:
+            lines = err.decode('utf-8', 'replace').strip().splitlines()
+            return {'error': lines[-1] if lines else 'Exit code %d' % process.returncode}
+        runs.append(float(out.decode('utf-8').strip().splitlines()[-1]))
+
+    runs.sort()
+    return {'best': runs[0], 'median': runs[len(runs)//2], 'runs': runs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__description__)
+    parser.add_argument('-n', '--repeats', type=int, default=REPEATS,
+                        help="Interpreters started per statement (default: %(default)s)")
+    parser.add_argument('-o', '--output', help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = {'python': platform.python_version(), 'platform': platform.platform(),
+               'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'repeats': args.repeats,
+               'statements': []}
+
+    print("%-20s %10s %10s" % ('Statement', 'Best (s)', 'Median (s)'))
+    for name, statement in STATEMENTS:
+        result = dict(time_statement(statement, args.repeats), name=name, statement=statement)
+        results['statements'].append(result)
+        if 'error' in result:
+            print("%-20s %s" % (name, result['error']))
+        else:
+            print("%-20s %10.3f %10.3f" % (name, result['best'], result['median']))
+
+    if args.output:
+        with open(args.output, 'w') as handle: json.dump(results, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+from __future__ import division, print_function
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+__description__ = \
+"""
+Benchmark suite timing loading, statistics, model fitting, and plot rendering on synthetic
+data shaped like demo_data.csv, writing results as JSON to compare across commits
+""".strip()
+
+# Make application modules importable and draw plots off-screen
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import compare
+import plots
+import utils
+
+# Define variables used for benchmarks
+ROWS           = [10000, 100000, 1000000] # Rows of each dataset
+WIDTHS         = [4]                      # Columns of each dataset, at least the 4 demo columns
+REPEATS        = 3
+SEED           = 1718
+WRITE_CHUNK    = 1000000 # Rows generated and written per chunk, bounding memory of 50M rows
+MODEL_MAX_ROWS = 100000  # Rows above which models are benchmarked on the first rows only
+PLOT_TYPES     = ['Scatter', 'Line', 'Histogram', 'Bar Chart', 'Boxplot']
+BIN_RULES      = ['Doane', 'Freedman-Diaconis', 'Fixed Width', 'Quantile']
+THRESHOLD      = 1.2     # Ratio to baseline above which a benchmark is reported as slower
+
+
+def make_dataset(filename, n_rows, n_columns=4, seed=SEED):
+    """Writes synthetic data shaped like demo_data.csv to a csv file
+
+    contX1 is standard normal, catX2 is 0 or 1, contY depends linearly on both and catY is 1
+    when contY is positive. Columns beyond the four demo columns are standard normal contX<i>
+
+    Parameters
+    ----------
+    filename : str
+        Path of csv file
+
+    n_rows : int
+        Number of rows
+
+    n_columns : int
+        Number of columns
+
+    seed : int
+        Seed of random numbers, so datasets are the same across runs
+
+    Returns
+    -------
+    None
+    """
+    rng   = np.random.RandomState(seed)
+    extra = ['contX%d' % i for i in range(3, n_columns - 1)]
+    for start in range(0, n_rows, WRITE_CHUNK):
+        n      = min(WRITE_CHUNK, n_rows - start)
+        contX1 = rng.randn(n)
+        catX2  = rng.randint(0, 2, n).astype(float)
+        contY  = 0.8*contX1 - 0.5*catX2 + 0.6*rng.randn(n)
+        data   = pd.DataFrame({'contX1': contX1, 'catX2': catX2, 'contY': contY,
+                               'catY': (contY > 0).astype(float)},
+                              columns=['contX1', 'catX2', 'contY', 'catY'])
+        for name in extra: data[name] = rng.randn(n)
+        data.to_csv(filename, mode='w' if start == 0 else 'a', header=start == 0, index=False,
+                    float_format='%.6f')
+
+
+def time_call(func, repeats=REPEATS):
+    """Times a function, returning best, median, and all run times in seconds"""
+    runs = []
+    for _ in range(repeats):
+        start = time.time()
+        func()
+        runs.append(time.time() - start)
+    runs.sort()
+    return {'best': runs[0], 'median': runs[len(runs)//2], 'runs': runs}
+
+
+def render_plot(x, y, xlabel, ylabel, plot_type):
+    """Draws a plot off-screen the same way the application canvas does, see plots.draw_plot"""
+    fig    = Figure(figsize=(8, 6), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    plots.draw_plot(fig, fig.add_subplot(111), x, y, xlabel, ylabel, plot_type, n_buckets=800)
+    canvas.draw()
+
+
+def benchmark_dataset(filename, n_rows, n_columns, args, fit_models=True):
+    """Runs all benchmarks on one dataset
+
+    Parameters
+    ----------
+    filename : str
+        Path of csv file
+
+    n_rows : int
+        Number of rows
+
+    n_columns : int
+        Number of columns
+
+    args : argparse Namespace
+        Parsed arguments
+
+    fit_models : bool
+        Whether to benchmark models, which only use the demo columns so are the same at any
+        width
+
+    Returns
+    -------
+    list
+        One result per benchmark
+    """
+    results = []
+
+    def record(benchmark, func, **info):
+        result = dict(benchmark=benchmark, rows=n_rows, columns=n_columns, **info)
+        try:
+            result.update(time_call(func, args.repeats))
+            print("%-24s %10d %7d %-24s %9.3f s" % (benchmark, n_rows, n_columns,
+                                                     info.get('name', ''), result['best']))
+        except Exception as e:
+            result['error'] = str(e)
+            print("%-24s %10d %7d %-24s failed: %s" % (benchmark, n_rows, n_columns,
+                                                        info.get('name', ''), e))
+        results.append(result)
+
+    # Load parsing, which also gives the data for the remaining benchmarks
+    loaded = {}
+    def load(): loaded['data'] = utils.read_data(filename)[0]
+    record('load', load, name='csv')
+    if 'data' not in loaded: return results
+    data = loaded['data']
+
+    # Statistics of a continuous and a categorical variable, and of every variable
+    record('univariate_statistics', lambda: utils.univariate_statistics(data['contX1']),
+           name='contX1')
+    record('univariate_statistics', lambda: utils.univariate_statistics(data['catX2']),
+           name='catX2')
+    for rule in BIN_RULES:
+        record('value_counts_grouped', 
+               lambda: utils.value_counts_grouped(data['contX1'], rule=rule, bin_width=0.01),
+               name='contX1 %s' % rule)
+    if n_columns > 4:
+        record('profile_all_columns',
+               lambda: [utils.profile_column((name, data[name])) for name in data.columns],
+               name='all')
+
+    # Plots rendered off-screen, large data is reduced as in application
+    if not args.skip_plots:
+        for plot_type in PLOT_TYPES:
+            x, xlabel = (data['catX2'], 'catX2') if plot_type == 'Bar Chart' else \
+                        (data['contX1'], 'contX1')
+            y, ylabel = (None, 'None') if plot_type in ['Histogram', 'Bar Chart'] else \
+                        (data['contY'], 'contY')
+            record('plot', lambda: render_plot(x, y, xlabel, ylabel, plot_type), name=plot_type)
+
+    # Models are fit on the demo columns of the first rows only, as large data would take days
+    if args.skip_models or not fit_models: return results
+    model_rows = min(n_rows, args.model_max_rows)
+    X          = data[['contX1', 'catX2']].values[:model_rows]
+    targets    = [('Regression', data['contY'].values[:model_rows]),
+                  ('Classification', data['catY'].values[:model_rows]),
+                  ('Clustering', None)]
+
+    for model_type, y in targets:
+        names = sorted(name for name in utils.LINK_MODEL_API[model_type]
+                       if name not in utils.STREAMING_MODELS)
+        for name in names:
+            if model_rows > compare.MODEL_MAX_ROWS.get(name, np.inf):
+                results.append(dict(benchmark=model_type, rows=n_rows, columns=n_columns,
+                                    name=name, model_rows=model_rows,
+                                    skipped='More than %d rows' % compare.MODEL_MAX_ROWS[name]))
+                continue
+
+            if model_type == 'Clustering':
+                func = lambda: utils.unsupervised_ml(X, utils.get_model(name, model_type))
+            else:
+                func = lambda: utils.supervised_ml(X, y, utils.get_model(name, model_type),
+                                                   model_type)
+            record(model_type, func, name=name, model_rows=model_rows)
+
+    return results
+
+
+def environment():
+    """Returns versions of interpreter and libraries, and commit being benchmarked"""
+    import sklearn
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT_DIR,
+                                         stderr=subprocess.STDOUT).decode('utf-8').strip()
+    except Exception:
+        commit = None
+    return {'commit': commit, 'python': platform.python_version(),
+            'platform': platform.platform(), 'numpy': np.__version__,
+            'pandas': pd.__version__, 'sklearn': sklearn.__version__,
+            'matplotlib': matplotlib.__version__,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+
+def result_key(result):
+    """Identifies a benchmark across runs"""
+    return (result['benchmark'], result['rows'], result['columns'], result.get('name'))
+
+
+def compare_results(results, baseline, threshold=THRESHOLD):
+    """Prints benchmarks slower than baseline by more than threshold
+
+    Parameters
+    ----------
+    results : list
+        Results of this run
+
+    baseline : list
+        Results of an earlier run
+
+    threshold : float
+        Ratio of best times above which a benchmark is reported
+
+    Returns
+    -------
+    int
+        Number of benchmarks that got slower
+    """
+    previous = {result_key(result): result for result in baseline if 'best' in result}
+    n_slower = 0
+    for result in results:
+        before = previous.get(result_key(result))
+        if 'best' not in result or before is None or before['best'] <= 0: continue
+        ratio = result['best']/before['best']
+        if ratio > threshold:
+            n_slower += 1
+            print("Slower: %s %s rows=%d columns=%d %.3f s -> %.3f s (%.2fx)" % \
+                  (result['benchmark'], result.get('name', ''), result['rows'],
+                   result['columns'], before['best'], result['best'], ratio))
+    return n_slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__description__)
+    parser.add_argument('--rows', default=','.join(map(str, ROWS)),
+                        help="Comma separated rows of datasets, up to 50000000 "
+                             "(default: %(default)s)")
+    parser.add_argument('--widths', default=','.join(map(str, WIDTHS)),
+                        help="Comma separated columns of datasets, for example 4,100,1000 "
+                             "(default: %(default)s)")
+    parser.add_argument('-n', '--repeats', type=int, default=REPEATS,
+                        help="Runs of each benchmark (default: %(default)s)")
+    parser.add_argument('--model-max-rows', type=int, default=MODEL_MAX_ROWS,
+                        help="Rows models are fit on at most (default: %(default)s)")
+    parser.add_argument('--skip-models', action='store_true', help="Do not fit models")
+    parser.add_argument('--skip-plots', action='store_true', help="Do not render plots")
+    parser.add_argument('--data-dir',
+                        help="Directory keeping generated datasets between runs (default: a "
+                             "temporary directory removed afterwards)")
+    parser.add_argument('-o', '--output', help="Write results as JSON to this file")
+    parser.add_argument('--baseline', help="JSON results of an earlier run to compare against")
+    args = parser.parse_args()
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix='eda_viewer_bench_')
+    if not os.path.isdir(data_dir): os.makedirs(data_dir)
+
+    results = []
+    print("%-24s %10s %7s %-24s %11s" % ('Benchmark', 'Rows', 'Columns', 'Name', 'Best'))
+    try:
+        widths = sorted(set(max(4, int(width)) for width in args.widths.split(',')))
+        for n_columns in widths:
+            for n_rows in [int(rows) for rows in args.rows.split(',')]:
+                filename = os.path.join(data_dir, 'bench_%d_%d_%d.csv' % (n_rows, n_columns, SEED))
+                if not os.path.exists(filename): make_dataset(filename, n_rows, n_columns)
+                results.extend(benchmark_dataset(filename, n_rows, n_columns, args,
+                                                 fit_models=n_columns == widths[0]))
+    finally:
+        if not args.data_dir: shutil.rmtree(data_dir, ignore_errors=True)
+
+    output = {'environment': environment(), 'repeats': args.repeats, 'results': results}
+    if args.output:
+        with open(args.output, 'w') as handle: json.dump(output, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as handle: baseline = json.load(handle)['results']
+        if compare_results(results, baseline): sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
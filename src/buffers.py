@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from buffers_api import *
+
+
+class ColumnBuffer(object):
+    """Variable handed to worker threads, standardized lazily by the first worker that needs it
+
+    The GUI thread only wraps the variable, so nothing is copied or computed there. Workers 
+    call series(): unstandardized variables are the data frame's own column, standardized ones
+    are computed once with a single allocation (subtract into a new array, then divide in 
+    place) and shared by every worker holding the same buffer.
+
+    Parameters
+    ----------
+    column : pandas Series
+        Variable data
+
+    standardize : bool
+        Whether variable is centered by its mean and scaled by its standard deviation
+    """
+    def __init__(self, column, standardize=False):
+        self.column      = column
+        self.name        = column.name
+        self.standardize = standardize
+        self._series     = None if standardize else column
+        self._lock       = threading.Lock()
+
+
+    def __len__(self):
+        return len(self.column)
+
+
+    def series(self):
+        """Returns variable, standardizing it first if this is the first call
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        pandas Series
+            Variable data, same index and name as column
+        """
+        with self._lock:
+            if self._series is None:
+                # Sum of squares comes from centered values already allocated, missing values
+                # are skipped and standard deviation has ddof=1 as in pandas
+                values       = np.asarray(self.column, dtype=np.float64)
+                standardized = np.subtract(values, np.nanmean(values))
+                missing      = np.isnan(standardized)
+                if missing.any():
+                    present = standardized[~missing]
+                    n, ss   = present.shape[0], np.dot(present, present)
+                else:
+                    n, ss   = standardized.shape[0], np.dot(standardized, standardized)
+                standardized /= np.sqrt(ss/(n - 1)) if n > 1 else np.nan
+                self._series  = pd.Series(standardized, index=self.column.index, name=self.name, 
+                                          copy=False)
+            return self._series
+
+
+def resolve(value):
+    """Returns series of a column buffer, any other value as is"""
+    return value.series() if isinstance(value, ColumnBuffer) else value
@@ -0,0 +1,10 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Column buffers handing variables from the GUI thread to worker threads without copying
+""".strip()
+
+import numpy as np
+import pandas as pd
+import threading
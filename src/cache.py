@@ -0,0 +1,572 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from cache_api import *
+
+
+def file_fingerprint(filename, block_bytes=HASH_BLOCK_BYTES):
+    """Computes a key identifying the current contents of a file
+
+    The key combines the absolute path, size, and modification time of the file with a SHA-1
+    hash of its first, middle, and last blocks, so changed files are detected without
+    reading multi-GB files end to end.
+
+    Parameters
+    ----------
+    filename : str
+        Path to file
+
+    block_bytes : int
+        Size of each block included in content hash
+
+    Returns
+    -------
+    key : str
+        Hex digest identifying file
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    sha1 = hashlib.sha1()
+    sha1.update(('%s|%d|%.6f' % (path, stat.st_size, stat.st_mtime)).encode('utf-8'))
+
+    with open(path, 'rb') as handle:
+        for offset in sorted(set([0, max(stat.st_size//2 - block_bytes//2, 0),
+                                  max(stat.st_size - block_bytes, 0)])):
+            handle.seek(offset)
+            sha1.update(handle.read(block_bytes))
+
+    return sha1.hexdigest()
+
+
+class DatasetCache(object):
+    """On-disk cache of parsed data sets stored as memory-mapped NumPy arrays
+
+    Each entry is a directory named by the file fingerprint holding one .npy file per column
+    and a metadata file. Numeric, boolean, and datetime columns are memory-mapped when read
+    back, as are the codes of category columns, so their pages are read lazily. Object columns
+    are stored as integer codes plus their unique values and are materialized when read back.
+    Entries are evicted least recently used first once the cache exceeds its size cap.
+
+    Parameters
+    ----------
+    directory : str
+        Directory holding cache entries
+
+    max_bytes : int
+        Maximum total size of cache entries in bytes
+    """
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+
+    def _entries(self):
+        """Returns list of (last access time, size in bytes, path) for each cache entry"""
+        entries = []
+        if not os.path.isdir(self.directory): return entries
+
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            meta = os.path.join(path, META_FILE)
+            if not os.path.isfile(meta): continue
+            size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+            entries.append((os.path.getmtime(meta), size, path))
+        return entries
+
+
+    def size(self):
+        """Returns total size of cache entries in bytes"""
+        return sum(size for _, size, _ in self._entries())
+
+
+    def load(self, filename):
+        """Loads cached data for a file if the file has not changed since it was cached
+
+        Parameters
+        ----------
+        filename : str
+            Path to data file
+
+        Returns
+        -------
+        data : pandas DataFrame or None
+            Cached data, or None if file is not cached
+        """
+        path = os.path.join(self.directory, file_fingerprint(filename))
+        meta = os.path.join(path, META_FILE)
+        if not os.path.isfile(meta): return None
+
+        with open(meta, 'r') as handle:
+            info = json.load(handle)
+
+        # Columns are collected first and the frame is built in one call with copy=False, since
+        # assigning arrays to a frame one at a time copies them out of the memory map
+        columns = OrderedDict()
+        for i, column in enumerate(info['columns']):
+            values_file = os.path.join(path, '%d.npy' % i)
+
+            # Copy-on-write memory map, so pages are read lazily and edits never touch the cache
+            if column['kind'] == 'array':
+                columns[column['name']] = np.load(values_file, mmap_mode='c')
+
+            else:
+                codes   = np.load(values_file, mmap_mode='c')
+                uniques = np.load(os.path.join(path, '%d_uniques.npy' % i), allow_pickle=True)
+                if column['kind'] == 'category':
+                    columns[column['name']] = pd.Categorical.from_codes(codes, uniques)
+
+                # Object columns are materialized, there is no object array to map
+                elif len(uniques) == 0:
+                    columns[column['name']] = np.full(info['n_rows'], np.nan, dtype=object)
+                else:
+                    values                  = np.take(uniques, codes)
+                    values[codes < 0]       = np.nan
+                    columns[column['name']] = values
+
+        data = pd.DataFrame(columns, index=pd.RangeIndex(info['n_rows']), columns=list(columns.keys()),
+                            copy=False)
+
+        # Mark entry as recently used
+        os.utime(meta, None)
+        return data
+
+
+    def store(self, filename, data):
+        """Writes parsed data for a file to the cache and evicts old entries if needed
+
+        Parameters
+        ----------
+        filename : str
+            Path to data file
+
+        data : pandas DataFrame
+            Parsed data
+
+        Returns
+        -------
+        None
+        """
+        # Skip data sets that could never fit in the cache
+        if data.memory_usage(index=False).sum() > self.max_bytes: return
+
+        # Remove stale entries for the same file so they do not wait for eviction
+        source = os.path.abspath(filename)
+        self.remove(source)
+
+        # Write to temporary directory first so partially written entries are never loaded
+        if not os.path.isdir(self.directory): os.makedirs(self.directory)
+        path    = os.path.join(self.directory, file_fingerprint(filename))
+        tmp     = tempfile.mkdtemp(dir=self.directory)
+        columns = []
+        try:
+            for i, name in enumerate(data.columns):
+                series = data[name]
+                dtype  = str(series.dtypes)
+                if dtype == 'category':
+                    kind, codes, uniques = 'category', series.cat.codes.values, series.cat.categories.values
+                elif series.values.dtype.kind in 'biufcM':
+                    kind, codes, uniques = 'array', series.values, None
+                else:
+                    codes, uniques = pd.factorize(series.values)
+                    kind, uniques  = 'object', np.asarray(uniques, dtype=object)
+
+                np.save(os.path.join(tmp, '%d.npy' % i), codes)
+                if uniques is not None:
+                    np.save(os.path.join(tmp, '%d_uniques.npy' % i), uniques, allow_pickle=True)
+                columns.append({'name': name, 'kind': kind, 'dtype': dtype})
+
+            with open(os.path.join(tmp, META_FILE), 'w') as handle:
+                json.dump({'source': source, 'n_rows': data.shape[0], 'columns': columns}, handle)
+
+            if os.path.isdir(path): shutil.rmtree(path)
+            os.rename(tmp, path)
+
+        except Exception:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+        self.evict()
+
+
+    def remove(self, source):
+        """Removes all entries cached for a file
+
+        Parameters
+        ----------
+        source : str
+            Absolute path to data file
+
+        Returns
+        -------
+        None
+        """
+        for _, _, path in self._entries():
+            try:
+                with open(os.path.join(path, META_FILE), 'r') as handle:
+                    info = json.load(handle)
+            except (IOError, OSError, ValueError):
+                continue
+            if info.get('source') == source: shutil.rmtree(path, ignore_errors=True)
+
+
+    def evict(self):
+        """Removes least recently used entries until cache is within its size cap
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        entries = sorted(self._entries())
+        total   = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes: break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+
+    def clear(self):
+        """Removes all cache entries
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        n_bytes : int
+            Number of bytes freed
+        """
+        n_bytes = self.size()
+        if os.path.isdir(self.directory):
+            # Also removes temporary directories left behind by interrupted writes
+            for name in os.listdir(self.directory):
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+        return n_bytes
+
+
+def estimate_nbytes(value):
+    """Estimates memory used by a computed result
+
+    Parameters
+    ----------
+    value : object
+        Result, possibly nested in tuples, lists, or dicts
+
+    Returns
+    -------
+    int
+        Approximate size in bytes
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    elif isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    elif isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    elif isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(k) + estimate_nbytes(v) 
+                                          for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    else:
+        return sys.getsizeof(value)
+
+
+class ResultCache(object):
+    """In-memory least recently used cache of computed results, bounded by memory
+
+    Keys are tuples whose first element is the name of the variable the result was computed
+    from, so all results for a variable can be invalidated at once.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum approximate size of cached results in bytes
+    """
+    def __init__(self, max_bytes=RESULT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.n_bytes   = 0
+        self._items    = OrderedDict() # Key mapped to (value, size in bytes), oldest first
+
+
+    def __contains__(self, key):
+        return key in self._items
+
+
+    def __len__(self):
+        return len(self._items)
+
+
+    def get(self, key, default=None):
+        """Returns cached result and marks it as recently used
+
+        Parameters
+        ----------
+        key : tuple
+            Key of result
+
+        default : object
+            Returned if key is not cached
+
+        Returns
+        -------
+        object
+            Cached result or default
+        """
+        if key not in self._items: return default
+        value, n_bytes   = self._items.pop(key)
+        self._items[key] = (value, n_bytes)
+        return value
+
+
+    def put(self, key, value):
+        """Caches result, evicting least recently used results until within memory bound
+
+        Parameters
+        ----------
+        key : tuple
+            Key of result
+
+        value : object
+            Result
+
+        Returns
+        -------
+        None
+        """
+        self.pop(key)
+        n_bytes = estimate_nbytes(value)
+        if n_bytes > self.max_bytes: return
+
+        self._items[key] = (value, n_bytes)
+        self.n_bytes    += n_bytes
+        while self.n_bytes > self.max_bytes: self.pop(next(iter(self._items)))
+
+
+    def pop(self, key):
+        """Removes result if cached
+
+        Parameters
+        ----------
+        key : tuple
+            Key of result
+
+        Returns
+        -------
+        None
+        """
+        if key in self._items: self.n_bytes -= self._items.pop(key)[1]
+
+
+    def invalidate(self, name):
+        """Removes all results computed from a variable
+
+        Parameters
+        ----------
+        name : str
+            Name of variable
+
+        Returns
+        -------
+        None
+        """
+        for key in [key for key in self._items if key[0] == name]: self.pop(key)
+
+
+    def clear(self):
+        """Removes all results"""
+        self._items.clear()
+        self.n_bytes = 0
+
+
+def model_fingerprint(X, y, model_type, model_name, params, settings=None):
+    """Computes a key identifying a model fit
+
+    Parameters
+    ----------
+    X : 2d array-like
+        Features
+
+    y : 1d array-like
+        Labels, or None for clustering models without them
+
+    model_type : str
+        Either 'Regression', 'Classification', or 'Clustering'
+
+    model_name : str
+        Name of model
+
+    params : dict
+        Parameters of model from get_params
+
+    settings : tuple
+        Other settings that change results, e.g. number of folds and their seed
+
+    Returns
+    -------
+    key : str
+        Hex digest identifying model fit
+    """
+    sha1 = hashlib.sha1()
+    for values in [X, y]:
+        if values is None:
+            sha1.update(b'None|')
+            continue
+
+        # Column-major design matrices are hashed through their transpose, so they are not copied
+        if values.flags['F_CONTIGUOUS'] and not values.flags['C_CONTIGUOUS']: values = values.T
+        values = np.ascontiguousarray(values)
+        sha1.update(('%s|%s|' % (values.dtype.str, values.shape)).encode('utf-8'))
+        sha1.update(values.data)
+
+    # Parameters are sorted so the key does not depend on dictionary order
+    sha1.update(('%s|%s|%r|%r' % (model_type, model_name, sorted(params.items()), 
+                                  settings)).encode('utf-8'))
+    return sha1.hexdigest()
+
+
+class ModelCache(object):
+    """Cache of model fits, holding out of fold predictions and scores in memory and on disk
+
+    Recently used fits are kept in memory. Every fit is also written to an .npz file named by 
+    its key, so fits survive restarts. Files are evicted least recently used first once the 
+    directory exceeds its size cap.
+
+    Parameters
+    ----------
+    directory : str
+        Directory holding cached fits
+
+    max_bytes : int
+        Maximum total size of cached fits on disk in bytes
+
+    memory_bytes : int
+        Maximum approximate size of cached fits in memory in bytes
+    """
+    def __init__(self, directory=MODEL_CACHE_DIR, max_bytes=MODEL_CACHE_MAX_BYTES, 
+                 memory_bytes=RESULT_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory    = ResultCache(max_bytes=memory_bytes)
+
+
+    def _path(self, key):
+        """Returns path of file holding a cached fit"""
+        return os.path.join(self.directory, '%s.npz' % key)
+
+
+    def _entries(self):
+        """Returns list of (last access time, size in bytes, path) for each cached fit"""
+        if not os.path.isdir(self.directory): return []
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if name.endswith('.npz')]
+        return [(os.path.getmtime(path), os.path.getsize(path), path) for path in paths]
+
+
+    def size(self):
+        """Returns total size of cached fits on disk in bytes"""
+        return sum(size for _, size, _ in self._entries())
+
+
+    def get(self, key):
+        """Returns cached fit and marks it as recently used
+
+        Parameters
+        ----------
+        key : str
+            Key from model_fingerprint
+
+        Returns
+        -------
+        result : tuple or None
+            Predictions and scores, or None if fit is not cached
+        """
+        result = self.memory.get((key,))
+        if result is not None: return result
+
+        path = self._path(key)
+        try:
+            with np.load(path) as npz:
+                result = (npz['y_pred'], npz['scores'])
+            os.utime(path, None)
+        except (IOError, OSError, KeyError, ValueError):
+            return None
+
+        self.memory.put((key,), result)
+        return result
+
+
+    def put(self, key, result):
+        """Caches fit in memory and on disk, evicting old fits if needed
+
+        Parameters
+        ----------
+        key : str
+            Key from model_fingerprint
+
+        result : tuple
+            Predictions and scores
+
+        Returns
+        -------
+        None
+        """
+        y_pred, scores = np.asarray(result[0]), np.asarray(result[1])
+        self.memory.put((key,), (y_pred, scores))
+
+        # Skip fits that could never fit in the cache
+        if y_pred.nbytes + scores.nbytes > self.max_bytes: return
+
+        # Write to temporary file first so partially written fits are never loaded
+        if not os.path.isdir(self.directory): os.makedirs(self.directory)
+        handle, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                np.savez(f, y_pred=y_pred, scores=scores)
+            os.rename(tmp, self._path(key))
+        except Exception:
+            if os.path.exists(tmp): os.remove(tmp)
+            raise
+
+        self.evict()
+
+
+    def evict(self):
+        """Removes least recently used fits until cache is within its size cap"""
+        entries = sorted(self._entries())
+        total   = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes: break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+
+    def clear(self):
+        """Removes all cached fits
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        n_bytes : int
+            Number of bytes freed on disk
+        """
+        n_bytes = self.size()
+        self.memory.clear()
+        if os.path.isdir(self.directory):
+            # Also removes temporary files left behind by interrupted writes
+            for name in os.listdir(self.directory):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+        return n_bytes
@@ -0,0 +1,35 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Caching of parsed data sets, computed results, and model fits for application
+""".strip()
+
+from collections import OrderedDict
+import hashlib
+import json
+import numpy as np
+import os
+import pandas as pd
+import shutil
+import sys
+import tempfile
+
+
+###############
+"""CONSTANTS"""
+###############
+
+# Location and size cap of data set cache, both can be overridden with environment variables
+CACHE_DIR        = os.environ.get('EDA_VIEWER_CACHE_DIR',
+                                  os.path.join(os.path.expanduser('~'), '.eda_viewer', 'cache'))
+CACHE_MAX_BYTES  = int(os.environ.get('EDA_VIEWER_CACHE_MAX_BYTES', 10*1024**3))
+HASH_BLOCK_BYTES = 1024**2 # Size of each block sampled for content hash
+META_FILE        = 'meta.json'
+
+RESULT_CACHE_MAX_BYTES = 256*1024**2 # Memory bound of in-memory result caches
+
+# Location and size cap of fitted model cache, both can be overridden with environment variables
+MODEL_CACHE_DIR       = os.environ.get('EDA_VIEWER_MODEL_CACHE_DIR',
+                                       os.path.join(os.path.expanduser('~'), '.eda_viewer', 'models'))
+MODEL_CACHE_MAX_BYTES = int(os.environ.get('EDA_VIEWER_MODEL_CACHE_MAX_BYTES', 1024**3))
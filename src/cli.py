@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+
+# Future imports only apply to the module they appear in, so they are not taken from api
+from __future__ import division, print_function
+
+# Import libraries from api
+from cli_api import *
+
+
+def parse_args(argv=None):
+    """Parses command line arguments
+
+    Parameters
+    ----------
+    argv : list or None
+        Arguments, sys.argv[1:] if None
+
+    Returns
+    -------
+    argparse Namespace
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Profile data files, fit models, and write statistics, frequency tables, "
+                    "and plots to an output directory without opening the application")
+    parser.add_argument('files', nargs='+',
+                        help="Data files (.csv, .tsv, .txt, .parquet, or .feather), results of "
+                             "each file are written to a subdirectory named after the file")
+    parser.add_argument('-o', '--output', default='eda_output',
+                        help="Output directory (default: %(default)s)")
+    parser.add_argument('--columns',
+                        help="Comma separated variables to profile and plot (default: all)")
+    parser.add_argument('--optimize-memory', action='store_true',
+                        help="Downcast variables to compact data types after loading")
+    parser.add_argument('--dtypes',
+                        help="Comma separated variable=type data type conversions, types any of: "
+                             "%s" % ', '.join(utils.DTYPE_TO_LABEL.keys()))
+    parser.add_argument('--stream', action='store_true',
+                        help="Profile variables from a chunked read of each file without loading "
+                             "it, so files larger than memory can be profiled. Percentiles and "
+                             "frequency tables of numeric variables are estimates, and no plots "
+                             "or models are made")
+    parser.add_argument('--n-jobs', type=int, default=CLI_N_JOBS,
+                        help="Processes used to profile variables and compare models "
+                             "(default: %(default)s)")
+    parser.add_argument('--bin-rule', choices=utils.BIN_RULES, default=utils.DEFAULT_BIN_RULE,
+                        help="Rule choosing bins of frequency tables of numeric variables "
+                             "(default: %(default)s)")
+    parser.add_argument('--bin-width', type=float,
+                        help="Width of bins of Fixed Width bin rule")
+    parser.add_argument('--quantile-bins', type=int, default=utils.QUANTILE_BINS,
+                        help="Number of bins of Quantile bin rule (default: %(default)s)")
+    parser.add_argument('--no-plots', action='store_true',
+                        help="Do not draw a plot of each variable")
+    parser.add_argument('--x', help="X variable of plots of two variables")
+    parser.add_argument('--y', help="Y variable of plots of two variables, and label of models")
+    parser.add_argument('--plots',
+                        help="Comma separated plots of X and Y variables, any of: %s "
+                             "(default: Scatter)" % ', '.join(PLOT_TYPES))
+    parser.add_argument('--model-type', choices=MODEL_TYPES,
+                        help="Type of models to fit on features, with Y variable as label")
+    parser.add_argument('--models',
+                        help="Comma separated models to fit (default: all models of model type "
+                             "that are not streamed)")
+    parser.add_argument('--features',
+                        help="Comma separated features of models (default: X variable, or all "
+                             "variables other than Y variable if no X variable)")
+    parser.add_argument('--dtype', choices=utils.DESIGN_DTYPES, default=utils.DESIGN_DTYPES[0],
+                        help="Data type of design matrix (default: %(default)s)")
+    parser.add_argument('--no-one-hot', action='store_true',
+                        help="Encode categorical features as integer codes instead of one-hot")
+    parser.add_argument('--compare', action='store_true',
+                        help="Also benchmark every model of model type, see Tools -> Fit All "
+                             "Models")
+    parser.add_argument('--save-predictions', action='store_true',
+                        help="Write predictions of each model")
+    return parser.parse_args(argv)
+
+
+def split_names(text):
+    """Splits comma separated names, returning None if text is empty"""
+    if not text: return None
+    return [name.strip() for name in text.split(',') if name.strip()]
+
+
+def parse_dtypes(text):
+    """Parses comma separated variable=type conversions into a dict, empty if text is empty"""
+    dtypes = OrderedDict()
+    for item in split_names(text) or []:
+        name, _, dtype = item.rpartition('=')
+        if not name or dtype.strip() not in utils.DTYPE_TO_LABEL:
+            raise ValueError("Data type conversion %s is not variable=type with a supported "
+                             "type" % item)
+        dtypes[name.strip()] = dtype.strip()
+    return dtypes
+
+
+def plot_slug(plot_type):
+    """Returns plot type in a form used in file names"""
+    return plot_type.lower().replace(' + ', '_').replace(' ', '_')
+
+
+def profile_data(data, names, n_jobs=CLI_N_JOBS, bins=None):
+    """Profiles variables on a process pool, see utils.profile_column
+
+    Parameters
+    ----------
+    data : pandas DataFrame
+        Data
+
+    names : list
+        Names of variables to profile
+
+    n_jobs : int
+        Number of processes
+
+    bins : dict
+        Keyword arguments of utils.value_counts_grouped choosing bins, Doane's rule if None
+
+    Returns
+    -------
+    profile_results : OrderedDict
+        Variable names mapped to data type, statistics, and frequency table in order of names
+    """
+    profile_results = OrderedDict()
+    columns         = OrderedDict((name, data[name]) for name in names)
+    pool            = multiprocessing.Pool(processes=max(1, min(n_jobs, len(names))),
+                                           initializer=utils.init_profile_worker, initargs=(columns,))
+    try:
+        task = partial(utils.profile_column, bins=bins)
+        for name, dtype, stats, freq in pool.imap(task, names, chunksize=1):
+            profile_results[name] = (dtype, stats, freq)
+    finally:
+        pool.terminate()
+        pool.join()
+    return profile_results
+
+
+def stream_profile(filename, names=None, bins=None, dtypes=None):
+    """Profiles variables from a chunked read of a data file without loading it, see 
+    streaming.streaming_statistics
+
+    Parameters
+    ----------
+    filename : str
+        Path to data file
+
+    names : list or None
+        Names of variables to profile, all variables if None
+
+    bins : dict
+        Keyword arguments of streaming.StreamingStatistics.frequencies choosing bins, Doane's 
+        rule if None
+
+    dtypes : dict
+        Names of variables mapped to data types each chunk is converted to
+
+    Returns
+    -------
+    profile_results : OrderedDict
+        Variable names mapped to data type, statistics, and frequency table in order of names
+    """
+    results = streaming.streaming_statistics(filename, columns=names, bins=bins, dtypes=dtypes)
+    return OrderedDict((name, (dtype, stats, freq)) 
+                       for name, (stats, freq, _, dtype) in results.iteritems())
+
+
+def save_plot(filename, x, y, xlabel, ylabel, plot_type):
+    """Draws plot of one or two variables to an image file, see plots.draw_plot
+
+    Parameters
+    ----------
+    filename : str
+        Path of image file
+
+    x : pandas Series
+        x variable for plotting
+
+    y : pandas Series
+        y variable for plotting
+
+    xlabel : str
+        Name of x variable
+
+    ylabel : str
+        Name of y variable
+
+    plot_type : str
+        Name of plot to generate
+
+    Returns
+    -------
+    None
+    """
+    # Figures are not registered with pyplot, so nothing is held once the file is written
+    fig = Figure(figsize=PLOT_SIZE, dpi=PLOT_DPI)
+    FigureCanvasAgg(fig)
+    plots.draw_plot(fig, fig.add_subplot(111), x, y, xlabel, ylabel, plot_type,
+                    n_buckets=int(PLOT_SIZE[0]*PLOT_DPI))
+    fig.savefig(filename)
+
+
+def save_variable_plots(data, names, directory):
+    """Draws a histogram of each numeric variable and a bar chart of each other variable with
+    few distinct values
+
+    Parameters
+    ----------
+    data : pandas DataFrame
+        Data
+
+    names : list
+        Names of variables to plot
+
+    directory : str
+        Directory to write plot_<variable>.png files to
+
+    Returns
+    -------
+    failed : dict
+        Names of variables whose plot failed mapped to reason
+    """
+    failed = {}
+    for name in names:
+        values = data[name].dropna()
+        if utils.is_numeric(values):
+            plot_type = 'Histogram'
+        elif values.nunique() <= BAR_CHART_MAX_LEVELS:
+            plot_type = 'Bar Chart'
+        else:
+            continue
+
+        try:
+            save_plot(os.path.join(directory, 'plot_%s.png' % name), values, None, name, 'None',
+                      plot_type)
+        except Exception as e:
+            failed[name] = str(e)
+    return failed
+
+
+def fit_models(data, features, label, model_type, model_names, dtype='float64', one_hot=True,
+               compare_models=False, n_jobs=CLI_N_JOBS):
+    """Fits models on a design matrix of features with default parameters
+
+    Parameters
+    ----------
+    data : pandas DataFrame
+        Data
+
+    features : list
+        Names of features
+
+    label : str or None
+        Name of label, only optional for clustering
+
+    model_type : str
+        Either 'Regression', 'Classification', or 'Clustering'
+
+    model_names : list
+        Names of models
+
+    dtype : str
+        Data type of design matrix
+
+    one_hot : bool
+        Whether to one-hot encode categorical features
+
+    compare_models : bool
+        Whether to also benchmark every model of model type, see compare.run_comparison
+
+    n_jobs : int
+        Number of processes used to benchmark models
+
+    Returns
+    -------
+    scores : pandas DataFrame
+        One row per model and metric with columns SCORE_COLUMNS
+
+    predictions : pandas DataFrame
+        Predictions of each model that was fit, out of fold for regression and classification
+
+    comparison : pandas DataFrame or None
+        Comparison table, None if models are not compared
+    """
+    # Clustering label is cast into design matrix with features, not stacked on later
+    if model_type == 'Clustering' and label is not None: features, label = features + [label], None
+
+    X, _ = utils.build_design_matrix([data[name] for name in features], dtype=dtype,
+                                     one_hot=one_hot)
+    y    = None if label is None else data[label].values.astype(float)
+
+    # Ensure label is categorical (based on CV splits) prior to fitting classifier
+    if model_type == 'Classification' and not utils.check_for_categorical_label(y):
+        raise ValueError("Less than 3 samples per unique value of %s" % label)
+
+    rows, predictions = [], OrderedDict()
+    for name in model_names:
+        start = time.time()
+        try:
+            y_pred, scores = utils.run_model(X, y, utils.get_model(name, model_type), model_type)
+        except Exception as e:
+            rows.append([name, None, None, None, time.time() - start, str(e)])
+            continue
+
+        elapsed           = time.time() - start
+        predictions[name] = y_pred
+        if model_type == 'Clustering':
+            for metric, score in zip(['Silhouette Score', 'Calinski Harabaz Score'], scores):
+                rows.append([name, metric, score, None, elapsed, 'Finished'])
+        else:
+            metric = 'Accuracy' if model_type == 'Classification' else 'Mean Squared Error'
+            rows.append([name, metric, np.mean(scores), np.std(scores), elapsed, 'Finished'])
+
+    comparison = None
+    if compare_models:
+        columns    = compare.comparison_columns(compare.run_comparison(X, y, model_type,
+                                                                       n_jobs=n_jobs))
+        comparison = pd.DataFrame(OrderedDict(zip(compare.COMPARISON_COLUMNS, columns)),
+                                  columns=compare.COMPARISON_COLUMNS)
+
+    return pd.DataFrame(rows, columns=SCORE_COLUMNS), pd.DataFrame(predictions), comparison
+
+
+def process_file(filename, args):
+    """Profiles, plots, and fits models on one data file, writing results to a subdirectory of
+    output directory named after the file
+
+    Parameters
+    ----------
+    filename : str
+        Path to data file
+
+    args : argparse Namespace
+        Parsed arguments, see parse_args
+
+    Returns
+    -------
+    directory : str
+        Directory results were written to
+    """
+    directory = os.path.join(args.output, os.path.splitext(os.path.basename(filename))[0])
+    if not os.path.isdir(directory): os.makedirs(directory)
+
+    # Only read variables that are used, unless variables to profile are not given
+    columns  = split_names(args.columns)
+    features = split_names(args.features) or ([args.x] if args.x else None)
+    if columns is not None:
+        used    = columns + (features or []) + [name for name in [args.x, args.y] if name]
+        columns = list(OrderedDict.fromkeys(used))
+
+    if args.bin_rule == 'Fixed Width' and not args.bin_width:
+        raise ValueError("Bin width not specified for Fixed Width bin rule")
+    bins   = {'rule': args.bin_rule, 'bin_width': args.bin_width, 'n_bins': args.quantile_bins}
+    dtypes = parse_dtypes(args.dtypes)
+
+    # Profile variables from a chunked read instead of loading, data types are converted per chunk
+    if args.stream:
+        if args.x or args.y or args.model_type:
+            raise ValueError("Plots and models need loaded data, they cannot be used with --stream")
+        print("%s: profiling without loading" % filename)
+        utils.write_profile(stream_profile(filename, split_names(args.columns), bins=bins, 
+                                           dtypes=dtypes), directory)
+        return directory
+
+    print("%s: loading data" % filename)
+    data, memory = utils.read_data(filename, columns=columns, optimize=args.optimize_memory)
+    if memory is not None:
+        print("%s: optimized memory from %.1f MB to %.1f MB" %
+              (filename, memory[0]/1e6, memory[1]/1e6))
+    for name, dtype in dtypes.iteritems(): data[name] = utils.safe_astype(data[name], dtype)
+
+    # Profile variables and write statistics and frequency tables
+    names = split_names(args.columns) or list(data.columns)
+    print("%s: profiling %d variables" % (filename, len(names)))
+    utils.write_profile(profile_data(data, names, n_jobs=args.n_jobs, bins=bins), directory)
+
+    # Plot each variable, then X and Y variables together
+    if not args.no_plots:
+        for name, reason in save_variable_plots(data, names, directory).iteritems():
+            print("%s: plot of %s failed: %s" % (filename, name, reason), file=sys.stderr)
+
+    if args.x or args.y:
+        # Like the application, Sample is the x-axis of plots of a y variable over rows
+        x, xlabel = (data[args.x], args.x) if args.x else (None, 'None')
+        y, ylabel = (data[args.y], args.y) if args.y else (None, 'None')
+        for plot_type in split_names(args.plots) or ['Scatter']:
+            if plot_type not in PLOT_TYPES: raise ValueError("Plot type %s not supported" % plot_type)
+            if plot_type in utils.PLOTS_FOR_PRED and x is None:
+                x, xlabel = pd.Series(np.arange(data.shape[0]), name='Sample'), 'Sample'
+            save_plot(os.path.join(directory, 'plot_%s_%s_x_%s.png' % (plot_slug(plot_type),
+                                                                       xlabel, ylabel)),
+                      x, y, xlabel, ylabel, plot_type)
+
+    # Fit models on features with Y variable as label
+    if args.model_type:
+        if features is None: features = [name for name in data.columns if name != args.y]
+        if args.y in features and args.model_type != 'Clustering':
+            raise ValueError("Y variable %s is also a feature" % args.y)
+        if args.y is None and args.model_type != 'Clustering':
+            raise ValueError("Y variable not specified")
+
+        # Streaming models train from the data file instead, see utils.incremental_ml
+        model_names = split_names(args.models) or \
+                      sorted(name for name in utils.LINK_MODEL_API[args.model_type]
+                             if name not in utils.STREAMING_MODELS)
+
+        for name in model_names:
+            if name not in utils.LINK_MODEL_API[args.model_type]:
+                raise ValueError("Model %s is not a %s model" % (name, args.model_type.lower()))
+
+        label = None if args.y in features else args.y
+        print("%s: fitting %d %s models on %d features" %
+              (filename, len(model_names), args.model_type.lower(), len(features)))
+        scores, predictions, comparison = fit_models(data, features, label, args.model_type,
+                                                     model_names, dtype=args.dtype,
+                                                     one_hot=not args.no_one_hot,
+                                                     compare_models=args.compare,
+                                                     n_jobs=args.n_jobs)
+
+        scores.to_csv(os.path.join(directory, 'model_scores.csv'), index=False)
+        if comparison is not None:
+            comparison.to_csv(os.path.join(directory, 'model_comparison.csv'), index=False)
+        if args.save_predictions:
+            predictions.to_csv(os.path.join(directory, 'model_predictions.csv'),
+                               index_label='Sample')
+
+    return directory
+
+
+def main(argv=None):
+    """Processes each data file in turn, continuing with remaining files if one fails
+
+    Parameters
+    ----------
+    argv : list or None
+        Arguments, sys.argv[1:] if None
+
+    Returns
+    -------
+    int
+        Exit status, 1 if any file failed
+    """
+    args   = parse_args(argv)
+    status = 0
+    for filename in args.files:
+        try:
+            print("%s: results written to %s" % (filename, process_file(filename, args)))
+        except Exception as e:
+            print("%s: failed: %s" % (filename, str(e)), file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Command line entry point that profiles data files, fits models, and writes statistics,
+frequency tables, and plots to an output directory without a GUI
+""".strip()
+
+import argparse
+from collections import OrderedDict
+from functools import partial
+import json
+import multiprocessing
+import numpy as np
+import os
+import pandas as pd
+import sys
+import time
+
+# Draw plots to image files, before any module imports pyplot
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Custom functions
+import compare
+import plots
+import streaming
+import utils
+
+
+###############
+"""CONSTANTS"""
+###############
+
+CLI_N_JOBS           = multiprocessing.cpu_count() # Processes profiling variables
+PLOT_TYPES           = ['Scatter', 'Line', 'Scatter + Line', 'Histogram', 'Bar Chart', 'Boxplot']
+MODEL_TYPES          = ['Regression', 'Classification', 'Clustering']
+PLOT_SIZE            = (8, 6) # Inches
+PLOT_DPI             = 100
+BAR_CHART_MAX_LEVELS = 50     # Variables with more distinct values get no bar chart
+SCORE_COLUMNS        = ['Model', 'Metric', 'Mean Score', 'SD', 'Time (s)', 'Status']
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from compare_api import *
+
+
+def _benchmark_fit(task):
+    """Fits one fold of one model, used as the task run by each pool worker
+
+    Each worker runs a single task, so the growth of its peak memory belongs to that fit alone
+
+    Parameters
+    ----------
+    task : tuple
+        Model name, fold number, train indices, test indices, unfitted model, and model type. 
+        Indices are None for clustering models, which are fit on all rows
+
+    Returns
+    -------
+    name : str
+        Model name
+
+    fold : int
+        Fold number
+
+    result : dict
+        Score, fit time, predict time, and peak memory of fit, or error that stopped it
+    """
+    name, fold, train_idx, test_idx, model, model_type = task
+    memory = tracing.peak_rss_mb()
+    try:
+        if model_type == 'Clustering':
+            X              = utils._FOLD_DATA['X']
+            start          = time.time()
+            y_pred         = utils.cluster_labels(X, model)
+            fit_time       = time.time() - start
+            predict_time   = None
+            score          = utils.clustering_scores(X, y_pred)[0]
+        else:
+            X_train, X_test, y_train, y_test = utils.fold_data(train_idx, test_idx)
+            start          = time.time()
+            model.fit(X_train, y_train)
+            fit_time       = time.time() - start
+            start          = time.time()
+            y_pred         = model.predict(X_test)
+            predict_time   = time.time() - start
+            from sklearn.metrics import accuracy_score, mean_squared_error
+            if model_type == 'Regression':
+                score      = mean_squared_error(y_test, y_pred)
+            else:
+                score      = accuracy_score(y_test, y_pred)
+
+    except Exception as e:
+        return name, fold, {'error': str(e)}
+
+    if memory is not None: memory = tracing.peak_rss_mb() - memory
+    return name, fold, {'score': score, 'fit_time': fit_time, 'predict_time': predict_time,
+                        'memory': memory, 'error': None}
+
+
+def summarize(name, model_type, results, n_folds, status=None):
+    """Combines fold results of one model into a row of the comparison table
+
+    Parameters
+    ----------
+    name : str
+        Model name
+
+    model_type : str
+        Either 'Regression', 'Classification', or 'Clustering'
+
+    results : list
+        Results of finished folds from _benchmark_fit
+
+    n_folds : int
+        Number of folds model is fit on
+
+    status : str
+        Status overriding the one derived from results, e.g. why the model was skipped
+
+    Returns
+    -------
+    dict
+        Model name, metric, mean and SD of scores, total fit and predict time, largest peak
+        memory, and status
+    """
+    metric = {'Regression': 'Mean Squared Error', 'Classification': 'Accuracy',
+              'Clustering': 'Silhouette Score'}[model_type]
+    row    = {'model': name, 'metric': metric, 'mean': None, 'std': None, 'fit_time': None,
+              'predict_time': None, 'memory': None, 'status': status}
+
+    errors = [result['error'] for result in results if result['error'] is not None]
+    done   = [result for result in results if result['error'] is None]
+    if done:
+        scores              = [result['score'] for result in done]
+        row['mean']         = float(np.mean(scores))
+        row['std']          = float(np.std(scores))
+        row['fit_time']     = sum(result['fit_time'] for result in done)
+        if model_type != 'Clustering':
+            row['predict_time'] = sum(result['predict_time'] for result in done)
+        memory              = [result['memory'] for result in done if result['memory'] is not None]
+        if memory: row['memory'] = max(memory)
+
+    if row['status'] is None:
+        if errors:
+            row['status'] = 'Failed: %s' % errors[0]
+        elif len(results) < n_folds:
+            row['status'] = '%d of %d folds finished' % (len(results), n_folds)
+        else:
+            row['status'] = 'Complete'
+    return row
+
+
+def comparison_columns(rows):
+    """Returns rows of comparison as one list per column of COMPARISON_COLUMNS"""
+    keys = ['model', 'metric', 'mean', 'std', 'fit_time', 'predict_time', 'memory', 'status']
+    return [[row[key] for row in rows] for key in keys]
+
+
+def run_comparison(X, y, model_type, n_jobs=COMPARE_N_JOBS, random_state=utils.CV_RANDOM_STATE,
+                   progress=None):
+    """Fits every model of a model type with default parameters on the same folds, used as
+    the task run by model comparison jobs
+
+    Folds of all models are fit concurrently on a process pool. Workers receive the data
+    once when started and run one fit each, so peak memory is measured per fit.
+
+    Parameters
+    ----------
+    X : 2d array-like
+        Features
+
+    y : 1d array-like
+        Labels, None for clustering, which is fit on every column of X
+
+    model_type : str
+        Either 'Regression', 'Classification', or 'Clustering'
+
+    n_jobs : int
+        Number of worker processes
+
+    random_state : int
+        Seed of fold assignment
+
+    progress : function
+        Called with a progress message and the comparison so far
+
+    Returns
+    -------
+    list
+        One row per model, see summarize
+    """
+    if progress is None: progress = lambda message, data=None: None
+    # Streaming models train from the data file instead, see utils.incremental_ml
+    names = sorted(name for name in utils.LINK_MODEL_API[model_type] 
+                   if name not in utils.STREAMING_MODELS)
+
+    # Clustering models are fit once on all features, other models on each fold
+    if model_type == 'Clustering':
+        y, n_folds    = None, 1
+        splits        = [(None, None)]
+    else:
+        splits  = utils.cv_splits(X, y, model_type, random_state)
+        n_folds = len(splits)
+
+    skipped, tasks = {}, []
+    for name in names:
+        if X.shape[0] > MODEL_MAX_ROWS.get(name, np.inf):
+            skipped[name] = 'Skipped: more than %d rows' % MODEL_MAX_ROWS[name]
+            continue
+        for fold, (train_idx, test_idx) in enumerate(splits):
+            tasks.append((name, fold, train_idx, test_idx, 
+                          utils.get_model(model_name=name, model_type=model_type), model_type))
+
+    # Fits finish in any order, so the table fills in as models finish instead of in task order
+    results = {name: [] for name in names}
+    rows    = lambda: [summarize(name, model_type, results[name], n_folds, skipped.get(name))
+                       for name in names]
+    progress('0 of %d fits finished' % len(tasks), rows())
+
+    pool = multiprocessing.Pool(processes=max(1, n_jobs), initializer=utils.init_fold_worker,
+                                initargs=(X, y), maxtasksperchild=1)
+    try:
+        for n_done, (name, fold, result) in enumerate(pool.imap_unordered(_benchmark_fit, tasks), 1):
+            results[name].append(result)
+            progress('%d of %d fits finished' % (n_done, len(tasks)), rows())
+    finally:
+        pool.terminate()
+        pool.join()
+
+    return rows()
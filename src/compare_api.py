@@ -0,0 +1,29 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Benchmarks every model of a model type on the same data for application
+""".strip()
+
+import multiprocessing
+import numpy as np
+import time
+
+# Custom functions
+import tracing
+import utils
+
+
+###############
+"""CONSTANTS"""
+###############
+
+COMPARE_N_JOBS     = multiprocessing.cpu_count()
+COMPARISON_COLUMNS = ['Model', 'Metric', 'Mean Score', 'SD', 'Fit Time (s)', 'Predict Time (s)', 
+                      'Peak Memory (MB)', 'Status']
+
+# Models whose fit time or memory grows faster than quadratically in rows are skipped above
+# these number of rows, so one model does not hold up the whole comparison. Clustering models
+# bound their own cost, see utils.cluster_labels
+MODEL_MAX_ROWS     = {'Gaussian Process':       5000,
+                      'Support Vector Machine': 50000}
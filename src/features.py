@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from features_api import *
+
+
+class FeaturePanel(QDockWidget):
+    """Dock widget listing variables that can be checked as features of model fits
+
+    When no variable is checked, models are fit on the X-axis variable alone. Checked
+    variables are kept in the order of the variable list, so the same selection always 
+    builds the same design matrix.
+    """
+    # Define signals
+    selection_changed = QtCore.Signal()
+
+    def __init__(self, parent=None):
+        QDockWidget.__init__(self, 'Features', parent)
+        self.setObjectName('dockWidget_Features')
+
+        self.lineEdit_Filter = QLineEdit()
+        self.lineEdit_Filter.setPlaceholderText('Filter variables')
+        self.lineEdit_Filter.textChanged.connect(self.filter_variables)
+
+        self.listWidget_Features = QListWidget()
+        self.listWidget_Features.setToolTip("Checked variables are the features of model fits, "
+                                            "the Y-axis variable is the label")
+        self.listWidget_Features.itemChanged.connect(lambda item: self.selection_changed.emit())
+
+        self.pushButton_SelectAll = QPushButton('Select Shown')
+        self.pushButton_SelectAll.clicked.connect(lambda: self.set_shown_checked(True))
+        self.pushButton_ClearAll  = QPushButton('Clear Shown')
+        self.pushButton_ClearAll.clicked.connect(lambda: self.set_shown_checked(False))
+
+        self.comboBox_DType = QComboBox()
+        self.comboBox_DType.addItems(utils.DESIGN_DTYPES)
+        self.comboBox_DType.setToolTip("float32 halves memory of the design matrix")
+        self.comboBox_DType.activated.connect(lambda index: self.selection_changed.emit())
+
+        self.checkBox_OneHot = QCheckBox('One-hot encode object and category variables')
+        self.checkBox_OneHot.setChecked(True)
+        self.checkBox_OneHot.stateChanged.connect(lambda state: self.selection_changed.emit())
+
+        self.label_Memory = QLabel('No features checked, X-axis variable is used')
+        self.label_Memory.setWordWrap(True)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.pushButton_SelectAll)
+        buttons.addWidget(self.pushButton_ClearAll)
+
+        dtype = QHBoxLayout()
+        dtype.addWidget(QLabel('Data Type'))
+        dtype.addWidget(self.comboBox_DType)
+
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.addWidget(self.lineEdit_Filter)
+        layout.addWidget(self.listWidget_Features)
+        layout.addLayout(buttons)
+        layout.addLayout(dtype)
+        layout.addWidget(self.checkBox_OneHot)
+        layout.addWidget(self.label_Memory)
+        self.setWidget(widget)
+
+
+    def set_variables(self, names):
+        """Replaces variables listed, keeping variables that were checked before checked
+
+        Parameters
+        ----------
+        names : list
+            Names of variables
+
+        Returns
+        -------
+        None
+        """
+        checked = set(self.selected())
+        self.listWidget_Features.blockSignals(True)
+        self.listWidget_Features.clear()
+        for name in names:
+            if name == 'Sample': continue
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | QtCore.Qt.ItemIsUserCheckable)
+            item.setCheckState(QtCore.Qt.Checked if name in checked else QtCore.Qt.Unchecked)
+            self.listWidget_Features.addItem(item)
+        self.listWidget_Features.blockSignals(False)
+        self.filter_variables(self.lineEdit_Filter.text())
+        self.selection_changed.emit()
+
+
+    def rename(self, old_name, new_name):
+        """Renames a listed variable, keeping whether it is checked"""
+        for item in self.listWidget_Features.findItems(old_name, QtCore.Qt.MatchExactly):
+            item.setText(new_name)
+
+
+    def filter_variables(self, text):
+        """Shows only variables whose name contains text"""
+        text = text.lower()
+        for i in xrange(self.listWidget_Features.count()):
+            item = self.listWidget_Features.item(i)
+            item.setHidden(text not in item.text().lower())
+
+
+    def set_shown_checked(self, checked):
+        """Checks or unchecks all variables shown by filter, emitting one selection change"""
+        state = QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked
+        self.listWidget_Features.blockSignals(True)
+        for i in xrange(self.listWidget_Features.count()):
+            item = self.listWidget_Features.item(i)
+            if not item.isHidden(): item.setCheckState(state)
+        self.listWidget_Features.blockSignals(False)
+        self.selection_changed.emit()
+
+
+    def selected(self):
+        """Returns names of checked variables in variable order"""
+        items = [self.listWidget_Features.item(i) for i in xrange(self.listWidget_Features.count())]
+        return [item.text() for item in items if item.checkState() == QtCore.Qt.Checked]
+
+
+    def dtype(self):
+        """Returns data type of design matrix"""
+        return self.comboBox_DType.currentText()
+
+
+    def one_hot(self):
+        """Returns whether object and category variables are one-hot encoded"""
+        return self.checkBox_OneHot.isChecked()
+
+
+    def set_memory_text(self, text):
+        """Shows size of design matrix for current selection"""
+        self.label_Memory.setText(text)
+
+
+    def clear(self):
+        """Removes all variables"""
+        self.set_variables([])
@@ -0,0 +1,13 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Feature selection panel choosing variables of design matrix for model fits in application
+""".strip()
+
+from PySide import QtCore
+from PySide.QtGui import (QCheckBox, QComboBox, QDockWidget, QHBoxLayout, QLabel, QLineEdit, 
+                          QListWidget, QListWidgetItem, QPushButton, QVBoxLayout, QWidget)
+
+# Custom functions
+import utils
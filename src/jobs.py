@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from jobs_api import *
+
+
+def _run_job(conn, func, kwargs, name='Job', profile_dir=None):
+    """Runs job in worker process and sends progress, timing, and result or error back 
+    through pipe
+
+    Parameters
+    ----------
+    conn : multiprocessing Connection
+        Sending end of pipe
+
+    func : function
+        Module level function called with kwargs and a progress keyword argument, which is a
+        function taking a progress message and optionally data for the GUI
+
+    kwargs : dict
+        Keyword arguments of func
+
+    name : str
+        Name of job used in its timing record
+
+    profile_dir : str
+        Directory to write a cProfile dump of job to, None to not profile
+
+    Returns
+    -------
+    None
+    """
+    def progress(message, data=None):
+        conn.send(('progress', (message, data)))
+
+    # Lead a new process group, so cancelling also stops processes the job starts itself
+    if hasattr(os, 'setpgrp'): os.setpgrp()
+
+    # Worker runs only this job, so CPU time and peak memory of process belong to it
+    X     = kwargs.get('X')
+    stage = tracing.Stage(name, rows=getattr(X, 'shape', [None])[0], profile_dir=profile_dir)
+    try:
+        with stage: result = func(progress=progress, **kwargs)
+        conn.send(('trace', stage.record))
+        conn.send(('result', result))
+    except Exception as e:
+        if stage.record is not None: conn.send(('trace', stage.record))
+        conn.send(('error', str(e)))
+    finally:
+        conn.close()
+
+
+def _terminate(process):
+    """Terminates worker process together with any processes it started"""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            return
+        except OSError:
+            pass # Worker has not become leader of its process group yet
+    process.terminate()
+
+
+class Job(object):
+    """Task run by job scheduler
+
+    Parameters
+    ----------
+    job_id : int
+        Unique ID of job
+
+    name : str
+        Name shown to user
+
+    func : function
+        Function run in worker process
+
+    kwargs : dict
+        Keyword arguments of func
+
+    info : dict
+        Extra information used when handling result
+    """
+    def __init__(self, job_id, name, func, kwargs, info=None):
+        self.id        = job_id
+        self.name      = name
+        self.func      = func
+        self.kwargs    = kwargs
+        self.info      = info or {}
+        self.status    = 'Queued' # Queued, Running, Finished, Failed, or Cancelled
+        self.message   = ''
+        self.data      = None # Data sent with latest progress message
+        self.trace     = None # Timing record sent by worker, see tracing.Stage
+        self.result    = None
+        self.error     = None
+        self.submitted = time.time()
+        self.started   = None
+        self.finished  = None
+        self.process   = None
+        self.conn      = None
+
+
+    def elapsed(self):
+        """Returns seconds job has been running, or ran for, or None if not started yet"""
+        if self.started is None: return None
+        return (self.finished or time.time()) - self.started
+
+
+class JobScheduler(QtCore.QObject):
+    """Queue of jobs each run in its own worker process, with a limit on jobs running at once
+
+    Worker processes report back through pipes that are polled on a timer in the GUI thread,
+    so signals are emitted in the GUI thread. Cancelling a running job terminates its worker
+    process, which stops any computation however long it would have taken.
+
+    Parameters
+    ----------
+    max_jobs : int
+        Maximum number of jobs running at once
+    """
+    # Define signals
+    progress_signal = QtCore.Signal(list)
+    finished_signal = QtCore.Signal(list)
+
+    def __init__(self, max_jobs=MAX_CONCURRENT_JOBS, parent=None):
+        QtCore.QObject.__init__(self, parent)
+        self.max_jobs    = max_jobs
+        self.queue       = deque()
+        self.running     = OrderedDict()
+        self.history     = deque(maxlen=JOB_HISTORY_SIZE)
+        self.profile_dir = None # Directory jobs write cProfile dumps to, None to not profile
+        self._next_id    = 1
+        self.timer       = QtCore.QTimer(self)
+        self.timer.setInterval(JOB_POLL_MS)
+        self.timer.timeout.connect(self._poll)
+
+
+    def submit(self, name, func, kwargs, info=None):
+        """Adds job to queue and starts it if fewer than max_jobs are running
+
+        Parameters
+        ----------
+        name : str
+            Name shown to user
+
+        func : function
+            Module level function run in worker process, see _run_job
+
+        kwargs : dict
+            Keyword arguments of func
+
+        info : dict
+            Extra information used when handling result
+
+        Returns
+        -------
+        job : Job
+            Submitted job
+        """
+        job            = Job(self._next_id, name, func, kwargs, info)
+        self._next_id += 1
+        self.queue.append(job)
+        self.progress_signal.emit([job])
+        self._start_jobs()
+        if not self.timer.isActive(): self.timer.start()
+        return job
+
+
+    def cancel(self, job_id):
+        """Cancels queued or running job, terminating its worker process if running
+
+        Parameters
+        ----------
+        job_id : int
+            ID of job
+
+        Returns
+        -------
+        None
+        """
+        for job in list(self.queue):
+            if job.id == job_id:
+                self.queue.remove(job)
+                self._finish(job, 'Cancelled')
+                return
+
+        if job_id in self.running:
+            job = self.running[job_id]
+            _terminate(job.process)
+            job.process.join()
+            self._finish(job, 'Cancelled')
+            self._start_jobs()
+
+
+    def cancel_all(self):
+        """Cancels all queued and running jobs"""
+        for job in list(self.queue) + list(self.running.values()): self.cancel(job.id)
+
+
+    def jobs(self):
+        """Returns finished, running, and queued jobs ordered by ID"""
+        return sorted(list(self.history) + list(self.running.values()) + list(self.queue),
+                      key=lambda job: job.id)
+
+
+    def n_active(self):
+        """Returns number of queued and running jobs"""
+        return len(self.queue) + len(self.running)
+
+
+    def _start_jobs(self):
+        """Starts queued jobs while fewer than max_jobs are running"""
+        while self.queue and len(self.running) < self.max_jobs:
+            job                 = self.queue.popleft()
+            job.conn, send_conn = multiprocessing.Pipe(duplex=False)
+            job.process         = multiprocessing.Process(target=_run_job,
+                                                          args=(send_conn, job.func, job.kwargs,
+                                                                job.name, self.profile_dir))
+            job.process.start()
+            send_conn.close()
+
+            job.status           = 'Running'
+            job.started          = time.time()
+            self.running[job.id] = job
+            self.progress_signal.emit([job])
+
+
+    def _poll(self):
+        """Reads messages from worker processes and finishes jobs that are done"""
+        for job in list(self.running.values()):
+            # Check whether worker is alive before reading, so messages sent right before
+            # worker exits are still read
+            alive = job.process.is_alive()
+            try:
+                while job.id in self.running and job.conn.poll():
+                    kind, payload = job.conn.recv()
+                    if kind == 'progress':
+                        job.message, job.data = payload
+                        self.progress_signal.emit([job])
+                    elif kind == 'trace':
+                        job.trace = payload
+                    elif kind == 'result':
+                        self._finish(job, 'Finished', result=payload)
+                    else:
+                        self._finish(job, 'Failed', error=payload)
+            except (EOFError, IOError):
+                pass
+
+            if job.id in self.running and not alive:
+                self._finish(job, 'Failed',
+                             error='Worker process exited with code %s' % job.process.exitcode)
+
+        self._start_jobs()
+        if not self.running and not self.queue: self.timer.stop()
+
+
+    def _finish(self, job, status, result=None, error=None):
+        """Records outcome of job, moves it to history, and emits finished signal"""
+        job.status, job.result, job.error = status, result, error
+        job.finished                      = time.time()
+        job.message                       = error or status
+        if job.conn is not None: job.conn.close()
+        if job.process is not None: job.process.join()
+        self.running.pop(job.id, None)
+
+        # Release data and result once handled so history stays small
+        job.kwargs = None
+        self.history.append(job)
+        self.finished_signal.emit([job])
+        job.result, job.data = None, None
@@ -0,0 +1,26 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Job scheduler running long tasks in worker processes for application
+""".strip()
+
+from collections import deque, OrderedDict
+import multiprocessing
+import os
+from PySide import QtCore
+import signal
+import time
+
+# Custom functions
+import tracing
+
+
+###############
+"""CONSTANTS"""
+###############
+
+MAX_CONCURRENT_JOBS = max(1, multiprocessing.cpu_count()//2)
+JOB_POLL_MS         = 100 # How often worker pipes are checked for messages
+JOB_HISTORY_SIZE    = 100 # Number of finished jobs kept in history
+JOB_COLUMNS         = ['Job', 'Name', 'X-Axis', 'Y-Axis', 'Status', 'Progress', 'Duration (s)']
@@ -15,6 +15,9 @@ class EDAViewer(QMainWindow):
         self.setup_data_ui()        
         self.setup_univariate_ui()
         self.setup_bivariate_ui()
+        self.setup_profile_ui()
+        self.setup_jobs_ui()
+        self.setup_comparison_ui()
         self.setup_visualize_ui()
 
     # ~~~~~~~~~~~~~~~~~ END OF __INIT__ ~~~~~~~~~~~~~~~~~ #
@@ -26,7 +29,7 @@ class EDAViewer(QMainWindow):
     def setup_general(self):
         """ADD DESCRIPTION"""
         # Load .ui file dynamically for now
-        utils.load_ui(utils.UI_PATH, self)
+        qt_utils.load_ui(utils.UI_PATH, self)
 
         # Set window title and icon, status bar, and force tab widget to open on data tab
         self.setWindowTitle('Exploratory Data Analysis Viewer')
@@ -34,6 +37,9 @@ class EDAViewer(QMainWindow):
         self.statusBar.showMessage("""Click "Load Data" button to begin""")
         self.tabWidget_Analysis.setCurrentIndex(0)
 
+        # Stages of work are timed by threads and jobs and recorded to a rolling log
+        self.tracer = tracing.Tracer()
+
 
     ######################
     # MENU UI: FUNCTIONS #
@@ -58,6 +64,10 @@ class EDAViewer(QMainWindow):
         self.menuItem_Plot.triggered.connect(self.save_plot)
         self.menuItem_Plot.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'image-area.png')))
 
+        # File -> Clear data cache button
+        self.menuItem_ClearCache.triggered.connect(self.clear_cache)
+        self.menuItem_ClearCache.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'eraser.png')))
+
         # File -> Save
         self.menuItem_Save.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'content-save.png')))
 
@@ -65,6 +75,38 @@ class EDAViewer(QMainWindow):
         self.menuItem_All.triggered.connect(self.save_all)
         self.menuItem_All.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'content-save-all.png')))
 
+        # Tools -> Profile all columns button
+        self.menuItem_ProfileAll.triggered.connect(self.profile_all_columns)
+        self.menuItem_ProfileAll.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'chart-timeline.png')))
+
+        # Tools -> Profile file without loading button
+        self.menuItem_StreamProfile.triggered.connect(self.profile_file)
+        self.menuItem_StreamProfile.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'chart-timeline.png')))
+
+        # Tools -> Fit all models button
+        self.menuItem_CompareModels.triggered.connect(self.fit_all_models)
+        self.menuItem_CompareModels.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'run.png')))
+
+        # Tools -> Cancel all model fits button
+        self.menuItem_CancelJobs.triggered.connect(self.cancel_all_jobs)
+        self.menuItem_CancelJobs.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'window-close.png')))
+
+        # Options -> Sweep strategy buttons, only one can be checked
+        self.sweep_strategies = QActionGroup(self)
+        for action in [self.menuItem_SweepGrid, self.menuItem_SweepRandom, self.menuItem_SweepHalving]:
+            self.sweep_strategies.addAction(action)
+
+        # Options -> Histogram bins buttons, only one can be checked. Fixed width and quantile 
+        # bins ask for their setting when checked
+        self.bin_rules = QActionGroup(self)
+        for action in [self.menuItem_BinDoane, self.menuItem_BinFreedmanDiaconis, self.menuItem_BinSturges,
+                       self.menuItem_BinFixedWidth, self.menuItem_BinQuantile]:
+            self.bin_rules.addAction(action)
+        self.bin_width     = None
+        self.quantile_bins = utils.QUANTILE_BINS
+        self.menuItem_BinFixedWidth.triggered.connect(self.set_bin_width)
+        self.menuItem_BinQuantile.triggered.connect(self.set_quantile_bins)
+
         # File -> Exit button
         self.menuItem_Exit.triggered.connect(self.exit)
         self.menuItem_Exit.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'window-close.png')))
@@ -90,10 +132,11 @@ class EDAViewer(QMainWindow):
         # Define signals
         data_signal = QtCore.Signal(list)
 
-        def __init__(self, data, filename):
+        def __init__(self, data, filename, tracer):
             QtCore.QThread.__init__(self)
             self.data     = data
             self.filename = filename
+            self.tracer   = tracer
 
         def __del__(self):
             """ADD DESCRIPTION"""
@@ -101,11 +144,13 @@ class EDAViewer(QMainWindow):
 
         def run(self):
             """ADD DESCRIPTION"""
-            try:
-                self.data.to_csv(self.filename, index=False)
-                self.data_signal.emit(['Success'])
-            except Exception as e:
-                self.data_signal.emit([str(e)])
+            with self.tracer.stage('Save Data', rows=self.data.shape[0]) as stage:
+                try:
+                    utils.write_data(self.data, self.filename)
+                    self.data_signal.emit(['Success'])
+                except Exception as e:
+                    stage.status = 'Failed: %s' % e
+                    self.data_signal.emit([str(e)])
 
 
     def slot_ThreadSaveData(self, data_signal):
@@ -120,9 +165,9 @@ class EDAViewer(QMainWindow):
         # Unpack signal and check status
         status = data_signal[0]
         if status != 'Success':
-            utils.message_box(message="Error Saving Data",
-                              informativeText="Reason:\n%s" % status,
-                              type="error")
+            qt_utils.message_box(message="Error Saving Data",
+                                 informativeText="Reason:\n%s" % status,
+                                 type="error")
 
     def save_data(self):
         """Saves data as specified extension"""
@@ -133,33 +178,37 @@ class EDAViewer(QMainWindow):
                 file_info = QFileDialog.getSaveFileName(self, "Save Data", "/",
                                                         "*.csv;;"
                                                         "*.tsv;;"
-                                                        "*.txt",
+                                                        "*.txt;;"
+                                                        "*.parquet;;"
+                                                        "*.feather",
                                                         options=options)
                 if file_info[0]: 
                     filename = ''.join(''.join(file_info).split('*'))
+                    self.load_all_columns()
                     self.save_data_thread = self.ThreadSaveData(data=self.data,
-                                                                filename=filename)
+                                                                filename=filename,
+                                                                tracer=self.tracer)
                     self.save_data_thread.data_signal.connect(self.slot_ThreadSaveData)
                     self.save_data_thread.start()
             
             except Exception as e:
-                utils.message_box(message="Error Saving Data",
-                                  informativeText="Reason:\n%s" % str(e),
-                                  type="error")         
+                qt_utils.message_box(message="Error Saving Data",
+                                     informativeText="Reason:\n%s" % str(e),
+                                     type="error")         
 
         else:
-            utils.message_box(message="Error Saving Data",
-                              informativeText="Reason:\nNo data loaded",
-                              type="error")
+            qt_utils.message_box(message="Error Saving Data",
+                                 informativeText="Reason:\nNo data loaded",
+                                 type="error")
             return
 
 
     def reset(self):
         """Resets data to original names and data types"""
         if not self.data_loaded:
-            utils.message_box(message="Error With Data Reset",
-                              informativeText="Reason:\nNo data loaded",
-                              type="error") 
+            qt_utils.message_box(message="Error With Data Reset",
+                                 informativeText="Reason:\nNo data loaded",
+                                 type="error") 
         else: 
             reply = QMessageBox.question(self, 
                                          'Message', 
@@ -170,6 +219,46 @@ class EDAViewer(QMainWindow):
             if reply == QMessageBox.Yes: self.load_data()
 
 
+    def clear_cache(self):
+        """Removes all data sets from the on-disk data cache and all model fits from the model cache"""
+        reply = QMessageBox.question(self, 
+                                     'Message', 
+                                     "Are you sure you want to clear the data and model caches?", 
+                                     QMessageBox.Yes | QMessageBox.No, 
+                                     QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            try:
+                n_bytes = self.dataset_cache.clear() + self.model_cache.clear()
+                self.statusBar.showMessage("Cleared %.1f MB from data and model caches" % (n_bytes/1e6))
+            except Exception as e:
+                qt_utils.message_box(message="Error Clearing Caches",
+                                     informativeText="Reason:\n%s" % str(e),
+                                     type="error")
+
+
+    def set_bin_width(self):
+        """Asks for width of fixed width bins, going back to Doane's rule if none was ever given"""
+        width, ok = QInputDialog.getDouble(self, "Fixed Width Bins", "Width of histogram bins:",
+                                           self.bin_width or 1.0, 1e-6, 1e12, 6)
+        if ok:
+            self.bin_width = width
+        elif self.bin_width is None:
+            self.menuItem_BinDoane.setChecked(True)
+
+
+    def set_quantile_bins(self):
+        """Asks for number of quantile bins"""
+        n_bins, ok = QInputDialog.getInt(self, "Quantile Bins", "Number of histogram bins:",
+                                         self.quantile_bins, 1, utils.MAX_BINS)
+        if ok: self.quantile_bins = n_bins
+
+
+    def bin_settings(self):
+        """Returns keyword arguments of utils.value_counts_grouped for checked histogram bins"""
+        return {'rule': self.bin_rules.checkedAction().text(), 'bin_width': self.bin_width,
+                'n_bins': self.quantile_bins}
+
+
     def exit(self):
         """Exits application"""
         reply = QMessageBox.question(self, 
@@ -185,8 +274,8 @@ class EDAViewer(QMainWindow):
         """Saves x and/or y variable statistics and frequency tables"""
         # TODO: threading
 
-        # Check to make sure stats are first generated
-        if self.stats_generated['status']:
+        # Check to make sure stats or profile are first generated
+        if self.stats_generated['status'] or self.profile_results:
             save_directory = QFileDialog.getExistingDirectory(self, 
                                                              "Select directory to save statistics", 
                                                              "/")
@@ -198,29 +287,33 @@ class EDAViewer(QMainWindow):
                     
                     # Add x variable
                     if xlabel != 'None':
-                        data[xlabel + '_stats'] = self.tab2_tableWidget_Xstats
-                        data[xlabel + '_freq']  = self.tab2_tableWidget_Xfreq
+                        data[xlabel + '_stats'] = self.xstats_model
+                        data[xlabel + '_freq']  = self.xfreq_model
                     
                     # Add y variable
                     if ylabel != 'None':
-                        data[ylabel + '_stats'] = self.tab2_tableWidget_Ystats
-                        data[ylabel + '_freq']  = self.tab2_tableWidget_Yfreq
+                        data[ylabel + '_stats'] = self.ystats_model
+                        data[ylabel + '_freq']  = self.yfreq_model
                     
-                    # Convert table widgets to pandas dataframes and write to disk
-                    dfs = utils.tablewidgets_to_dataframes(data)
+                    # Convert table models to pandas dataframes and write to disk
+                    dfs = utils.tablemodels_to_dataframes(data)
                     for basename, df in dfs.iteritems():
                         fullname = os.path.join(save_directory, basename + '.csv')
                         df.to_csv(fullname)
 
+                    # Add full profile, one summary table and one frequency table per variable
+                    if self.profile_results:
+                        utils.write_profile(self.profile_results, save_directory)
+
                 except Exception as e:
-                    utils.message_box(message="Error Saving Statistics",
-                                      informativeText="Reason:\n%s" % str(e),
-                                      type="error") 
+                    qt_utils.message_box(message="Error Saving Statistics",
+                                         informativeText="Reason:\n%s" % str(e),
+                                         type="error") 
 
         else:
-            utils.message_box(message="Error Saving Statistics",
-                              informativeText="Reason:\nNo statistics calculated",
-                              type="error")
+            qt_utils.message_box(message="Error Saving Statistics",
+                                 informativeText="Reason:\nNo statistics calculated",
+                                 type="error")
             return       
 
 
@@ -235,14 +328,14 @@ class EDAViewer(QMainWindow):
                 if file_info[0]: self.MplCanvas.fig.savefig(file_info[0] + '.png', dpi=150)
 
             except Exception as e:
-                utils.message_box(message="Error Saving Plot",
-                                  informativeText="Reason:\n%s" % str(e),
-                                  type="error")         
+                qt_utils.message_box(message="Error Saving Plot",
+                                     informativeText="Reason:\n%s" % str(e),
+                                     type="error")         
 
         else:
-            utils.message_box(message="Error Saving Plot",
-                              informativeText="Reason:\nNo plot generated",
-                              type="error")
+            qt_utils.message_box(message="Error Saving Plot",
+                                 informativeText="Reason:\nNo plot generated",
+                                 type="error")
             return     
 
 
@@ -255,20 +348,20 @@ class EDAViewer(QMainWindow):
                 self.save_plot()
 
             except Exception as e:
-                utils.message_box(message="Error Saving All",
-                                  informativeText="Reason:\n%s" % str(e),
-                                  type="error")
+                qt_utils.message_box(message="Error Saving All",
+                                     informativeText="Reason:\n%s" % str(e),
+                                     type="error")
         else:
-            utils.message_box(message="Error Saving All",
-                              informativeText="Reason:\nNo data loaded",
-                              type="error")       
+            qt_utils.message_box(message="Error Saving All",
+                                 informativeText="Reason:\nNo data loaded",
+                                 type="error")       
 
 
     def show_documentation(self):
         """Shows documentation for application"""
-        utils.message_box(message="Documentation Not Currently Available",
-                          informativeText="",
-                          type="warning")         
+        qt_utils.message_box(message="Documentation Not Currently Available",
+                             informativeText="",
+                             type="warning")         
         return 
 
 
@@ -279,13 +372,14 @@ class EDAViewer(QMainWindow):
 
     def setup_visualize_ui(self):
         """ADD DESCRIPTION"""
-        # Add matplotlib widget
+        # Matplotlib widget is created when first plot is drawn, see plot_canvas
         self.plot_generated = {'status': False, 'xlabel': 'None', 'ylabel': 'None'}
         self.vbox           = QVBoxLayout()
-        self.MplCanvas      = DynamicMplCanvas()
-        self.navi_toolbar   = NavigationToolbar(self.MplCanvas, self)
-        self.vbox.addWidget(self.MplCanvas)
-        self.vbox.addWidget(self.navi_toolbar)
+        self.MplCanvas      = None
+        self.navi_toolbar   = None
+        self.plot_label     = QLabel("Select variables and click Generate to draw a plot")
+        self.plot_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.vbox.addWidget(self.plot_label)
         self.vbox.setAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
         self.widget_Plot.setLayout(self.vbox)
 
@@ -300,6 +394,21 @@ class EDAViewer(QMainWindow):
         self.checkBox_StandardizeY.setEnabled(False)
 
 
+    def plot_canvas(self):
+        """Returns matplotlib canvas, importing matplotlib and creating canvas on first call so
+        it does not slow down startup"""
+        if self.MplCanvas is None:
+            from visual import DynamicMplCanvas, NavigationToolbar
+
+            self.vbox.removeWidget(self.plot_label)
+            self.plot_label.deleteLater()
+            self.MplCanvas    = DynamicMplCanvas()
+            self.navi_toolbar = NavigationToolbar(self.MplCanvas, self)
+            self.vbox.addWidget(self.MplCanvas)
+            self.vbox.addWidget(self.navi_toolbar)
+        return self.MplCanvas
+
+
     def update_combobox_xyaxis(self):
         """ADD DESCRIPTION"""
         # Clear items first
@@ -318,21 +427,27 @@ class EDAViewer(QMainWindow):
         xlabel = self.comboBox_XAxis.currentText()
         ylabel = self.comboBox_YAxis.currentText()
 
-        if xlabel == 'None':
-            self.checkBox_StandardizeX.setEnabled(False)
-        else:
-            if not utils.is_numeric(self.data[xlabel]):
+        try:
+            if xlabel == 'None':
                 self.checkBox_StandardizeX.setEnabled(False)
             else:
-                self.checkBox_StandardizeX.setEnabled(True)
+                if not utils.is_numeric(self.get_column(xlabel)):
+                    self.checkBox_StandardizeX.setEnabled(False)
+                else:
+                    self.checkBox_StandardizeX.setEnabled(True)
 
-        if ylabel == 'None': 
-            self.checkBox_StandardizeY.setEnabled(False)
-        else:
-            if not utils.is_numeric(self.data[ylabel]):
+            if ylabel == 'None': 
                 self.checkBox_StandardizeY.setEnabled(False)
             else:
-                self.checkBox_StandardizeY.setEnabled(True)
+                if not utils.is_numeric(self.get_column(ylabel)):
+                    self.checkBox_StandardizeY.setEnabled(False)
+                else:
+                    self.checkBox_StandardizeY.setEnabled(True)
+
+        except Exception as e:
+            qt_utils.message_box(message="Error Reading Variables",
+                                 informativeText="Reason:\n%s" % str(e),
+                                 type="error")
 
 
     class ThreadUpdatePlot(QtCore.QThread):
@@ -347,10 +462,11 @@ class EDAViewer(QMainWindow):
         # Define signals
         data_signal = QtCore.Signal(list)
 
-        def __init__(self, pushButton, func, kwargs):
+        def __init__(self, pushButton, func, kwargs, tracer):
             QtCore.QThread.__init__(self)
             self.func   = func
             self.kwargs = kwargs
+            self.tracer = tracer
 
             # Change status of push button
             pushButton.setText('Running') 
@@ -364,8 +480,13 @@ class EDAViewer(QMainWindow):
 
         def run(self):
             """ADD DESCRIPTION"""
-            status = self.func(**self.kwargs)
-            self.data_signal.emit([status])
+            x, y = self.kwargs['x'], self.kwargs['y']
+            rows = len(x) if x is not None else len(y) if y is not None else None
+            with self.tracer.stage('Update Plot', rows=rows) as stage:
+                kwargs = {key: buffers.resolve(value) for key, value in self.kwargs.iteritems()}
+                status = self.func(**kwargs)
+                if status != 'Success': stage.status = 'Failed: %s' % status
+                self.data_signal.emit([status])
 
 
     def slot_ThreadUpdatePlot(self, data_signal):
@@ -380,9 +501,9 @@ class EDAViewer(QMainWindow):
         # Unpack signal and check status
         status = data_signal[0]
         if status != 'Success':
-            utils.message_box(message="Error Generating Plot",
-                              informativeText="Reason:\n%s" % status,
-                              type="error")
+            qt_utils.message_box(message="Error Generating Plot",
+                                 informativeText="Reason:\n%s" % status,
+                                 type="error")
 
 
     def update_plot(self, pushButton, func, kwargs):
@@ -395,7 +516,8 @@ class EDAViewer(QMainWindow):
         -------
         """
         self.update_plot_thread = \
-                self.ThreadUpdatePlot(pushButton=pushButton, func=func, kwargs=kwargs)
+                self.ThreadUpdatePlot(pushButton=pushButton, func=func, kwargs=kwargs,
+                                      tracer=self.tracer)
         self.update_plot_thread.data_signal.connect(self.slot_ThreadUpdatePlot)        
         self.update_plot_thread.start()
 
@@ -411,9 +533,9 @@ class EDAViewer(QMainWindow):
 
             # No labels specified
             if xlabel == 'None' and ylabel == 'None':
-                utils.message_box(message="No Variables Selected for Analysis",
-                                  informativeText="Select X and/or Y variable and try again",
-                                  type="error")
+                qt_utils.message_box(message="No Variables Selected for Analysis",
+                                     informativeText="Select X and/or Y variable and try again",
+                                     type="error")
                 return
 
             # Check for valid data based on plot type
@@ -421,26 +543,33 @@ class EDAViewer(QMainWindow):
                 
                 # Need X variable
                 if xlabel == 'None':
-                    utils.message_box(message="Error Generating %s Plot" % plot_type,
-                                      informativeText="Reason:\nNo X variable selected",
-                                      type="error")
+                    qt_utils.message_box(message="Error Generating %s Plot" % plot_type,
+                                         informativeText="Reason:\nNo X variable selected",
+                                         type="error")
                     return
                 
                 # Also need Y variable
                 if ylabel == 'None':
-                    utils.message_box(message="Error Generating %s Plot" % plot_type,
-                                      informativeText="Reason:\nNo Y variable selected",
-                                      type="error")
+                    qt_utils.message_box(message="Error Generating %s Plot" % plot_type,
+                                         informativeText="Reason:\nNo Y variable selected",
+                                         type="error")
                     return
 
             # Select x and y variables and standardize if specified
-            x = self.data[xlabel] if xlabel != 'None' else None
-            if self.checkBox_StandardizeX.isEnabled() and self.checkBox_StandardizeX.isChecked():
-                x = (x - x.mean())/x.std()
+            try:
+                x = self.get_column(xlabel) if xlabel != 'None' else None
+                y = self.get_column(ylabel) if ylabel != 'None' else None
+            except Exception as e:
+                qt_utils.message_box(message="Error Reading Variables",
+                                     informativeText="Reason:\n%s" % str(e),
+                                     type="error")
+                return
 
-            y = self.data[ylabel] if ylabel != 'None' else None
-            if self.checkBox_StandardizeY.isEnabled() and self.checkBox_StandardizeY.isChecked():
-                y = (y - y.mean())/y.std()
+            # Variables are standardized in the worker threads that use them, once for both
+            standardize_x = self.checkBox_StandardizeX.isEnabled() and self.checkBox_StandardizeX.isChecked()
+            standardize_y = self.checkBox_StandardizeY.isEnabled() and self.checkBox_StandardizeY.isChecked()
+            if x is not None: x = buffers.ColumnBuffer(x, standardize=standardize_x)
+            if y is not None: y = buffers.ColumnBuffer(y, standardize=standardize_y)
 
             # Update plot (in separate thread)
             kwargs = {
@@ -452,25 +581,25 @@ class EDAViewer(QMainWindow):
                 'plot_generated': self.plot_generated, # Thread will set this flag to True when done
                 'checkbox': self.tab3_checkBox_AddPredictions
                 }
-            self.update_plot(pushButton=self.pushButton_Generate, func=self.MplCanvas.update_plot, 
+            self.update_plot(pushButton=self.pushButton_Generate, func=self.plot_canvas().update_plot, 
                              kwargs=kwargs)
 
             # Calculate descriptive statistics (in separate thread)
             self.univariate_descriptives(x=x,
                                          y=y,
                                          xlabel=xlabel,
-                                         ylabel=ylabel)
+                                         ylabel=ylabel,
+                                         standardized=(standardize_x, standardize_y))
 
             # Reset models fitted info
-            self.tab3_plainTextEdit_ModelSummary.clear()
-            self._n_models_fitted = 0
+            self.clear_model_summary()
 
 
         # Data not loaded yet
         else:
-            utils.message_box(message="Error Generating Results",
-                              informativeText="Reason:\nNo data loaded",
-                              type="error")         
+            qt_utils.message_box(message="Error Generating Results",
+                                 informativeText="Reason:\nNo data loaded",
+                                 type="error")         
             return
 
 
@@ -481,133 +610,243 @@ class EDAViewer(QMainWindow):
     def setup_data_ui(self):
         """ADD DESCRIPTION"""
         # Connect load data button
-        self.data_loaded = False
-        self.tab1_tableWidget_VariableInfo.horizontalHeader().setVisible(True)
-        self.tab1_tableWidget_VariableInfo.horizontalHeader().setResizeMode(1, QHeaderView.ResizeToContents)
+        self.data_loaded     = False
+        self.data_loading    = False
+        self.columns_pending = set() # Variables in columnar files not read from disk yet
+        self.lazy_optimize   = False # Whether variables not read yet are downcast when read
+        self.source_names    = {}    # Variable names mapped to column names in data file
+        self.dataset_cache   = DatasetCache()
         self.tab1_pushButton_LoadData.clicked.connect(self.load_data)
         self.tab1_pushButton_LoadData.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'play.png')))
 
-        # Connect variable names in table widget to item changed signal so that when
-        # user changes the label, the app automatically updates other components with 
-        # new variable name. The self.already_changed attribute is a "hack" that helps control
-        # the app from repeating error messages twice. Specifically, the item changed 
-        # function is called every time a variable name is changed -- so when a user
-        # inputs an invalid variable name, that is change 1 and the item changed function
-        # is called. Then the function changes the variable name back to its original, valid
-        # name and that is change 2 and the function is called again.
-        self.already_changed = False
-        self.tab1_tableWidget_VariableInfo.itemChanged.connect(self.update_variable_name)
+        # Variable names and data types are held in a model, so only visible rows are drawn and
+        # a combo box is only created for the data type being edited
+        self.variable_model = table_models.VariableInfoModel(self)
+        self.dtype_delegate = table_models.ComboBoxDelegate(utils.DTYPE_TO_LABEL.values(), self)
+        self.tab1_tableView_VariableInfo.setModel(self.variable_model)
+        self.tab1_tableView_VariableInfo.setItemDelegateForColumn(1, self.dtype_delegate)
+        self.tab1_tableView_VariableInfo.setEditTriggers(QAbstractItemView.DoubleClicked | 
+                                                         QAbstractItemView.SelectedClicked |
+                                                         QAbstractItemView.EditKeyPressed)
+        self.tab1_tableView_VariableInfo.horizontalHeader().setVisible(True)
+        self.tab1_tableView_VariableInfo.horizontalHeader().setResizeMode(1, QHeaderView.ResizeToContents)
 
+        # When user changes a variable name or data type, the app updates other components
+        # and the model is only updated if the change is valid
+        self.variable_model.name_edited.connect(self.update_variable_name)
+        self.variable_model.dtype_edited.connect(self.update_variable_dtype)
 
-    def update_variable_name(self):
-        """ADD DESCRIPTION"""
-        if self.data_loaded:
 
-            # Find current row that was edited
-            row                  = self.sender().currentRow()
-            new_var_name         = \
-                self.tab1_tableWidget_VariableInfo.item(row, 0).text()
-            
-            # If variable name not empty
-            if new_var_name:
-
-                # New variable name specified, so update names
-                if new_var_name not in self.var_names:
-                    # Update var_names list and update XY combo boxes
-                    self.statusBar.showMessage("Changed variable %s to name %s" % (self.var_names[row], new_var_name))
-                    self.var_names[row] = new_var_name
-                    self.data.columns   = self.var_names
-                    self.update_combobox_xyaxis()
-                    self.already_changed = False
+    def update_variable_name(self, row, new_var_name):
+        """Renames variable after user edits its name in variable table
 
-                else:
-                    # Duplicate variable name passed, raise error
-                    if not self.already_changed:
-                        # Reset text back to original
-                        self.already_changed = True
-                        self.tab1_tableWidget_VariableInfo.item(row, 0).setText(self.var_names[row])
-                        utils.message_box(message="Error Changing Variable Name: %s" % self.var_names[row],
-                                          informativeText="Reason:\n%s name already exists" % new_var_name,
-                                          type="error")
-                    else:
-                        self.tab1_tableWidget_VariableInfo.item(row, 0).setText(self.var_names[row])
-                        self.already_changed = False
+        Parameters
+        ----------
+        row : int
+            Row of variable in table
 
+        new_var_name : str
+            Name entered by user
 
-            # Empty variable name passed
-            else:
-                if not self.already_changed:
-                    # Reset text back to original
-                    self.already_changed = True
-                    self.tab1_tableWidget_VariableInfo.item(row, 0).setText(self.var_names[row])
-                    utils.message_box(message="Error Changing Variable Name: %s" % self.var_names[row],
-                                      informativeText="Reason:\nBlank name specified",
-                                      type="error")
+        Returns
+        -------
+        None
+        """
+        if not self.data_loaded: return
 
-                else:
-                    self.tab1_tableWidget_VariableInfo.item(row, 0).setText(self.var_names[row])
-                    self.already_changed = False
+        # Empty variable name passed
+        if not new_var_name:
+            qt_utils.message_box(message="Error Changing Variable Name: %s" % self.var_names[row],
+                                 informativeText="Reason:\nBlank name specified",
+                                 type="error")
 
+        # Duplicate variable name passed
+        elif new_var_name in self.var_names:
+            qt_utils.message_box(message="Error Changing Variable Name: %s" % self.var_names[row],
+                                 informativeText="Reason:\n%s name already exists" % new_var_name,
+                                 type="error")
 
-    def update_variable_dtype(self):
-        """ADD DESCRIPTION"""
-        # Find which widget sent the signal and get row location
-        clicked_widget = self.sender().parent()
-        index          = self.tab1_tableWidget_VariableInfo.indexAt(clicked_widget.pos())
-        row            = index.row()
-        new_dtype      = \
-            self.tab1_tableWidget_VariableInfo.cellWidget(row, 1).findChild(QComboBox).currentText()
-        var_name      = self.var_names[row] 
+        # New variable name specified, so update names
+        else:
+            # Update var_names list and update XY combo boxes
+            self.statusBar.showMessage("Changed variable %s to name %s" % (self.var_names[row], new_var_name))
+            old_var_name        = self.var_names[row]
+            self.var_names[row] = new_var_name
+            self.rename_column(old_var_name, new_var_name)
+            self.variable_model.set_name(row, new_var_name)
+            self.feature_panel.rename(old_var_name, new_var_name)
+
+            # Results cached under either name no longer describe that name's data
+            self.invalidate_results(old_var_name)
+            self.invalidate_results(new_var_name)
+            self.update_combobox_xyaxis()
+
+
+    def update_variable_dtype(self, row, new_dtype):
+        """Converts variable after user selects a new data type in variable table
+
+        Parameters
+        ----------
+        row : int
+            Row of variable in table
+
+        new_dtype : str
+            Label of data type selected by user
+
+        Returns
+        -------
+        None
+        """
+        var_name = self.var_names[row] 
 
         # Try and update data type
         try:
             if new_dtype == 'datetime': 
-                new_var = pd.to_datetime(self.data[var_name])
+                new_var = pd.to_datetime(self.get_column(var_name))
             else:
-                new_var = self.data[var_name].astype(utils.LABEL_TO_DTYPE[new_dtype])
+                new_var = utils.safe_astype(self.get_column(var_name), utils.LABEL_TO_DTYPE[new_dtype])
 
             # Update current data and update lcd displays
             self.data[var_name] = new_var
-            self.dtypes         = map(str, self.data.dtypes)
+            self.dtypes[row]    = str(new_var.dtypes)
+            self.variable_model.set_dtype(row, self.dtypes[row])
+            self.invalidate_results(var_name)
             self.update_lcd_numbers()
             self.update_checkbox()
+            self.update_feature_memory()
             self.statusBar.showMessage("Converted %s to data type %s" % (var_name, new_dtype))
 
+        # Table keeps data type before attempted conversion
         except Exception as e:
-            utils.message_box(message="Error Changing Data Type Data Type %s to %s" % (var_name, new_dtype),
-                              informativeText="Reason:\n%s" % str(e),
-                              type="error")
-
-            # Set combo box back to data type before attempted conversion
-            comboBox = self.tab1_tableWidget_VariableInfo.cellWidget(row, 1).findChild(QComboBox)
-            comboBox.setCurrentIndex(comboBox.findText(utils.DTYPE_TO_LABEL[self.dtypes[row]], 
-                                                       QtCore.Qt.MatchFixedString))
-            return 
+            qt_utils.message_box(message="Error Changing Data Type Data Type %s to %s" % (var_name, new_dtype),
+                                 informativeText="Reason:\n%s" % str(e),
+                                 type="error")
 
     def update_lcd_numbers(self):
         """ADD DESCRIPTION"""
-        # Update data types
-        used_dtypes = set()
+        # Update data types, summing counts over widths of the same family (int8 to int64,
+        # float32 and float64) since each family shares one display
+        totals = OrderedDict([('int', 0), ('float', 0), ('date', 0), ('object', 0)])
         counts = pd.value_counts(self.dtypes)
-        for i, dtype in enumerate(counts.index.tolist()):
+        for dtype, count in counts.iteritems():
             if 'int' in dtype:
-                self.tab1_lcdNumber_Integer.display(counts[i])
-                if 'int' not in used_dtypes: used_dtypes.update(['int'])
+                totals['int'] += count
             elif 'float' in dtype:
-                self.tab1_lcdNumber_Float.display(counts[i])
-                if 'float' not in used_dtypes: used_dtypes.update(['float'])
+                totals['float'] += count
             elif 'date' in dtype or 'M' in dtype:
-                self.tab1_lcdNumber_DateTime.display(counts[i])
-                if 'date' not in used_dtypes: used_dtypes.update(['date'])
+                totals['date'] += count
             else:
-                self.tab1_lcdNumber_Object.display(counts[i])
-                if 'object' not in used_dtypes: used_dtypes.update(['object'])
+                totals['object'] += count
+
+        self.tab1_lcdNumber_Integer.display(totals['int'])
+        self.tab1_lcdNumber_Float.display(totals['float'])
+        self.tab1_lcdNumber_DateTime.display(totals['date'])
+        self.tab1_lcdNumber_Object.display(totals['object'])
 
-        # Set data types not used to 0
-        if 'int'    not in used_dtypes: self.tab1_lcdNumber_Integer.display(0)
-        if 'float'  not in used_dtypes: self.tab1_lcdNumber_Float.display(0)
-        if 'date'   not in used_dtypes: self.tab1_lcdNumber_DateTime.display(0)
-        if 'object' not in used_dtypes: self.tab1_lcdNumber_Object.display(0)
+
+    def get_column(self, var_name):
+        """Returns variable from data, reading it from file first if it has not been read yet
+
+        Parameters
+        ----------
+        var_name : str
+            Name of variable
+
+        Returns
+        -------
+        pandas Series
+            Variable data
+        """
+        if var_name in self.columns_pending: self.read_pending_columns([var_name])
+        return self.data[var_name]
+
+
+    def load_all_columns(self):
+        """Reads all variables that have not been read from file yet"""
+        if self.columns_pending:
+            self.statusBar.showMessage("Reading %d remaining columns..." % len(self.columns_pending))
+            self.read_pending_columns([name for name in self.var_names if name in self.columns_pending])
+
+
+    def read_pending_columns(self, var_names):
+        """Reads variables from a columnar file and inserts them into data in variable order
+
+        Parameters
+        ----------
+        var_names : list
+            Names of variables not read yet
+
+        Returns
+        -------
+        None
+        """
+        columns = utils.read_columns(self.file, [self.source_names[name] for name in var_names])
+        if self.lazy_optimize: columns, _, _ = utils.optimize_dtypes(columns)
+        for name in var_names:
+            # Insert after variables already read that come before it in the variable list
+            loc = sum(1 for other in self.var_names[:self.var_names.index(name)] 
+                      if other not in self.columns_pending)
+            self.data.insert(loc, name, columns[self.source_names[name]].values)
+            self.columns_pending.remove(name)
+            self.dtypes[self.var_names.index(name)] = str(self.data[name].dtypes)
+
+
+    def stream_dtypes(self):
+        """Returns data types of variables as they are in the application, keyed by column name
+        in data file, so chunks read from the file are converted the same way
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            Column names in data file mapped to data type names
+        """
+        return {self.source_names[name]: dtype for name, dtype in zip(self.var_names, self.dtypes)
+                if name in self.source_names}
+
+
+    def rename_column(self, old_var_name, new_var_name):
+        """Renames variable in data and keeps track of its name in source file
+
+        Parameters
+        ----------
+        old_var_name : str
+            Current name of variable
+
+        new_var_name : str
+            New name of variable
+
+        Returns
+        -------
+        None
+        """
+        if old_var_name in self.columns_pending:
+            self.columns_pending.remove(old_var_name)
+            self.columns_pending.add(new_var_name)
+        else:
+            self.data.rename(columns={old_var_name: new_var_name}, inplace=True)
+
+        if old_var_name in self.source_names:
+            self.source_names[new_var_name] = self.source_names.pop(old_var_name)
+
+
+    def invalidate_results(self, var_name):
+        """Discards cached results computed from a variable and bumps its version
+
+        Parameters
+        ----------
+        var_name : str
+            Name of variable
+
+        Returns
+        -------
+        None
+        """
+        self.column_versions[var_name] = self.column_versions.get(var_name, 0) + 1
+        self.result_cache.invalidate(var_name)
 
 
     class ThreadLoadData(QtCore.QThread):
@@ -620,42 +859,100 @@ class EDAViewer(QMainWindow):
         -------
         """ 
         # Define signals
-        data_signal = QtCore.Signal(list)
+        data_signal     = QtCore.Signal(list)
+        progress_signal = QtCore.Signal(list)
 
-        def __init__(self, file, pushButton):
+        def __init__(self, file, pushButton, tracer, optimize=False, cache=None):
             QtCore.QThread.__init__(self)
-            self.file = file
-
-            # Change button to running status
-            pushButton.setText('Running') 
+            self.file       = file
+            self.tracer     = tracer
+            self.optimize   = optimize
+            self.cache      = cache
+            self._cancelled = False
+
+            # Change button to running status (button stays enabled so loading can be cancelled)
+            pushButton.setText('Cancel Loading') 
             pushButton.setStyleSheet('background-color:green;') 
             pushButton.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'run.png')))
-            pushButton.setDisabled(True)
+            pushButton.setDisabled(False)
 
         def __del__(self):
             """ADD DESCRIPTION"""
             self.wait()
 
+        def cancel(self):
+            """Requests that loading stops after the chunk currently being parsed"""
+            self._cancelled = True
+
         def run(self):
-            """ADD DESCRIPTION"""
-            try:
-                # Get file extension and load data
-                _, file_extension = os.path.splitext(self.file)
-                if file_extension == '.csv': 
-                    data = pd.read_csv(self.file)
-                elif file_extension == '.tsv':
-                    data = pd.read_table(self.file)
-                elif file_extension == '.txt':
-                    data = pd.read_csv(self.file, delim_whitespace=True)
-                else:
-                    pass
+            """Streams file in chunks, emitting progress after each chunk"""
+            parsed = None
+            with self.tracer.stage('Load Data') as stage:
+                try:
+                    _, file_extension = os.path.splitext(self.file)
 
-                # Add sample ID variable to data and emit data signal
-                data.insert(0, 'Sample', np.arange(data.shape[0]).astype('int'))
-                self.data_signal.emit([data])
+                    # Columnar files are projected: only the schema is read now and each column is 
+                    # read the first time it is selected, which is also when it is downcast if
+                    # memory is optimized
+                    if file_extension in utils.COLUMNAR_EXTENSIONS:
+                        pending, n_rows = utils.read_schema(self.file)
+                        data            = pd.DataFrame(index=pd.RangeIndex(n_rows))
+                        memory          = None
 
-            except Exception as e:
-                self.data_signal.emit([str(e)])
+                    else:
+                        # Map previously parsed data from cache if file has not changed
+                        data    = self.cache.load(self.file) if self.cache is not None else None
+                        pending = OrderedDict()
+                        if data is not None:
+                            total_bytes = os.path.getsize(self.file)
+                            self.progress_signal.emit([data.shape[0], total_bytes, total_bytes])
+
+                        else:
+                            # Parse chunks and accumulate column-wise
+                            builder = utils.ChunkedFrameBuilder()
+                            for chunk, bytes_read, total_bytes in utils.iter_data_chunks(self.file):
+                                if self._cancelled:
+                                    stage.rows   = builder.n_rows
+                                    stage.status = 'Cancelled'
+                                    self.data_signal.emit(['Cancelled'])
+                                    return
+                                builder.append(chunk)
+                                del chunk
+                                self.progress_signal.emit([builder.n_rows, bytes_read, total_bytes])
+
+                            # Build final data frame
+                            data = builder.build()
+                            del builder
+
+                            # Shallow copy of parsed columns to cache once data is handed over, 
+                            # unaffected by later changes to data
+                            if self.cache is not None: parsed = data.copy(deep=False)
+
+                        # Downcast to compact data types if requested
+                        if self.optimize:
+                            data, bytes_before, bytes_after = utils.optimize_dtypes(data)
+                            memory = [bytes_before, bytes_after]
+                        else:
+                            memory = None
+
+                    # Add sample ID variable to data and emit data signal
+                    data.insert(0, 'Sample', np.arange(data.shape[0]).astype('int'))
+                    stage.rows = data.shape[0]
+                    self.data_signal.emit([data, memory, pending])
+
+                except Exception as e:
+                    stage.status = 'Failed: %s' % e
+                    self.data_signal.emit([str(e)])
+                    return
+
+            # Cache parsed data for next time after it has been emitted, so writing the cache does
+            # not delay the first load. A failed write should not fail the load
+            if parsed is not None:
+                with self.tracer.stage('Cache Data', rows=parsed.shape[0]) as stage:
+                    try:
+                        self.cache.store(self.file, parsed)
+                    except Exception as e:
+                        stage.status = 'Failed: %s' % e
 
 
     def slot_ThreadLoadData(self, data_signal):
@@ -668,27 +965,44 @@ class EDAViewer(QMainWindow):
         -------
         """
         # Unpack signal
-        signal = data_signal[0]
+        signal            = data_signal[0]
+        self.data_loading = False
 
         # Check instance and update GUI
         if isinstance(signal, pd.DataFrame):
-            self.tab1_tableWidget_VariableInfo.setRowCount(0)
 
-            # Get data, map dtypes to string, and add rows to table
-            self.data      = signal
-            self.dtypes    = map(str, self.data.dtypes)
-            self.var_names = self.data.columns.tolist()
-            for var_name, dtype in zip(self.var_names, self.dtypes):
-                self.add_data_row(var_name, dtype)
+            # Get data, map dtypes to string, and add rows to table. Columns not read yet
+            # (columnar files) are listed with data types from the file schema
+            pending              = data_signal[2]
+            self.data            = signal
+            self.dtypes          = map(str, self.data.dtypes) + map(str, pending.values())
+            self.var_names       = self.data.columns.tolist() + list(pending.keys())
+            self.columns_pending = set(pending.keys())
+            self.lazy_optimize   = self.load_thread.optimize and len(pending) > 0
+            self.source_names    = {name: name for name in self.var_names if name != 'Sample'}
+            self.result_cache.clear()
+            self.column_versions = {}
+            self.variable_model.set_variables(self.var_names, self.dtypes)
+            self.feature_panel.set_variables(self.var_names)
 
             # Update lcd displays and combo boxes for plotting
-            self.tab1_lcdNumber_Rows.display(self.data.shape[0])
-            self.tab1_lcdNumber_Columns.display(self.data.shape[1])
+            shape = (self.data.shape[0], len(self.var_names))
+            self.tab1_lcdNumber_Rows.display(shape[0])
+            self.tab1_lcdNumber_Columns.display(shape[1])
             self.update_lcd_numbers()
             self.update_combobox_xyaxis()
-            self.statusBar.showMessage("Data loaded with %d rows and %d columns" % \
-                                        (self.data.shape))
+            memory = data_signal[1]
+            if self.lazy_optimize:
+                self.statusBar.showMessage("Data loaded with %d rows and %d columns, memory is "
+                                           "optimized as each column is read" % shape)
+            elif memory is None:
+                self.statusBar.showMessage("Data loaded with %d rows and %d columns" % shape)
+            else:
+                self.statusBar.showMessage("Data loaded with %d rows and %d columns, memory "
+                                           "optimized from %.1f MB to %.1f MB" % \
+                                            (shape + (memory[0]/1e6, memory[1]/1e6)))
             self.data_loaded = True
+            self.update_feature_memory()
 
             # Change back button
             self.tab1_pushButton_LoadData.setText('Data Loaded') 
@@ -697,9 +1011,12 @@ class EDAViewer(QMainWindow):
             self.tab1_pushButton_LoadData.setDisabled(True)
 
         else:
-            utils.message_box(message="Error Loading Data File %s" % self.file,
-                              informativeText="Reason:\n%s" % signal,
-                              type="error")
+            if signal == 'Cancelled':
+                self.statusBar.showMessage("Data loading cancelled")
+            else:
+                qt_utils.message_box(message="Error Loading Data File %s" % self.file,
+                                     informativeText="Reason:\n%s" % signal,
+                                     type="error")
 
             # Change back button
             self.tab1_pushButton_LoadData.setText('Load Data') 
@@ -708,8 +1025,32 @@ class EDAViewer(QMainWindow):
             self.tab1_pushButton_LoadData.setDisabled(False)
 
 
+    def slot_progress_ThreadLoadData(self, progress_signal):
+        """Shows number of rows and bytes read so far in status bar
+
+        Parameters
+        ----------
+        progress_signal : list
+            Rows read, bytes read, and total bytes in file
+
+        Returns
+        -------
+        None
+        """
+        n_rows, bytes_read, total_bytes = progress_signal
+        self.statusBar.showMessage("Loading data: %d rows read (%.1f of %.1f MB, %d%%)" % \
+                                    (n_rows, bytes_read/1e6, total_bytes/1e6, 
+                                     100*bytes_read/max(total_bytes, 1)))
+
+
     def load_data(self):
         """ADD DESCRIPTION"""
+        # Data currently loading, so button click cancels the load
+        if self.data_loading:
+            self.load_thread.cancel()
+            self.statusBar.showMessage("Cancelling data load...")
+            return
+
         if not self.data_loaded:
             # File dialog options for opening single file
             options   = QFileDialog.Options()
@@ -717,15 +1058,23 @@ class EDAViewer(QMainWindow):
             file_info = QFileDialog.getOpenFileName(self, "Load Data", "/",
                                                     "*.csv files (*.csv);;"
                                                     "*.tsv files (*tsv);;"
-                                                    "*.txt files (*.txt);;",
+                                                    "*.txt files (*.txt);;"
+                                                    "*.parquet files (*.parquet);;"
+                                                    "*.feather files (*.feather);;",
                                                     options=options)
 
             # If a file is selected, try and open
             if file_info[0]:
                 self.data_loaded = False
                 self.file        = file_info[0] # Define as attribute for accessing in other functions
-                self.data_thread = self.ThreadLoadData(self.file, self.tab1_pushButton_LoadData)
+                self.data_thread = self.ThreadLoadData(self.file, self.tab1_pushButton_LoadData,
+                                                       self.tracer,
+                                                       optimize=self.menuItem_OptimizeMemory.isChecked(),
+                                                       cache=self.dataset_cache)
                 self.data_thread.data_signal.connect(self.slot_ThreadLoadData)
+                self.data_thread.progress_signal.connect(self.slot_progress_ThreadLoadData)
+                self.load_thread  = self.data_thread
+                self.data_loading = True
                 self.data_thread.start()
         
         # Try data reset here
@@ -733,85 +1082,44 @@ class EDAViewer(QMainWindow):
             try:
                 # Create new thread for resetting data
                 self.data_loaded       = False
-                self.reset_data_thread = self.ThreadLoadData(self.file, self.tab1_pushButton_LoadData)
+                self.reset_data_thread = self.ThreadLoadData(self.file, self.tab1_pushButton_LoadData,
+                                                             self.tracer,
+                                                             optimize=self.menuItem_OptimizeMemory.isChecked(),
+                                                             cache=self.dataset_cache)
                 self.reset_data_thread.data_signal.connect(self.slot_ThreadLoadData)
+                self.reset_data_thread.progress_signal.connect(self.slot_progress_ThreadLoadData)
+                self.load_thread       = self.reset_data_thread
+                self.data_loading      = True
                 self.reset_data_thread.start()
 
                 # Reset plot
-                self.MplCanvas.update_plot(x=[1, 2, 3], 
-                                           y=[1, 1, 1], 
-                                           xlabel='X', 
-                                           ylabel='Y',
-                                           plot_type='Line',
-                                           plot_generated={'status': False, 'xlabel': None, 'ylabel': None},
-                                           checkbox=QCheckBox)
+                if self.MplCanvas is not None:
+                    self.MplCanvas.update_plot(x=[1, 2, 3], 
+                                               y=[1, 1, 1], 
+                                               xlabel='X', 
+                                               ylabel='Y',
+                                               plot_type='Line',
+                                               plot_generated={'status': False, 'xlabel': None, 'ylabel': None},
+                                               checkbox=QCheckBox)
                 self.plot_generated = {'status': False, 'xlabel': 'None', 'ylabel': 'None'}
 
                 # Reset univariate results
-                self.tab2_tableWidget_Xstats.setRowCount(0)
-                self.tab2_tableWidget_Xfreq.setRowCount(0)
-                self.tab2_tableWidget_Ystats.setRowCount(0)
-                self.tab2_tableWidget_Yfreq.setRowCount(0)
+                for model in self.univariate_models: model.clear()
                 self.stats_generated = {'status': False, 'xlabel': 'None', 'ylabel': 'None'}
 
-                # Reset bivariate results
-                self.tab3_plainTextEdit_ModelSummary.clear()
-                self.tab3_plainTextEdit_ModelSummary.clear()
+                # Reset profile results
+                self.profile_model.clear()
+                self.profile_results = OrderedDict()
+
+                # Reset bivariate results, fits of the old data are no longer needed
+                self.job_scheduler.cancel_all()
+                self.clear_model_summary()
                 self.set_model_parameters()
 
             except Exception as e:
-                utils.message_box(message="Error Resetting Data",
-                                  informativeText="Reason:\n%s\n\nTIP: Try restarting application" % str(e),
-                                  type="error")
-
-
-    def add_data_row(self, var_name, dtype):
-        """Adds new row to a table widget
-
-        Parameters
-        ----------
-
-        Returns
-        -------
-        None
-        """
-        # Define cell widget and name of variable
-        cell_widget = QWidget()
-        name_item   = QTableWidgetItem(var_name)
-
-        # Make 'Sample' variable not editable
-        if var_name == 'Sample':
-            name_item.setFlags(QtCore.Qt.ItemIsEnabled)
-        else:
-            name_item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable)
-
-        # Insert row
-        name_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-        idx = self.tab1_tableWidget_VariableInfo.rowCount()
-        self.tab1_tableWidget_VariableInfo.insertRow(idx)
-        self.tab1_tableWidget_VariableInfo.setItem(idx, 0, name_item)
-
-        # Define combox box and populate
-        if var_name != 'Sample':
-            combo_box = QComboBox()
-            for value in utils.DTYPE_TO_LABEL.itervalues(): combo_box.addItem(value)
-            combo_box.setCurrentIndex(combo_box.findText(utils.DTYPE_TO_LABEL[dtype], 
-                                                         QtCore.Qt.MatchFixedString))
-            combo_box.currentIndexChanged.connect(self.update_variable_dtype)
-
-            # Define a horizontal layout, format, and add to row
-            layout = QHBoxLayout(cell_widget)
-            layout.addWidget(combo_box)
-            layout.setAlignment(QtCore.Qt.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cell_widget.setLayout(layout)
-            self.tab1_tableWidget_VariableInfo.setCellWidget(idx, 1, cell_widget)
-        
-        else:
-            fixed_item = QTableWidgetItem('integer')
-            fixed_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-            fixed_item.setFlags(QtCore.Qt.ItemIsEnabled)
-            self.tab1_tableWidget_VariableInfo.setItem(idx, 1, fixed_item)
+                qt_utils.message_box(message="Error Resetting Data",
+                                     informativeText="Reason:\n%s\n\nTIP: Try restarting application" % str(e),
+                                     type="error")
 
 
     ##################################
@@ -823,21 +1131,27 @@ class EDAViewer(QMainWindow):
         # Data structure about stats generated
         self.stats_generated = {'status': False, 'xlabel': 'None', 'ylabel': 'None'}
 
-        # Enable add headers for table widgets
-        self.tab2_tableWidget_Xstats.horizontalHeader().setVisible(True)
-        self.tab2_tableWidget_Ystats.horizontalHeader().setVisible(True)
-        self.tab2_tableWidget_Xfreq.horizontalHeader().setVisible(True)
-        self.tab2_tableWidget_Yfreq.horizontalHeader().setVisible(True)
-
-        # Setup size of each column
-        self.tab2_tableWidget_Xstats.horizontalHeader().setResizeMode(0, QHeaderView.ResizeToContents)
-        self.tab2_tableWidget_Xstats.horizontalHeader().setResizeMode(1, QHeaderView.ResizeToContents)
-        self.tab2_tableWidget_Ystats.horizontalHeader().setResizeMode(0, QHeaderView.ResizeToContents)
-        self.tab2_tableWidget_Ystats.horizontalHeader().setResizeMode(1, QHeaderView.ResizeToContents)
-        self.tab2_tableWidget_Xfreq.horizontalHeader().setResizeMode(0, QHeaderView.ResizeToContents)
-        self.tab2_tableWidget_Xfreq.horizontalHeader().setResizeMode(1, QHeaderView.ResizeToContents)
-        self.tab2_tableWidget_Yfreq.horizontalHeader().setResizeMode(0, QHeaderView.ResizeToContents)
-        self.tab2_tableWidget_Yfreq.horizontalHeader().setResizeMode(1, QHeaderView.ResizeToContents)
+        # Statistics and frequency tables are cached per variable. Keys hold a version that is 
+        # bumped whenever a variable changes, so results computed before a change are never reused
+        self.result_cache    = ResultCache()
+        self.column_versions = {}
+
+        # Define models holding statistics and frequency tables, which are filled in bulk
+        self.xstats_model      = table_models.ResultTableModel(['Statistic', 'Value'], self)
+        self.ystats_model      = table_models.ResultTableModel(['Statistic', 'Value'], self)
+        self.xfreq_model       = table_models.ResultTableModel(['Value', 'Count'], self)
+        self.yfreq_model       = table_models.ResultTableModel(['Value', 'Count'], self)
+        self.univariate_models = [self.xstats_model, self.ystats_model, 
+                                  self.xfreq_model, self.yfreq_model]
+
+        # Attach models, enable headers, and setup size of each column
+        for view, model in zip([self.tab2_tableView_Xstats, self.tab2_tableView_Ystats,
+                                self.tab2_tableView_Xfreq, self.tab2_tableView_Yfreq],
+                               self.univariate_models):
+            view.setModel(model)
+            view.horizontalHeader().setVisible(True)
+            view.horizontalHeader().setResizeMode(0, QHeaderView.ResizeToContents)
+            view.horizontalHeader().setResizeMode(1, QHeaderView.ResizeToContents)
 
         # Update labels to reflect currently selected variable
         self.tab2_label_XVariable.setText('X-Variable: %s' % self.comboBox_XAxis.currentText())
@@ -857,12 +1171,20 @@ class EDAViewer(QMainWindow):
         # Define signals
         data_signal = QtCore.Signal(list)
 
-        def __init__(self, x, y, xlabel, ylabel):
+        def __init__(self, x, y, xlabel, ylabel, tracer, file=None, stream_sources=None,
+                     stream_dtypes=None, cached=None, cache_keys=None, bins=None):
             QtCore.QThread.__init__(self)
-            self.x      = x
-            self.y      = y
-            self.xlabel = xlabel
-            self.ylabel = ylabel
+            self.x              = x
+            self.y              = y
+            self.xlabel         = xlabel
+            self.ylabel         = ylabel
+            self.tracer         = tracer
+            self.file           = file
+            self.stream_sources = stream_sources or {} # Labels mapped to columns read from file
+            self.stream_dtypes  = stream_dtypes or {}  # Columns read from file mapped to data types
+            self.cached         = cached or {}         # Labels mapped to cached results
+            self.cache_keys     = cache_keys or {}     # Labels mapped to keys for new results
+            self.bins           = bins or {}           # Keyword arguments choosing histogram bins
 
         def __del__(self):
             """ADD DESCRIPTION"""
@@ -870,37 +1192,55 @@ class EDAViewer(QMainWindow):
 
         def run(self):
             """ADD DESCRIPTION"""
-            try:
-                # X variable
-                if self.xlabel != 'None':
-                    x_stats   = utils.univariate_statistics(self.x)
-                    x_freq    = pd.value_counts(self.x)
-                    x_numeric = utils.is_numeric(self.x)
-                    if x_numeric: x_freq = utils.value_counts_grouped(self.x, x_freq)
-                else:
-                    x_stats   = None
-                    x_freq    = None
-                    x_numeric = None
-
-                # Y variable
-                if self.ylabel != 'None':
-                    y_stats   = utils.univariate_statistics(self.y)
-                    y_freq    = pd.value_counts(self.y)
-                    y_numeric = utils.is_numeric(self.y)
-                    if y_numeric: y_freq = utils.value_counts_grouped(self.y, y_freq)
-                else:
-                    y_stats   = None
-                    y_freq    = None
-                    y_numeric = None
+            rows = len(self.x) if self.x is not None else len(self.y) if self.y is not None else None
+            with self.tracer.stage('Univariate Statistics', rows=rows) as stage:
+                try:
+                    # Variables computed from a chunked read of the data file
+                    if self.stream_sources:
+                        streamed = streaming.streaming_statistics(self.file, 
+                                                                  list(set(self.stream_sources.values())),
+                                                                  bins=self.bins, 
+                                                                  dtypes=self.stream_dtypes)
+
+                    # X variable
+                    if self.xlabel in self.cached:
+                        x_stats, x_freq, x_numeric = self.cached[self.xlabel]
+                    elif self.xlabel in self.stream_sources:
+                        x_stats, x_freq, x_numeric, _ = streamed[self.stream_sources[self.xlabel]]
+                    elif self.xlabel != 'None':
+                        # Standardized here unless plot thread already did
+                        x               = buffers.resolve(self.x)
+                        x_stats, x_freq = utils.describe_variable(x, bins=self.bins)
+                        x_numeric       = utils.is_numeric(x)
+                    else:
+                        x_stats   = None
+                        x_freq    = None
+                        x_numeric = None
+
+                    # Y variable
+                    if self.ylabel in self.cached:
+                        y_stats, y_freq, y_numeric = self.cached[self.ylabel]
+                    elif self.ylabel in self.stream_sources:
+                        y_stats, y_freq, y_numeric, _ = streamed[self.stream_sources[self.ylabel]]
+                    elif self.ylabel != 'None':
+                        # Standardized here unless plot thread already did
+                        y               = buffers.resolve(self.y)
+                        y_stats, y_freq = utils.describe_variable(y, bins=self.bins)
+                        y_numeric       = utils.is_numeric(y)
+                    else:
+                        y_stats   = None
+                        y_freq    = None
+                        y_numeric = None
 
-                # Success signal
-                self.data_signal.emit(['Success', x_stats, y_stats, x_freq, 
-                                        y_freq, x_numeric, y_numeric, self.xlabel, 
-                                        self.ylabel])
+                    # Success signal
+                    self.data_signal.emit(['Success', x_stats, y_stats, x_freq, 
+                                            y_freq, x_numeric, y_numeric, self.xlabel, 
+                                            self.ylabel, self.cache_keys])
 
-            except Exception as e:
-                # Error signal
-                self.data_signal.emit([str(e)])
+                except Exception as e:
+                    # Error signal
+                    stage.status = 'Failed: %s' % e
+                    self.data_signal.emit([str(e)])
 
 
     def slot_ThreadUnivariateDescriptives(self, data_signal):
@@ -916,9 +1256,9 @@ class EDAViewer(QMainWindow):
 
         # Update GUI
         if status != 'Success':
-            utils.message_box(message="Error Generating Univariate Statistics",
-                              informativeText="Reason:\n%s" % status,
-                              type="error")
+            qt_utils.message_box(message="Error Generating Univariate Statistics",
+                                 informativeText="Reason:\n%s" % status,
+                                 type="error")
 
         else:
             # Unpack remainder of signal information
@@ -931,115 +1271,31 @@ class EDAViewer(QMainWindow):
             xlabel    = data_signal[7]
             ylabel    = data_signal[8]
 
-            # Clear tables
-            self.tab2_tableWidget_Xstats.setRowCount(0)
-            self.tab2_tableWidget_Xfreq.setRowCount(0)
-            self.tab2_tableWidget_Ystats.setRowCount(0)
-            self.tab2_tableWidget_Yfreq.setRowCount(0)
+            # Cache newly computed results
+            cache_keys = data_signal[9]
+            if xlabel in cache_keys: self.result_cache.put(cache_keys[xlabel], (x_stats, x_freq, x_numeric))
+            if ylabel in cache_keys: self.result_cache.put(cache_keys[ylabel], (y_stats, y_freq, y_numeric))
 
             # Update labels to reflect current variables selected
             self.tab2_label_XVariable.setText('X-Variable: %s' % self.comboBox_XAxis.currentText())
             self.tab2_label_YVariable.setText('Y-Variable: %s' % self.comboBox_YAxis.currentText())
-            
-            # X variable
-            if xlabel != 'None':
-                # Calculate descriptives and populate table
-                for key, value in x_stats.iteritems():
-                    try:
-                        # Insert row
-                        idx = self.tab2_tableWidget_Xstats.rowCount()
-                        self.tab2_tableWidget_Xstats.insertRow(idx)
-
-                        # Create table items and make sure not editable
-                        name_item = QTableWidgetItem(key)
-                        name_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-                        name_item.setFlags(QtCore.Qt.ItemIsEnabled)
-
-                        key_item  = QTableWidgetItem('%.3f' % value)
-                        key_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-                        key_item.setFlags(QtCore.Qt.ItemIsEnabled)
-
-                        # Insert items into table
-                        self.tab2_tableWidget_Xstats.setItem(idx, 0, name_item)
-                        self.tab2_tableWidget_Xstats.setItem(idx, 1, key_item)
-                    except:
-                        continue
-
-                # Test if x is numeric, then create grouped frequency table
-                for i in xrange(x_freq.shape[0]):
-                    try:
-                        # Insert row
-                        idx = self.tab2_tableWidget_Xfreq.rowCount()
-                        self.tab2_tableWidget_Xfreq.insertRow(idx)
-
-                        # Create table items and make sure not editable
-                        if x_numeric:
-                            name_item = QTableWidgetItem(x_freq.index[i])
-                            key_item  = QTableWidgetItem('%d' % x_freq.values[i][0])
-                        else:
-                            name_item = QTableWidgetItem('%.3f' % x_freq.index[i])
-                            key_item  = QTableWidgetItem('%d' % x_freq.values[i])
-
-                        name_item.setFlags(QtCore.Qt.ItemIsEnabled)
-                        key_item.setFlags(QtCore.Qt.ItemIsEnabled)
-                        name_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-                        key_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-
-                        # Insert items into table
-                        self.tab2_tableWidget_Xfreq.setItem(idx, 0, name_item)
-                        self.tab2_tableWidget_Xfreq.setItem(idx, 1, key_item)
-                    except:
-                        continue
-
-            # Y variable
-            if ylabel != 'None':
-                # Calculate descriptives and populate table
-                for key, value in y_stats.iteritems():
-                    try:
-                        # Insert row
-                        idx = self.tab2_tableWidget_Ystats.rowCount()
-                        self.tab2_tableWidget_Ystats.insertRow(idx)
-
-                        # Create table items and make sure not editable
-                        name_item = QTableWidgetItem(key)
-                        name_item.setFlags(QtCore.Qt.ItemIsEnabled)
-                        name_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-
-                        key_item  = QTableWidgetItem('%.3f' % value)
-                        key_item.setFlags(QtCore.Qt.ItemIsEnabled)
-                        key_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-
-                        # Insert items into table
-                        self.tab2_tableWidget_Ystats.setItem(idx, 0, name_item)
-                        self.tab2_tableWidget_Ystats.setItem(idx, 1, key_item)
-                    except:
-                        continue
-
-                # Calculate frequencies and populate table
-                for i in xrange(y_freq.shape[0]):
-                    try:
-                        # Insert row
-                        idx = self.tab2_tableWidget_Yfreq.rowCount()
-                        self.tab2_tableWidget_Yfreq.insertRow(idx)
-
-                        # Create table items and make sure not editable
-                        name_item = QTableWidgetItem(str(y_freq.index[i]))
-                        if y_numeric:
-                            key_item  = QTableWidgetItem('%d' % y_freq.values[i][0])
-                        else:
-                            key_item  = QTableWidgetItem('%d' % y_freq.values[i])
-
-                        name_item.setFlags(QtCore.Qt.ItemIsEnabled)
-                        key_item.setFlags(QtCore.Qt.ItemIsEnabled)
-                        name_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
-                        key_item.setTextAlignment(QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter)
 
-                        # Insert items into table
-                        self.tab2_tableWidget_Yfreq.setItem(idx, 0, name_item)
-                        self.tab2_tableWidget_Yfreq.setItem(idx, 1, key_item)
+            # Populate each table in one reset, tables of variables not selected are cleared
+            for label, stats, freq, stats_model, freq_model in \
+                    [(xlabel, x_stats, x_freq, self.xstats_model, self.xfreq_model),
+                     (ylabel, y_stats, y_freq, self.ystats_model, self.yfreq_model)]:
+                if label == 'None':
+                    stats_model.clear()
+                    freq_model.clear()
+                else:
+                    stats_model.set_columns([stats.keys(), stats.values()])
+                    freq_model.set_frequencies(freq)
 
-                    except:
-                        continue
+                    # High-cardinality variables only list their most frequent values
+                    if 'Count Error' in stats:
+                        self.statusBar.showMessage("%s has about %d distinct values, showing the "
+                                                   "%d most frequent" % \
+                                                   (label, stats['Unique'], sketches.TOP_N))
 
             # Update status of stats generated variables
             self.stats_generated['status'] = True
@@ -1053,7 +1309,7 @@ class EDAViewer(QMainWindow):
         self.pushButton_Generate.setDisabled(False)
 
 
-    def univariate_descriptives(self, x, y, xlabel, ylabel):
+    def univariate_descriptives(self, x, y, xlabel, ylabel, standardized=(False, False)):
         """ADD
         
         Parameters
@@ -1062,8 +1318,32 @@ class EDAViewer(QMainWindow):
         Returns
         -------
         """
+        cached, cache_keys, stream_sources = {}, {}, {}
+        bins, stream_dtypes                = self.bin_settings(), self.stream_dtypes()
+        for label, is_standardized in zip([xlabel, ylabel], standardized):
+            if label == 'None': continue
+
+            # In streaming mode, read variables straight from the data file unless they only 
+            # exist in memory (sample ID) or were standardized
+            stream = self.menuItem_StreamingStats.isChecked() and label in self.source_names and \
+                     not is_standardized
+
+            # Reuse cached results, otherwise compute and remember key to cache results under
+            key    = (label, self.column_versions.get(label, 0), is_standardized, stream, 
+                      tuple(sorted(bins.items())))
+            result = self.result_cache.get(key)
+            if result is not None:
+                cached[label] = result
+            else:
+                cache_keys[label] = key
+                if stream: stream_sources[label] = self.source_names[label]
+
         self.univariate_thread = \
-                self.ThreadUnivariateDescriptives(x=x, y=y, xlabel=xlabel, ylabel=ylabel)
+                self.ThreadUnivariateDescriptives(x=x, y=y, xlabel=xlabel, ylabel=ylabel,
+                                                  tracer=self.tracer, file=self.file, 
+                                                  stream_sources=stream_sources, 
+                                                  stream_dtypes=stream_dtypes, cached=cached, 
+                                                  cache_keys=cache_keys, bins=bins)
         self.univariate_thread.data_signal.connect(self.slot_ThreadUnivariateDescriptives)        
         self.univariate_thread.start()
 
@@ -1074,8 +1354,12 @@ class EDAViewer(QMainWindow):
 
     def setup_bivariate_ui(self):
         """ADD DESCRIPTION"""
-        # Populate combo box for model names
+        # Populate combo box for model names. Model summary is kept as one text entry per job, 
+        # so entries of running sweeps can be rewritten as their leaderboards change
         self._n_models_fitted = 0
+        self._n_cached_fits   = 0
+        self.model_summaries  = OrderedDict()
+        self.model_cache      = ModelCache()
         self.model_type       = self.tab3_comboBox_ModelType.currentText()
         self.tab3_comboBox_ModelName.addItems(utils.LINK_MODEL_API[self.model_type].keys())
 
@@ -1093,7 +1377,7 @@ class EDAViewer(QMainWindow):
         self.tab3_plainTextEdit_ModelParameters.setPlainText(text)
 
         # Connect Clear button
-        self.tab3_pushButton_Clear.clicked.connect(self.tab3_plainTextEdit_ModelSummary.clear)
+        self.tab3_pushButton_Clear.clicked.connect(self.clear_model_summary)
         self.tab3_pushButton_Clear.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'eraser.png')))
 
         # Connect combo box functions
@@ -1104,6 +1388,31 @@ class EDAViewer(QMainWindow):
         self.tab3_comboBox_ModelName.activated[str].connect(self.set_model_api_link)
         self.tab3_comboBox_ModelName.activated[str].connect(self.set_model_parameters)
 
+        # Feature panel docked on the right, shown from Tools -> Features
+        self.feature_panel = FeaturePanel(self)
+        self.feature_panel.selection_changed.connect(self.update_feature_memory)
+        self.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.feature_panel)
+        self.feature_panel.hide()
+        self.feature_panel.toggleViewAction().setText('Features')
+        self.menuTools.insertAction(self.menuItem_CompareModels, self.feature_panel.toggleViewAction())
+
+        # Model fits run as jobs in worker processes, which are stopped when app quits
+        self.job_scheduler = JobScheduler(parent=self)
+        self.job_scheduler.progress_signal.connect(self.slot_progress_job)
+        self.job_scheduler.finished_signal.connect(self.slot_finished_job)
+        QApplication.instance().aboutToQuit.connect(self.job_scheduler.cancel_all)
+
+        # Performance panel docked on the right, shown from Tools -> Performance. Jobs are
+        # profiled in their worker processes, so they are told where to write dumps
+        self.performance_panel = PerformancePanel(self.tracer, self)
+        self.performance_panel.profiling_changed.connect(
+            lambda directory: setattr(self.job_scheduler, 'profile_dir', directory))
+        self.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.performance_panel)
+        self.performance_panel.hide()
+        self.performance_panel.toggleViewAction().setText('Performance')
+        self.menuTools.insertAction(self.menuItem_CompareModels, 
+                                    self.performance_panel.toggleViewAction())
+
         # Connect fit model button
         self.tab3_pushButton_FitModel.clicked.connect(self.fit_model)
         self.tab3_pushButton_FitModel.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'play.png')))
@@ -1135,145 +1444,575 @@ class EDAViewer(QMainWindow):
         self.tab3_plainTextEdit_ModelParameters.setPlainText(text)
 
 
-    class ThreadFitModel(QtCore.QThread):
-        """ADD
-        
+    def slot_progress_job(self, progress_signal):
+        """Shows progress of a model fitting job in status bar and jobs table
+
         Parameters
         ----------
-        
+        progress_signal : list
+            Job that was queued, started, or reported progress
+
         Returns
         -------
-        """ 
-        # Define signals
-        data_signal  = QtCore.Signal(list)
+        None
+        """
+        job = progress_signal[0]
+        self.statusBar.showMessage("Job %d (%s): %s" % (job.id, job.name, job.message or job.status))
+        self.update_jobs_ui()
 
-        def __init__(self, X, y, xlabel, ylabel, model_type, model, pushButton):
-            QtCore.QThread.__init__(self)
+        # Stream leaderboard of running sweep and table of running model comparison
+        if job.info.get('sweep') and job.data:
+            self.write_model_summary(job.id, self.sweep_summary(job, job.data, job.message))
+        elif job.info.get('comparison') and job.data:
+            self.show_comparison(job, job.data)
+        elif job.info.get('streaming') and job.data:
+            self.write_model_summary(job.id, self.streaming_summary(job, job.data, job.message))
 
-            # Define attributes
-            self.X          = X
-            self.y          = y
-            self.xlabel     = xlabel
-            self.ylabel     = ylabel
-            self.model_type = model_type
-            self.model      = model
 
-            # Change button to running status
-            pushButton.setText('Running') 
-            pushButton.setStyleSheet('background-color:green;') 
-            pushButton.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'run.png')))
-            pushButton.setDisabled(True)
+    def slot_finished_job(self, finished_signal):
+        """Writes results of a finished model fitting job to model summary
 
-        def __del__(self):
-            """ADD DESCRIPTION"""
-            self.wait()
+        Parameters
+        ----------
+        finished_signal : list
+            Job that finished, failed, or was cancelled
 
-        def run(self):
-            """ADD DESCRIPTION"""
-            try:
-                # Clustering model
-                if self.model_type == 'Clustering':
-                    X_             = np.column_stack([self.X, self.y.reshape(-1, 1)])
-                    y_pred, scores = utils.unsupervised_ml(X=X_, model=self.model)
+        Returns
+        -------
+        None
+        """
+        job = finished_signal[0]
+        self.update_jobs_ui()
+        if job.trace is not None: self.tracer.add(job.trace)
+        self.statusBar.showMessage("Job %d (%s): %s" % (job.id, job.name, job.status))
 
-                # Regression or classification model
-                else:
-                    y_pred, scores = \
-                    utils.supervised_ml(X=self.X, y=self.y, model=self.model, 
-                        model_type=self.model_type)
+        if job.status == 'Failed':
+            qt_utils.message_box(message="Error Fitting Model",
+                                 informativeText="Reason:\n%s" % job.error,
+                                 type="error") 
+        elif job.status == 'Finished' and job.info.get('sweep'):
+            leaderboard = job.result
+            self.write_model_summary(job.id, self.sweep_summary(job, leaderboard, 'Complete'))
 
-                # Emit all signals
-                self.data_signal.emit(['Success', y_pred, scores, self.xlabel, self.ylabel])
+        elif job.status == 'Finished' and job.info.get('comparison'):
+            self.show_comparison(job, job.result)
 
-            except Exception as e:
-                self.data_signal.emit([str(e)])
+        elif job.status == 'Finished' and job.info.get('streaming'):
+            self.write_model_summary(job.id, self.streaming_summary(job, job.result, 'Complete'))
 
+        elif job.status == 'Finished':
+            self.model_cache.put(job.info['cache_key'], job.result)
+            self.show_model_result(job.id, job.info, job.result)
+
+
+    def show_model_result(self, key, info, result, cached=False):
+        """Writes results of a model fit to model summary and adds predictions to plot
 
-    def slot_ThreadFitModel(self, data_signal):
-        """ADD
-        
         Parameters
         ----------
-        
+        key : int or tuple
+            Key of model summary entry
+
+        info : dict
+            Variables, model type, and model name of fit
+
+        result : tuple
+            Predictions and scores
+
+        cached : bool
+            Whether result was read from model cache
+
         Returns
         -------
+        None
         """
-        status = data_signal[0]
-        if status != 'Success':
-            utils.message_box(message="Error Fitting Model",
-                              informativeText="Reason:\n%s" % status,
-                              type="error") 
-        else:
-            # Unpack results and update widget
-            self._n_models_fitted += 1
-            y_pred = data_signal[1]
-            scores = data_signal[2] 
-            xlabel = data_signal[3]
-            ylabel = data_signal[4]
-
-            # Clear widget and write overall model information
-            self.tab3_plainTextEdit_ModelSummary.insertPlainText("Model ID: %d\nModel Type: %s\nModel Name: %s\n\n" % \
-                    ((self._n_models_fitted), self.model_type, self.model_name))
-
-            self.tab3_plainTextEdit_ModelSummary.insertPlainText("X-Axis: %s\nY-Axis: %s\n\n"  % \
-                    (xlabel, ylabel))
+        # Unpack results and update widget
+        self._n_models_fitted += 1
+        y_pred, scores = result
+        xlabel         = info['xlabel']
+        ylabel         = info['ylabel']
+        model_type     = info['model_type']
+        model_name     = info['model_name']
+
+        # Write overall model information
+        text  = "Model ID: %d%s\nModel Type: %s\nModel Name: %s\n\n" % \
+                ((self._n_models_fitted), ' (cached)' if cached else '', model_type, model_name)
+        text += "X-Axis: %s\nY-Axis: %s\n%s\n" % (xlabel, ylabel, self.features_summary(info))
+
+        # Write specific model information to widget
+        if model_type in ['Classification', 'Regression']: 
+            if model_type == 'Classification': 
+                metric_str = 'Accuracy'
+            else:
+                metric_str = 'Mean Squared Error'
 
-            # Write specific model information to widget
-            if self.model_type in ['Classification', 'Regression']: 
-                if self.model_type == 'Classification': 
-                    metric_str = 'Accuracy'
-                else:
-                    metric_str = 'Mean Squared Error'
+            # CV results
+            for fold, score in enumerate(scores):
+                text += "Fold %d: %s = %.3f\n" % ((fold+1), metric_str, score)
 
-                # CV results
-                for fold, score in enumerate(scores):
-                    self.tab3_plainTextEdit_ModelSummary.insertPlainText("Fold %d: %s = %.3f\n" % \
-                        ((fold+1), metric_str, score))
+            text += "Overall %s: %.3f +/- %.3f\n" % (metric_str, scores.mean(), scores.std())
 
-                self.tab3_plainTextEdit_ModelSummary.insertPlainText("Overall %s: %.3f +/- %.3f\n" % \
-                        (metric_str, scores.mean(), scores.std()))
-                self.tab3_plainTextEdit_ModelSummary.insertPlainText('--------\n\n')
+        else:
+            metric_str = ['Silhouette Score', 'Calinski Harabaz Score']
 
-            else:
-                metric_str = ['Silhouette Score', 'Calinski Harabaz Score']
+            # Write specific model information to widget
+            for name, metric in zip(metric_str, scores):
+                text += "Metric: %s = %.3f\n" % (name, metric)
 
-                # Write specific model information to widget
-                for name, metric in zip(metric_str, scores):
-                    self.tab3_plainTextEdit_ModelSummary.insertPlainText("Metric: %s = %.3f\n" % \
-                        (name, metric))  
-                self.tab3_plainTextEdit_ModelSummary.insertPlainText('--------\n\n')
+        self.write_model_summary(key, text + '--------\n\n')
 
-            # If add predictions to plot
-            if self.tab3_checkBox_AddPredictions.isChecked():
-                self.add_predictions(y_pred=y_pred, xlabel=xlabel, ylabel=ylabel, 
-                                     model_type=self.model_type, model_name=self.model_name)
+        # If add predictions to plot, only when plot still shows variables model was fit on
+        if self.tab3_checkBox_AddPredictions.isChecked() and \
+                self.plot_generated['xlabel'] == xlabel and self.plot_generated['ylabel'] == ylabel:
+            self.add_predictions(y_pred=y_pred, xlabel=xlabel, ylabel=ylabel, 
+                                 model_type=model_type, model_name=model_name)
 
-        # Change back to original push button
-        self.tab3_pushButton_FitModel.setText('Fit Model') 
-        self.tab3_pushButton_FitModel.setStyleSheet('') 
-        self.tab3_pushButton_FitModel.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'play.png')))
-        self.tab3_pushButton_FitModel.setDisabled(False)
 
+    def write_model_summary(self, key, text):
+        """Adds or replaces an entry of model summary and shows latest entries
 
-    def run(self, X, y, xlabel, ylabel, model):
-        """ADD
-        
         Parameters
         ----------
-        
+        key : int
+            ID of job entry belongs to
+
+        text : str
+            Text of entry
+
         Returns
         -------
+        None
         """
-        self.fit_model_thread = \
-            self.ThreadFitModel(X=X, y=y, xlabel=xlabel, ylabel=ylabel, model_type=self.model_type, 
-                                model=model, pushButton=self.tab3_pushButton_FitModel)
-        self.fit_model_thread.data_signal.connect(self.slot_ThreadFitModel)
-        self.fit_model_thread.start()
+        self.model_summaries[key] = text
+        self.tab3_plainTextEdit_ModelSummary.setPlainText(''.join(self.model_summaries.values()))
+        self.tab3_plainTextEdit_ModelSummary.moveCursor(QTextCursor.End)
 
 
-    def fit_model(self):
-        """ADD
-        
+    def clear_model_summary(self):
+        """Removes all entries of model summary"""
+        self.model_summaries  = OrderedDict()
+        self._n_models_fitted = 0
+        self.tab3_plainTextEdit_ModelSummary.clear()
+
+
+    def sweep_summary(self, job, leaderboard, status):
+        """Formats model summary entry of a sweep
+
+        Parameters
+        ----------
+        job : Job
+            Sweep job
+
+        leaderboard : list
+            Trial summaries from best to worst
+
+        status : str
+            Progress of sweep
+
+        Returns
+        -------
+        str
+            Text of entry
+        """
+        text  = "Sweep: %s (%s)\nModel Type: %s\nModel Name: %s\n\n" % \
+                (job.info['strategy'], status, job.info['model_type'], job.info['model_name'])
+        text += "X-Axis: %s\nY-Axis: %s\n%s\n" % (job.info['xlabel'], job.info['ylabel'], 
+                                                 self.features_summary(job.info))
+        if status == 'Complete' and leaderboard:
+            text += "Best Parameters: %s\n\n" % json.dumps(leaderboard[0]['params'], sort_keys=True)
+        text += sweep.format_leaderboard(leaderboard[:sweep.LEADERBOARD_SIZE], job.info['model_type'])
+        if len(leaderboard) > sweep.LEADERBOARD_SIZE:
+            text += "... %d more trials\n" % (len(leaderboard) - sweep.LEADERBOARD_SIZE)
+        return text + '--------\n\n'
+
+
+    def run_sweep(self, X, y, xlabel, ylabel, model, space, features=None):
+        """Submits hyperparameter sweep job to job scheduler
+
+        Parameters
+        ----------
+        X : 2d array-like
+            Features
+
+        y : 1d array-like
+            Labels
+
+        xlabel : str
+            Name of x variable
+
+        ylabel : str
+            Name of y variable
+
+        model : sklearn estimator
+            Model with fixed parameters set
+
+        space : OrderedDict
+            Parameters mapped to values to search over
+
+        features : list
+            Name of each column of X
+
+        Returns
+        -------
+        None
+        """
+        strategy = self.sweep_strategies.checkedAction().text()
+        self.job_scheduler.submit(name='%s %s Sweep' % (self.model_name, self.model_type),
+                                  func=sweep.run_sweep,
+                                  kwargs={'X': X, 'y': y, 'model': model, 
+                                          'model_type': self.model_type, 'space': space,
+                                          'strategy': strategy},
+                                  info={'xlabel': xlabel, 'ylabel': ylabel, 'sweep': True,
+                                        'model_type': self.model_type, 'strategy': strategy,
+                                        'model_name': self.model_name, 'features': features})
+
+
+    def run_streaming(self, stream_kwargs, xlabel, ylabel, model):
+        """Submits job training a streaming model on chunks of the data file to job scheduler
+
+        Parameters
+        ----------
+        stream_kwargs : dict
+            Keyword arguments of utils.incremental_ml from get_stream_data
+
+        xlabel : str
+            Name of x variable
+
+        ylabel : str
+            Name of y variable
+
+        model : sklearn estimator
+            Model supporting partial_fit with parameters set
+
+        Returns
+        -------
+        None
+        """
+        kwargs = dict(stream_kwargs, model=model, model_type=self.model_type)
+        self.job_scheduler.submit(name='%s %s' % (self.model_name, self.model_type),
+                                  func=utils.incremental_ml,
+                                  kwargs=kwargs,
+                                  info={'xlabel': xlabel, 'ylabel': ylabel, 'streaming': True,
+                                        'model_type': self.model_type, 
+                                        'model_name': self.model_name,
+                                        'features': stream_kwargs['features']})
+        if self.tab3_checkBox_AddPredictions.isChecked():
+            self.statusBar.showMessage("Streaming models are scored on held out rows, predictions are not added to plot")
+
+
+    def streaming_summary(self, job, result, status):
+        """Formats model summary entry of a streaming model
+
+        Parameters
+        ----------
+        job : Job
+            Streaming model job
+
+        result : dict
+            Running metrics, or final result of utils.incremental_ml
+
+        status : str
+            Progress of training
+
+        Returns
+        -------
+        str
+            Text of entry
+        """
+        text  = "Streaming Model (%s)\nModel Type: %s\nModel Name: %s\n\n" % \
+                (status, job.info['model_type'], job.info['model_name'])
+        text += "X-Axis: %s\nY-Axis: %s\n%s\n" % (job.info['xlabel'], job.info['ylabel'], 
+                                                 self.features_summary(job.info))
+
+        # Running metric after evenly spaced chunks
+        history = result['history']
+        step    = max(1, int(np.ceil(len(history)/10.0)))
+        for n_train, value in history[step-1::step]:
+            text += "Rows Trained %d: Held Out %s = %.3f\n" % (n_train, result['metric'], value)
+
+        if 'score' in result:
+            text += "Overall Held Out %s: %.3f (%d rows trained, %d rows scored)\n" % \
+                    (result['metric'], result['score'], result['n_train'], result['n_scored'])
+        if 'metrics' in result:
+            for name, metric in zip(['Silhouette Score', 'Calinski Harabaz Score'], result['metrics']):
+                text += "Held Out Sample Metric: %s = %.3f\n" % (name, metric)
+        return text + '--------\n\n'
+
+
+    def run(self, X, y, xlabel, ylabel, model, features=None):
+        """Submits model fitting job to job scheduler, or shows results right away if the same
+        fit is in the model cache
+
+        Parameters
+        ----------
+        X : 2d array-like
+            Features
+
+        y : 1d array-like
+            Labels
+
+        xlabel : str
+            Name of x variable
+
+        ylabel : str
+            Name of y variable
+
+        model : sklearn estimator
+            Model with parameters set
+
+        features : list
+            Name of each column of X
+
+        Returns
+        -------
+        None
+        """
+        info = {'xlabel': xlabel, 'ylabel': ylabel, 'model_type': self.model_type, 
+                'model_name': self.model_name, 'features': features}
+
+        # Same model with same parameters already fit on same data
+        key    = model_fingerprint(X, y, self.model_type, self.model_name, model.get_params(),
+                                   settings=(utils.N_SPLITS, utils.CV_RANDOM_STATE))
+        result = self.model_cache.get(key)
+        if result is not None:
+            self._n_cached_fits += 1
+            self.show_model_result(('cached', self._n_cached_fits), info, result, cached=True)
+            self.statusBar.showMessage("%s %s results loaded from model cache" % (self.model_name, self.model_type))
+            return
+
+        info['cache_key'] = key
+        job = self.job_scheduler.submit(name='%s %s' % (self.model_name, self.model_type),
+                                        func=utils.run_model,
+                                        kwargs={'X': X, 'y': y, 'model': model, 
+                                                'model_type': self.model_type},
+                                        info=info)
+        if job.status == 'Queued':
+            self.statusBar.showMessage("Job %d (%s) queued until a running fit finishes" % (job.id, job.name))
+
+
+    def get_model_variables(self, xlabel, ylabel):
+        """Returns features and y variable of a model fit, showing an error if they are not 
+        specified
+
+        Parameters
+        ----------
+        xlabel : str
+            Name of x variable
+
+        ylabel : str
+            Name of y variable
+
+        Returns
+        -------
+        names : list or None
+            Features checked in feature panel, or x variable if none are checked. None if 
+            variables are not specified
+
+        ylabel : str or None
+            Name of y variable, 'None' for clustering models without one
+        """
+        checked = self.feature_panel.selected()
+        names   = checked or ([] if xlabel == 'None' else [xlabel])
+
+        # Clustering models are fit on features and y variable, unless y is already a feature
+        if self.model_type == 'Clustering' and ylabel in checked: ylabel = 'None'
+
+        if not names:
+            reason = "No X variable specified and no features checked"
+        elif ylabel == 'None' and not (self.model_type == 'Clustering' and checked):
+            reason = "Y variable not specified"
+        elif ylabel in names and self.model_type != 'Clustering':
+            reason = "Y variable %s is also a feature" % ylabel
+        else:
+            return names, ylabel
+
+        qt_utils.message_box(message="Error Fitting %s Model" % self.model_type,
+                             informativeText="Reason:\n%s" % reason,
+                             type="error")
+        return None, None
+
+
+    def get_stream_data(self, xlabel, ylabel):
+        """Returns arguments of utils.incremental_ml for training a streaming model on the data
+        file, showing an error if variables cannot be used
+
+        Features and y variable are read from the data file with their names in the file, so 
+        data type conversions made in the application do not apply. Levels of categorical 
+        features and classes of the label are taken from the loaded data.
+
+        Parameters
+        ----------
+        xlabel : str
+            Name of x variable
+
+        ylabel : str
+            Name of y variable
+
+        Returns
+        -------
+        dict or None
+            Keyword arguments of utils.incremental_ml other than model, None if variables
+            cannot be used
+        """
+        names, ylabel = self.get_model_variables(xlabel, ylabel)
+        if names is None: return None
+
+        try:
+            for name in names + ([] if ylabel == 'None' else [ylabel]):
+                if name not in self.source_names:
+                    raise ValueError("Variable %s is not a column of the data file" % name)
+
+            levels = {}
+            for name in names:
+                column = self.get_column(name)
+                if self.feature_panel.one_hot() and utils.is_categorical_feature(column):
+                    levels[self.source_names[name]] = utils.feature_levels(column)[1]
+                elif utils.is_categorical_feature(column):
+                    raise ValueError('Variable %s is not numeric, enable one-hot encoding to use '
+                                     'it as a feature' % name)
+
+            classes = None
+            if self.model_type == 'Classification':
+                y = self.get_column(ylabel).values.astype(float)
+                if not utils.check_for_categorical_label(y):
+                    raise ValueError("Less than 3 samples per unique value")
+                classes = np.unique(y[~np.isnan(y)])
+
+        except Exception as e:
+            qt_utils.message_box(message="Error Fitting %s Model" % self.model_type,
+                                 informativeText="Reason:\n%s" % str(e),
+                                 type="error")
+            return None
+
+        return {'filename': self.file, 'features': [self.source_names[name] for name in names],
+                'label': None if ylabel == 'None' else self.source_names[ylabel], 
+                'levels': levels, 'classes': classes, 'dtype': self.feature_panel.dtype()}
+
+
+    def get_model_data(self, xlabel, ylabel):
+        """Builds design matrix from features checked in feature panel, or from x variable if 
+        none are checked, and converts y variable to numeric labels, showing an error if they 
+        cannot be used
+
+        Parameters
+        ----------
+        xlabel : str
+            Name of x variable
+
+        ylabel : str
+            Name of y variable, only optional for clustering models fit on checked features
+
+        Returns
+        -------
+        X : 2d array-like or None
+            Design matrix, None if variables cannot be used
+
+        y : 1d array-like or None
+            Labels, None if variables cannot be used or for clustering, whose y variable is the 
+            last column of design matrix
+
+        features : list or None
+            Name of each column of design matrix, None if variables cannot be used
+        """
+        names, ylabel = self.get_model_variables(xlabel, ylabel)
+        if names is None: return None, None, None
+
+        # Clustering y variable is cast into design matrix with features, not stacked on later
+        if self.model_type == 'Clustering' and ylabel != 'None': names, ylabel = names + [ylabel], 'None'
+
+        # Try and convert features and y to numeric for machine learning model
+        try:
+            X, features = utils.build_design_matrix([self.get_column(name) for name in names],
+                                                    dtype=self.feature_panel.dtype(),
+                                                    one_hot=self.feature_panel.one_hot())
+            y           = None if ylabel == 'None' else np.asarray(self.get_column(ylabel), dtype=float)
+        
+        except Exception as e:
+            qt_utils.message_box(message="Error Fitting %s Model" % self.model_type,
+                                 informativeText="Reason:\n%s" % str(e),
+                                 type="error")
+            return None, None, None
+
+        # Ensure label is categorical (based on CV splits) prior to fitting classifier
+        if self.model_type == 'Classification' and not utils.check_for_categorical_label(y):
+            qt_utils.message_box(message="Error Fitting %s Model" % self.model_type,
+                                 informativeText="Reason:\nLess than 3 samples per unique value",
+                                 type="error")
+            return None, None, None
+
+        self.statusBar.showMessage("Design matrix: %s" % self.design_matrix_text(X.shape, X.dtype))
+        return X, y, features
+
+
+    def design_matrix_text(self, shape, dtype):
+        """Describes size and memory use of a design matrix"""
+        return "%d rows x %d features (%s), %.1f MB" % \
+               (shape[0], shape[1], dtype, shape[0]*shape[1]*np.dtype(dtype).itemsize/1e6)
+
+
+    def features_summary(self, info):
+        """Returns model summary lines describing features of a fit"""
+        features = info.get('features') or []
+        if features == [info['xlabel']]: return ''
+        shown = ', '.join(features[:10]) + (', ...' if len(features) > 10 else '')
+        return "Features (%d): %s\n" % (len(features), shown)
+
+
+    def update_feature_memory(self):
+        """Shows size of design matrix for features checked in feature panel
+
+        Object variables are only counted once, and variables not read from file yet count as 
+        one feature each
+        """
+        names = self.feature_panel.selected()
+        if not self.data_loaded or not names:
+            self.feature_panel.set_memory_text("No features checked, X-axis variable is used")
+            return
+
+        one_hot    = self.feature_panel.one_hot()
+        n_features = 0
+        for name in names:
+            if name in self.columns_pending or \
+                    not (one_hot and utils.is_categorical_feature(self.data[name])):
+                n_features += 1
+                continue
+
+            # Counting levels reads every value, so counts are cached until variable changes
+            key = (name, self.column_versions.get(name, 0), 'levels')
+            if key not in self.result_cache:
+                self.result_cache.put(key, utils.design_matrix_shape([self.data[name]])[1])
+            n_features += self.result_cache.get(key)
+
+        text = "Design matrix: %s" % self.design_matrix_text((self.data.shape[0], n_features),
+                                                              self.feature_panel.dtype())
+        n_pending = sum(1 for name in names if name in self.columns_pending)
+        if n_pending: text += ", more if any of %d variables not read yet are categorical" % n_pending
+        self.feature_panel.set_memory_text(text)
+
+
+    def fit_all_models(self):
+        """Submits job fitting every model of selected model type with default parameters on 
+        the same folds, with results shown in model comparison tab"""
+        if not self.data_loaded:
+            self.statusBar.showMessage("Load data before fitting models")
+            return
+
+        xlabel = self.comboBox_XAxis.currentText()
+        ylabel = self.comboBox_YAxis.currentText()
+        X, y, features = self.get_model_data(xlabel, ylabel)
+        if X is None: return
+
+        self.job_scheduler.submit(name='All %s Models' % self.model_type,
+                                  func=compare.run_comparison,
+                                  kwargs={'X': X, 'y': y, 'model_type': self.model_type},
+                                  info={'xlabel': xlabel, 'ylabel': ylabel, 'comparison': True,
+                                        'model_type': self.model_type, 'features': features})
+        self.tabWidget_Analysis.setCurrentWidget(self.tab6_Comparison)
+
+
+    def fit_model(self):
+        """ADD
+        
         Parameters
         ----------
         
@@ -1286,51 +2025,45 @@ class EDAViewer(QMainWindow):
             ylabel    = self.comboBox_YAxis.currentText()
             plot_type = self.comboBox_PlotType.currentText()
 
-            # Both variables need to be specified
-            if xlabel == 'None' and ylabel == 'None':
-                utils.message_box(message="Error Fitting %s Model" % self.model_type,
-                                  informativeText="Reason:\nX and Y variable not specified",
-                                  type="error")
+            # Both variables need to be specified, unless features are checked
+            if xlabel == 'None' and ylabel == 'None' and not self.feature_panel.selected():
+                qt_utils.message_box(message="Error Fitting %s Model" % self.model_type,
+                                     informativeText="Reason:\nX and Y variable not specified",
+                                     type="error")
                 return
 
             # If add predictions to plot checked, check for valid plot
             if self.tab3_checkBox_AddPredictions.isChecked():
                 if plot_type not in utils.PLOTS_FOR_PRED:
-                    utils.message_box(message="Unable to Adding Predictions to %s Plot" % plot_type,
-                                      informativeText="Reason:\n%s plot is not a valid plot to add predictions" % plot_type,
-                                      type="error")
+                    qt_utils.message_box(message="Unable to Adding Predictions to %s Plot" % plot_type,
+                                         informativeText="Reason:\n%s plot is not a valid plot to add predictions" % plot_type,
+                                         type="error")
                     return
 
                 # If add predictions to plot checked, make sure plot is already generated
                 if not self.plot_generated['status']:
-                    utils.message_box(message="Error Adding Predictions to %s Plot" % plot_type,
-                                      informativeText="Reason:\nNo plot generated yet",
-                                      type="error")
+                    qt_utils.message_box(message="Error Adding Predictions to %s Plot" % plot_type,
+                                         informativeText="Reason:\nNo plot generated yet",
+                                         type="error")
                     return
 
-            # Try and convert x and y to numeric for machine learning model
-            try:
-                X = self.data[xlabel].values.astype(float).reshape(-1, 1)
-                y = self.data[ylabel].values.astype(float)
-            
-            except Exception as e:
-                utils.message_box(message="Error Fitting %s Model" % self.model_type,
-                                  informativeText="Reason:\n%s" % str(e),
-                                  type="error")
-                return
-
-            # Ensure label is categorical (based on CV splits) prior to fitting classifier
-            if self.model_type == 'Classification' and not utils.check_for_categorical_label(y):
-                utils.message_box(message="Error Fitting %s Model" % self.model_type,
-                                  informativeText="Reason:\nLess than 3 samples per unique value",
-                                  type="error")
-                return       
+            # Streaming models read the data file in chunks, other models get a design matrix
+            streaming = self.model_name in utils.STREAMING_MODELS
+            if streaming:
+                stream_kwargs = self.get_stream_data(xlabel, ylabel)
+                if stream_kwargs is None: return
+            else:
+                X, y, features = self.get_model_data(xlabel, ylabel)
+                if X is None: return
 
             # Try and convert hyperparameter text to dictionary and instantiate model
             try:
                 params = utils.text_to_dict(self.tab3_plainTextEdit_ModelParameters.toPlainText())
                 model  = utils.get_model(model_name=self.model_name, model_type=self.model_type)
 
+                # Lists and ranges of values are searched over in a sweep
+                params, space = sweep.parse_search_space(params, model.get_params())
+
                 # Now try and update model with each parameter and skip ones that are invalid
                 n_failed, n_names = 0, []
                 for key, value in params.iteritems():
@@ -1341,24 +2074,45 @@ class EDAViewer(QMainWindow):
                         n_names.append({key: value})
                         pass
 
+                for key in [key for key in space if key not in model.get_params()]:
+                    n_failed += 1
+                    n_names.append({key: space.pop(key)})
+
                 if n_failed > 0:
-                    utils.message_box(message="Error Setting %d Model Parameters for %s Model" % self.model_name,
-                                      informativeText="Parameters:\n%s" % (n_names,),
-                                      type="warning")
+                    qt_utils.message_box(message="Error Setting %d Model Parameters for %s Model" % (n_failed, self.model_name),
+                                         informativeText="Parameters:\n%s" % (n_names,),
+                                         type="warning")
 
             except Exception as e:
-                utils.message_box(message="Error Loading Parameters for %s Model" % self.model_name,
-                                  informativeText="Reason:\n%s" % str(e),
-                                  type="error")
+                qt_utils.message_box(message="Error Loading Parameters for %s Model" % self.model_name,
+                                     informativeText="Reason:\n%s" % str(e),
+                                     type="error")
                 return
 
-            # Run model (in separate thread)  
-            self.run(X=X, y=y, xlabel=xlabel, ylabel=ylabel, model=model)
+            # Run model or sweep (in separate process)
+            if streaming:
+                if space:
+                    qt_utils.message_box(message="Error Fitting %s Model" % self.model_type,
+                                         informativeText="Reason:\nSweeps need a model that is not streamed",
+                                         type="error")
+                    return
+                self.run_streaming(stream_kwargs=stream_kwargs, xlabel=xlabel, ylabel=ylabel, 
+                                   model=model)
+            elif space:
+                if self.model_type == 'Clustering':
+                    qt_utils.message_box(message="Error Fitting %s Model" % self.model_type,
+                                         informativeText="Reason:\nSweeps need a regression or classification model",
+                                         type="error")
+                    return
+                self.run_sweep(X=X, y=y, xlabel=xlabel, ylabel=ylabel, model=model, space=space,
+                               features=features)
+            else:
+                self.run(X=X, y=y, xlabel=xlabel, ylabel=ylabel, model=model, features=features)
 
         else:
-            utils.message_box(message="Error Fitting %s Model" % self.model_type,
-                              informativeText="Reason:\nNot data loaded",
-                              type="error")
+            qt_utils.message_box(message="Error Fitting %s Model" % self.model_type,
+                                 informativeText="Reason:\nNot data loaded",
+                                 type="error")
             return 
 
 
@@ -1374,10 +2128,11 @@ class EDAViewer(QMainWindow):
         # Define signals
         data_signal = QtCore.Signal(list)
 
-        def __init__(self, func, kwargs):
+        def __init__(self, func, kwargs, tracer):
             QtCore.QThread.__init__(self)
             self.func   = func
             self.kwargs = kwargs
+            self.tracer = tracer
 
         def __del__(self):
             """ADD DESCRIPTION"""
@@ -1385,8 +2140,10 @@ class EDAViewer(QMainWindow):
 
         def run(self):
             """ADD DESCRIPTION"""
-            status = self.func(**self.kwargs)
-            self.data_signal.emit([status]) 
+            with self.tracer.stage('Add Predictions', rows=len(self.kwargs['y_pred'])) as stage:
+                status = self.func(**self.kwargs)
+                if status != 'Success': stage.status = 'Failed: %s' % status
+                self.data_signal.emit([status]) 
 
 
     def slot_ThreadAddPredictionsToPlot(self, data_signal):
@@ -1400,9 +2157,9 @@ class EDAViewer(QMainWindow):
         """
         status = data_signal[0]
         if status != 'Success':
-            utils.message_box(message="Error Adding Predictions to Plot",
-                              informativeText="Reason:\n%s" % status,
-                              type="error")   
+            qt_utils.message_box(message="Error Adding Predictions to Plot",
+                                 informativeText="Reason:\n%s" % status,
+                                 type="error")   
 
 
     def add_predictions(self, y_pred, xlabel, ylabel, model_type, model_name):
@@ -1416,7 +2173,7 @@ class EDAViewer(QMainWindow):
         """
         # Warning if plot variables are not same as machine learning variables
         if xlabel != self.plot_generated['xlabel'] or ylabel != self.plot_generated['ylabel']:
-            reply = utils.message_box(message="Warning Variable Mismatch",
+            reply = qt_utils.message_box(message="Warning Variable Mismatch",
                                     informativeText=("Machine learning variables do not match plot "
                                                      "variables. Do you want to add predictions?"),
                                     type="warning",
@@ -1426,14 +2183,467 @@ class EDAViewer(QMainWindow):
 
         # Create thread and add predictions
         self.add_prediction_thread = \
-            self.ThreadAddPredictionsToPlot(func=self.MplCanvas.add_predictions_to_plot,
+            self.ThreadAddPredictionsToPlot(func=self.plot_canvas().add_predictions_to_plot,
                                             kwargs={'y_pred': y_pred,
                                                     'model_type': model_type,
-                                                    'model_name': model_name})
+                                                    'model_name': model_name},
+                                            tracer=self.tracer)
         self.add_prediction_thread.data_signal.connect(self.slot_ThreadAddPredictionsToPlot)        
         self.add_prediction_thread.start()
 
 
+    ###############################
+    # TAB 4 PROFILE UI: FUNCTIONS #
+    ###############################
+
+    def setup_profile_ui(self):
+        """Adds tab with summary table that is filled in as each variable is profiled"""
+        self.profile_results    = OrderedDict() # Variable names mapped to (dtype, stats, freq)
+        self.profile_cache_keys = {}            # Variable names mapped to (cache key, numeric)
+        self.profile_running    = False
+
+        # Define table in its own tab
+        self.tab4_Profile           = QWidget()
+        self.profile_model          = table_models.ResultTableModel(utils.PROFILE_COLUMNS, self)
+        self.tab4_tableView_Profile = QTableView()
+        self.tab4_tableView_Profile.setModel(self.profile_model)
+        self.tab4_tableView_Profile.horizontalHeader().setVisible(True)
+        self.tab4_tableView_Profile.verticalHeader().setVisible(False)
+        self.tab4_tableView_Profile.setAlternatingRowColors(True)
+        self.tab4_tableView_Profile.setToolTip("Statistics for every variable from Tools -> Profile All Columns "
+                                               "or Tools -> Profile File Without Loading")
+
+        layout = QVBoxLayout(self.tab4_Profile)
+        layout.addWidget(self.tab4_tableView_Profile)
+        self.tab4_Profile.setLayout(layout)
+        self.tabWidget_Analysis.addTab(self.tab4_Profile, 'Profile')
+
+
+    class ThreadProfileData(QtCore.QThread):
+        """Profiles variables on a process pool, emitting each result as soon as it finishes
+
+        Parameters
+        ----------
+        columns : OrderedDict
+            Names of variables mapped to pandas Series with their data
+
+        n_jobs : int
+            Number of worker processes
+
+        tracer : tracing.Tracer
+            Tracer recording profiling as a stage
+
+        bins : dict
+            Keyword arguments of utils.value_counts_grouped choosing histogram bins
+        """
+        # Define signals
+        data_signal   = QtCore.Signal(list)
+        result_signal = QtCore.Signal(list)
+
+        def __init__(self, columns, n_jobs, tracer, bins=None):
+            QtCore.QThread.__init__(self)
+            self.columns    = columns
+            self.n_jobs     = n_jobs
+            self.tracer     = tracer
+            self.bins       = bins or {}
+            self._cancelled = False
+
+        def __del__(self):
+            """ADD DESCRIPTION"""
+            self.wait()
+
+        def cancel(self):
+            """Requests that profiling stops, terminating worker processes"""
+            self._cancelled = True
+
+        def run(self):
+            """Distributes one variable name per task and streams results back in completion order"""
+            rows = len(next(self.columns.itervalues())) if self.columns else None
+            with self.tracer.stage('Profile All Columns', rows=rows) as stage:
+                pool = multiprocessing.Pool(processes=self.n_jobs, 
+                                            initializer=utils.init_profile_worker, 
+                                            initargs=(self.columns,))
+                try:
+                    results = pool.imap_unordered(partial(utils.profile_column, bins=self.bins),
+                                                  list(self.columns.keys()), chunksize=1)
+                    for i, result in enumerate(results, 1):
+                        if self._cancelled:
+                            stage.status = 'Cancelled'
+                            self.data_signal.emit(['Cancelled'])
+                            return
+                        self.result_signal.emit(list(result) + [i, len(self.columns)])
+                    self.data_signal.emit(['Success'])
+
+                except Exception as e:
+                    stage.status = 'Failed: %s' % e
+                    self.data_signal.emit([str(e)])
+
+                finally:
+                    pool.terminate()
+                    pool.join()
+
+
+    def slot_result_ThreadProfileData(self, result_signal):
+        """Adds a row to profile table for a variable that finished profiling
+
+        Parameters
+        ----------
+        result_signal : list
+            Name, data type, statistics, frequency table, number finished, and number of variables
+
+        Returns
+        -------
+        None
+        """
+        name, dtype, stats, freq, n_done, n_total = result_signal
+        self.profile_results[name] = (dtype, stats, freq)
+
+        # Cache under key taken when profiling started, unless variable was since edited or 
+        # renamed and results no longer describe its data
+        key, numeric = self.profile_cache_keys[name]
+        if key[1] == self.column_versions.get(name, 0): self.result_cache.put(key, (stats, freq, numeric))
+
+        # Fill in one cell per profile column, leaving statistics that do not apply blank
+        values = dict(stats, **{'Variable': name, 'Data Type': dtype})
+        self.profile_model.append_row([values.get(key) for key in utils.PROFILE_COLUMNS])
+
+        self.statusBar.showMessage("Profiled %d of %d variables" % (n_done, n_total))
+
+
+    def slot_ThreadProfileData(self, data_signal):
+        """Finishes profiling and reports errors
+
+        Parameters
+        ----------
+        data_signal : list
+            Status of profiling
+
+        Returns
+        -------
+        None
+        """
+        status               = data_signal[0]
+        self.profile_running = False
+        self.menuItem_ProfileAll.setText('Profile All Columns')
+        self.menuItem_StreamProfile.setText('Profile File Without Loading...')
+        self.tab4_tableView_Profile.setSortingEnabled(True)
+
+        if status == 'Success':
+            self.statusBar.showMessage("Profiled all %d variables" % len(self.profile_results))
+        elif status == 'Cancelled':
+            self.statusBar.showMessage("Profiling cancelled")
+        else:
+            qt_utils.message_box(message="Error Profiling Data",
+                                 informativeText="Reason:\n%s" % status,
+                                 type="error")
+
+
+    def profile_all_columns(self):
+        """Profiles every variable in data on a process pool, or cancels profiling if running"""
+        if self.profile_running:
+            self.profile_thread.cancel()
+            self.statusBar.showMessage("Cancelling profiling...")
+            return
+
+        if not self.data_loaded:
+            qt_utils.message_box(message="Error Profiling Data",
+                                 informativeText="Reason:\nNo data loaded",
+                                 type="error")
+            return
+
+        try:
+            self.load_all_columns()
+        except Exception as e:
+            qt_utils.message_box(message="Error Profiling Data",
+                                 informativeText="Reason:\n%s" % str(e),
+                                 type="error")
+            return
+
+        # Clear previous profile and disable sorting while rows stream in
+        self.profile_results = OrderedDict()
+        self.tab4_tableView_Profile.setSortingEnabled(False)
+        self.profile_model.clear()
+        self.tabWidget_Analysis.setCurrentWidget(self.tab4_Profile)
+
+        # Series reference the current data. Workers are forked with them, so they are shared
+        # copy-on-write instead of pickled into each task
+        columns = OrderedDict((name, self.data[name]) for name in self.var_names)
+        bins    = self.bin_settings()
+
+        # Same keys Generate would look up for unstandardized variables in memory, taken now so 
+        # results are stored under versions of the data that was profiled
+        self.profile_cache_keys = {name: ((name, self.column_versions.get(name, 0), False, False, 
+                                           tuple(sorted(bins.items()))), utils.is_numeric(column))
+                                   for name, column in columns.items()}
+        self.profile_thread = self.ThreadProfileData(columns=columns, n_jobs=utils.PROFILE_N_JOBS,
+                                                     tracer=self.tracer, bins=bins)
+        self.profile_thread.result_signal.connect(self.slot_result_ThreadProfileData)
+        self.profile_thread.data_signal.connect(self.slot_ThreadProfileData)
+        self.profile_running = True
+        self.menuItem_ProfileAll.setText('Cancel Profiling')
+        self.statusBar.showMessage("Profiling %d variables on %d processes..." % \
+                                   (len(columns), utils.PROFILE_N_JOBS))
+        self.profile_thread.start()
+
+
+    class ThreadStreamProfile(QtCore.QThread):
+        """Profiles every variable of a data file from a chunked read, without loading the file, 
+        see streaming.streaming_statistics
+
+        Parameters
+        ----------
+        file : str
+            Path to data file
+
+        tracer : tracing.Tracer
+            Tracer recording profiling as a stage
+
+        bins : dict
+            Keyword arguments of streaming.StreamingStatistics.frequencies choosing bins
+
+        dtypes : dict
+            Column names mapped to data types each chunk is converted to
+        """
+        # Define signals
+        data_signal     = QtCore.Signal(list)
+        progress_signal = QtCore.Signal(list)
+
+        def __init__(self, file, tracer, bins=None, dtypes=None):
+            QtCore.QThread.__init__(self)
+            self.file       = file
+            self.tracer     = tracer
+            self.bins       = bins or {}
+            self.dtypes     = dtypes or {}
+            self._cancelled = False
+
+        def __del__(self):
+            """ADD DESCRIPTION"""
+            self.wait()
+
+        def cancel(self):
+            """Requests that profiling stops after the chunk currently being read"""
+            self._cancelled = True
+
+        def progress(self, n_rows, bytes_read, total_bytes):
+            """Emits progress after each chunk, returning whether to stop reading"""
+            self.progress_signal.emit([n_rows, bytes_read, total_bytes])
+            return self._cancelled
+
+        def run(self):
+            """Accumulates statistics of every variable chunk by chunk"""
+            with self.tracer.stage('Profile File Without Loading') as stage:
+                try:
+                    results = streaming.streaming_statistics(self.file, callback=self.progress, 
+                                                             bins=self.bins, dtypes=self.dtypes)
+                    if results is None:
+                        stage.status = 'Cancelled'
+                        self.data_signal.emit(['Cancelled'])
+                    else:
+                        self.data_signal.emit(['Success', results])
+
+                except Exception as e:
+                    stage.status = 'Failed: %s' % e
+                    self.data_signal.emit([str(e)])
+
+
+    def slot_progress_ThreadStreamProfile(self, progress_signal):
+        """Shows number of rows and bytes profiled so far in status bar
+
+        Parameters
+        ----------
+        progress_signal : list
+            Rows read, bytes read, and total bytes in file
+
+        Returns
+        -------
+        None
+        """
+        n_rows, bytes_read, total_bytes = progress_signal
+        self.statusBar.showMessage("Profiling file: %d rows read (%.1f of %.1f MB, %d%%)" % \
+                                    (n_rows, bytes_read/1e6, total_bytes/1e6, 
+                                     100*bytes_read/max(total_bytes, 1)))
+
+
+    def slot_ThreadStreamProfile(self, data_signal):
+        """Fills profile table with statistics of every variable of the profiled file
+
+        Parameters
+        ----------
+        data_signal : list
+            Status of profiling, and column names mapped to (statistics, frequency table, is 
+            numeric, data type) if successful
+
+        Returns
+        -------
+        None
+        """
+        status = data_signal[0]
+        if status == 'Success':
+            for name, (stats, freq, _, dtype) in data_signal[1].iteritems():
+                self.profile_results[name] = (dtype, stats, freq)
+                values = dict(stats, **{'Variable': name, 'Data Type': dtype})
+                self.profile_model.append_row([values.get(key) for key in utils.PROFILE_COLUMNS])
+            self.slot_ThreadProfileData(['Success'])
+            self.statusBar.showMessage("Profiled all %d variables without loading, percentiles "
+                                       "are estimates" % len(self.profile_results))
+        else:
+            self.slot_ThreadProfileData(data_signal)
+
+
+    def profile_file(self):
+        """Profiles every variable of a data file without loading it, so files larger than 
+        memory can be profiled, or cancels profiling if running"""
+        if self.profile_running:
+            self.profile_thread.cancel()
+            self.statusBar.showMessage("Cancelling profiling...")
+            return
+
+        # File dialog options for opening single file
+        options   = QFileDialog.Options()
+        options   |= QFileDialog.DontUseNativeDialog
+        file_info = QFileDialog.getOpenFileName(self, "Profile File Without Loading", "/",
+                                                "*.csv files (*.csv);;"
+                                                "*.tsv files (*tsv);;"
+                                                "*.txt files (*.txt);;"
+                                                "*.parquet files (*.parquet);;"
+                                                "*.feather files (*.feather);;",
+                                                options=options)
+        if not file_info[0]: return
+
+        # Data types changed in the application apply if the loaded file is profiled
+        dtypes = self.stream_dtypes() if self.data_loaded and file_info[0] == self.file else None
+
+        # Clear previous profile and disable sorting until all rows are added
+        self.profile_results = OrderedDict()
+        self.tab4_tableView_Profile.setSortingEnabled(False)
+        self.profile_model.clear()
+        self.tabWidget_Analysis.setCurrentWidget(self.tab4_Profile)
+
+        self.profile_thread = self.ThreadStreamProfile(file=file_info[0], tracer=self.tracer, 
+                                                       bins=self.bin_settings(), dtypes=dtypes)
+        self.profile_thread.progress_signal.connect(self.slot_progress_ThreadStreamProfile)
+        self.profile_thread.data_signal.connect(self.slot_ThreadStreamProfile)
+        self.profile_running = True
+        self.menuItem_StreamProfile.setText('Cancel Profiling')
+        self.statusBar.showMessage("Profiling %s without loading..." % file_info[0])
+        self.profile_thread.start()
+
+
+
+    ############################
+    # TAB 5 JOBS UI: FUNCTIONS #
+    ############################
+
+    def setup_jobs_ui(self):
+        """Adds tab listing queued, running, and finished model fitting jobs"""
+        self.tab5_Jobs           = QWidget()
+        self.jobs_model          = table_models.ResultTableModel(JOB_COLUMNS, self, selectable=True)
+        self.tab5_tableView_Jobs = QTableView()
+        self.tab5_tableView_Jobs.setModel(self.jobs_model)
+        self.tab5_tableView_Jobs.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tab5_tableView_Jobs.horizontalHeader().setVisible(True)
+        self.tab5_tableView_Jobs.horizontalHeader().setStretchLastSection(True)
+        self.tab5_tableView_Jobs.verticalHeader().setVisible(False)
+        self.tab5_tableView_Jobs.setAlternatingRowColors(True)
+        self.tab5_tableView_Jobs.setToolTip("Model fits from this session, newest last")
+
+        self.tab5_pushButton_CancelJobs = QPushButton('Cancel Selected Jobs')
+        self.tab5_pushButton_CancelJobs.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'window-close.png')))
+        self.tab5_pushButton_CancelJobs.clicked.connect(self.cancel_selected_jobs)
+
+        layout = QVBoxLayout(self.tab5_Jobs)
+        layout.addWidget(self.tab5_tableView_Jobs)
+        layout.addWidget(self.tab5_pushButton_CancelJobs)
+        self.tab5_Jobs.setLayout(layout)
+        self.tabWidget_Analysis.addTab(self.tab5_Jobs, 'Jobs')
+
+
+    def update_jobs_ui(self):
+        """Refreshes jobs table and shows number of active jobs on fit model button"""
+        jobs = self.job_scheduler.jobs()
+        self.jobs_model.set_columns([[job.id for job in jobs],
+                                     [job.name for job in jobs],
+                                     [job.info.get('xlabel') for job in jobs],
+                                     [job.info.get('ylabel') for job in jobs],
+                                     [job.status for job in jobs],
+                                     [job.message for job in jobs],
+                                     [job.elapsed() for job in jobs]])
+
+        n_active = self.job_scheduler.n_active()
+        if n_active:
+            self.tab3_pushButton_FitModel.setText('Fit Model (%d active)' % n_active) 
+            self.tab3_pushButton_FitModel.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'run.png')))
+        else:
+            self.tab3_pushButton_FitModel.setText('Fit Model') 
+            self.tab3_pushButton_FitModel.setIcon(QIcon(os.path.join(utils.ICONS_PATH, 'play.png')))
+
+
+    def cancel_selected_jobs(self):
+        """Cancels jobs selected in jobs table"""
+        rows = self.tab5_tableView_Jobs.selectionModel().selectedRows()
+        ids  = [self.jobs_model.index(row.row(), 0).data() for row in rows]
+        for job_id in ids: self.job_scheduler.cancel(int(job_id))
+
+
+    def cancel_all_jobs(self):
+        """Cancels all queued and running model fitting jobs"""
+        if self.job_scheduler.n_active():
+            self.job_scheduler.cancel_all()
+        else:
+            self.statusBar.showMessage("No model fits running")
+
+    ########################################
+    # TAB 6 MODEL COMPARISON UI: FUNCTIONS #
+    ########################################
+
+    def setup_comparison_ui(self):
+        """Adds tab with sortable table comparing models fit by Tools -> Fit All Models"""
+        self.tab6_Comparison           = QWidget()
+        self.comparison_model          = table_models.ResultTableModel(compare.COMPARISON_COLUMNS, self)
+        self.tab6_label_Comparison     = QLabel('Tools -> Fit All Models compares every model of the selected model type')
+        self.tab6_tableView_Comparison = QTableView()
+        self.tab6_tableView_Comparison.setModel(self.comparison_model)
+        self.tab6_tableView_Comparison.horizontalHeader().setVisible(True)
+        self.tab6_tableView_Comparison.horizontalHeader().setStretchLastSection(True)
+        self.tab6_tableView_Comparison.verticalHeader().setVisible(False)
+        self.tab6_tableView_Comparison.setAlternatingRowColors(True)
+        self.tab6_tableView_Comparison.setSortingEnabled(True)
+        self.tab6_tableView_Comparison.setToolTip("Scores are means over folds, times are totals over folds, "
+                                                  "and peak memory is the largest increase in memory during one fit")
+
+        layout = QVBoxLayout(self.tab6_Comparison)
+        layout.addWidget(self.tab6_label_Comparison)
+        layout.addWidget(self.tab6_tableView_Comparison)
+        self.tab6_Comparison.setLayout(layout)
+        self.tabWidget_Analysis.addTab(self.tab6_Comparison, 'Model Comparison')
+
+
+    def show_comparison(self, job, rows):
+        """Shows rows of a model comparison job in model comparison table
+
+        Parameters
+        ----------
+        job : Job
+            Model comparison job
+
+        rows : list
+            One row per model, see compare.summarize
+
+        Returns
+        -------
+        None
+        """
+        self.tab6_label_Comparison.setText("%s Models (X-Axis: %s, Y-Axis: %s): %s" % \
+                                           (job.info['model_type'], job.info['xlabel'],
+                                            job.info['ylabel'], job.message or job.status))
+        self.comparison_model.set_columns(compare.comparison_columns(rows))
+
+        # Keep order user sorted table by as rows are updated
+        header = self.tab6_tableView_Comparison.horizontalHeader()
+        if header.sortIndicatorSection() >= 0:
+            self.comparison_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+
+
 if __name__ == "__main__":
     # Create main thread
     app = QApplication(sys.argv)
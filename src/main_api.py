@@ -5,24 +5,33 @@ __description__= \
 Core functionality of application
 """.strip()
 
-# Set matplotlib backend to PySide
-import matplotlib
-matplotlib.use('Qt4Agg')
-matplotlib.rcParams['backend.qt4'] = 'PySide'
-from matplotlib.backends.backend_qt4agg import NavigationToolbar2QT as NavigationToolbar
-
+from collections import OrderedDict
+from functools import partial
+import json
+import multiprocessing
 import numpy as np
 import os
 import pandas as pd
 from PySide import QtCore
-from PySide.QtGui import (QApplication, QCheckBox, QComboBox, QFileDialog, QFont, QHBoxLayout, 
-                          QHeaderView, QIcon, QMainWindow, QMessageBox, QPixmap, QTableWidgetItem, 
-                          QVBoxLayout, QWidget)
+from PySide.QtGui import (QAbstractItemView, QActionGroup, QApplication, QCheckBox, QFileDialog, 
+                          QFont, QHeaderView, QIcon, QInputDialog, QLabel, QMainWindow, QMessageBox, 
+                          QPixmap, QPushButton, QTableView, QTextCursor, QVBoxLayout, QWidget)
 import qdarkstyle
 import sys
 from threading import Thread
 
 # Custom functions
 from about import AboutUi
-import utils
-from visual import DynamicMplCanvas
\ No newline at end of file
+import buffers
+from cache import DatasetCache, ModelCache, ResultCache, model_fingerprint
+import compare
+from features import FeaturePanel
+from jobs import JOB_COLUMNS, JobScheduler
+from performance import PerformancePanel
+import qt_utils
+import sketches
+import streaming
+import sweep
+import table_models
+import tracing
+import utils
\ No newline at end of file
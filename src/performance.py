@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from performance_api import *
+
+
+class PerformancePanel(QDockWidget):
+    """Dock widget listing a row per stage recorded by a tracer, newest at the bottom
+
+    Records arrive from worker threads, so they are handed to the GUI thread with a signal
+    before being added to the table.
+
+    Parameters
+    ----------
+    tracer : tracing.Tracer
+        Tracer whose records are shown
+    """
+    # Define signals
+    record_signal = QtCore.Signal(dict)
+
+    # Emitted with directory of cProfile dumps, or None when profiling is turned off
+    profiling_changed = QtCore.Signal(object)
+
+    def __init__(self, tracer, parent=None):
+        QDockWidget.__init__(self, 'Performance', parent)
+        self.setObjectName('dockWidget_Performance')
+        self.tracer = tracer
+
+        self.trace_model = table_models.ResultTableModel(tracing.TRACE_COLUMNS, self)
+        self.tableView_Trace = QTableView()
+        self.tableView_Trace.setModel(self.trace_model)
+        self.tableView_Trace.setSelectionMode(QAbstractItemView.NoSelection)
+        self.tableView_Trace.horizontalHeader().setResizeMode(QHeaderView.ResizeToContents)
+        self.tableView_Trace.verticalHeader().hide()
+
+        self.checkBox_Profile = QCheckBox('Profile stages with cProfile')
+        self.checkBox_Profile.setToolTip("Writes a .prof file per stage next to the log, "
+                                         "open with pstats or snakeviz")
+        self.checkBox_Profile.stateChanged.connect(self.set_profiling)
+
+        self.pushButton_Clear = QPushButton('Clear')
+        self.pushButton_Clear.clicked.connect(self.clear)
+
+        self.label_Log = QLabel('Log: %s' % (tracer.log_path or 'not written, directory '
+                                             'could not be created'))
+        self.label_Log.setWordWrap(True)
+        self.label_Log.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+
+        options = QHBoxLayout()
+        options.addWidget(self.checkBox_Profile)
+        options.addStretch()
+        options.addWidget(self.pushButton_Clear)
+
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.addWidget(self.tableView_Trace)
+        layout.addLayout(options)
+        layout.addWidget(self.label_Log)
+        self.setWidget(widget)
+
+        # Show records kept before panel was created, then every new record
+        for record in list(tracer.history): self.add_record(record)
+        self.record_signal.connect(self.add_record)
+        tracer.listeners.append(self.record_signal.emit)
+
+
+    def add_record(self, record):
+        """Adds record of a stage to bottom of table, see tracing.Stage"""
+        self.trace_model.append_row(tracing.record_row(record))
+        self.tableView_Trace.scrollToBottom()
+
+
+    def set_profiling(self, state):
+        """Turns cProfile dumps of stages on or off"""
+        self.tracer.profiling = state == QtCore.Qt.Checked
+        self.profiling_changed.emit(self.tracer.directory if self.tracer.profiling else None)
+
+
+    def clear(self):
+        """Removes all records from table and tracer, log is kept"""
+        self.tracer.clear()
+        self.trace_model.clear()
@@ -0,0 +1,14 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Performance panel listing wall time, CPU time, and memory of each stage of work in application
+""".strip()
+
+from PySide import QtCore
+from PySide.QtGui import (QAbstractItemView, QCheckBox, QDockWidget, QHBoxLayout, QHeaderView, 
+                          QLabel, QPushButton, QTableView, QVBoxLayout, QWidget)
+
+# Custom functions
+import table_models
+import tracing
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from plots_api import *
+
+
+def draw_plot(fig, axes, x, y, xlabel, ylabel, plot_type, n_buckets=DEFAULT_BUCKETS,
+              large_data_threshold=LARGE_DATA_THRESHOLD):
+    """Draws plot of one or two variables on a figure
+    # TODO: Fix axis x-axis tick marks and labels for bar charts, especially when two
+    # variables plotted together
+
+    Parameters
+    ----------
+    fig : matplotlib Figure
+        Figure to draw on
+
+    axes : matplotlib Axes
+        Empty axes of figure, removed if plot needs two axes
+
+    x : pandas Series
+        x variable for plotting
+
+    y : pandas Series
+        y variable for plotting
+
+    xlabel : str
+        Name of x variable
+
+    ylabel : str
+        Name of y variable
+
+    plot_type : str
+        Name of plot to generate
+
+    n_buckets : int
+        Number of buckets of downsampled line plots
+
+    large_data_threshold : int
+        Number of points above which scatter and line plots are reduced
+
+    Returns
+    -------
+    state : dict
+        Axes drawn on ('axes', or 'axes_x' and 'axes_y' for two boxplots), 'colorbar' of
+        density plots, and 'reduction' of points with 'sample_idx' of sampled rows
+    """
+    state = {'axes': axes, 'axes_x': None, 'axes_y': None, 'colorbar': None, 
+             'reduction': None, 'sample_idx': None}
+
+    # Scatter and line plots switch to large data mode above threshold
+    large = plot_type in utils.PLOTS_FOR_PRED and x is not None and y is not None and \
+            len(x) > large_data_threshold
+
+    # Scatter plot
+    if plot_type == 'Scatter':
+        title_str = "Scatter: {} x {}".format(xlabel, ylabel)
+        if large:
+            state['sample_idx'] = utils.sample_indices(len(x), MAX_SAMPLE_POINTS)
+
+            # Density of numeric variables, overlays use a random sample of points
+            x_arr, y_arr = np.asarray(x), np.asarray(y)
+            if utils.is_numeric(x) and utils.is_numeric(y):
+                state['reduction'] = 'density'
+                mask               = ~(pd.isnull(x_arr) | pd.isnull(y_arr))
+                density            = axes.hexbin(x_arr[mask], y_arr[mask], mincnt=1,
+                                                 gridsize=HEXBIN_GRIDSIZE, bins='log',
+                                                 cmap='viridis')
+                state['colorbar']  = fig.colorbar(density, ax=axes)
+                state['colorbar'].set_label('Count (log scale)')
+                title_str         += " [density of {:,} points]".format(len(x))
+            
+            # Hexbins need numbers on both axes, so plot a random sample otherwise
+            else:
+                state['reduction'] = 'sample'
+                idx                = state['sample_idx']
+                axes.scatter(x_arr[idx], y_arr[idx], alpha=.6)
+                title_str         += " [sample of {:,} of {:,} points]".format(len(idx), len(x))
+        else:
+            axes.scatter(x, y, alpha=.6)
+        axes.set_xlabel(xlabel)
+        axes.set_ylabel(ylabel)
+        axes.set_title(title_str)
+
+    # Line plot and Scatter + Line plot
+    elif plot_type in ['Line', 'Scatter + Line']:
+        title_str = "{}: {} x {}".format(plot_type, xlabel, ylabel)
+        fmt       = '-' if plot_type == 'Line' else '-o'
+        if large:
+            # Keep minimum and maximum of each bucket so peaks survive
+            state['reduction'] = 'minmax'
+            idx                = utils.minmax_indices(y, n_buckets)
+            axes.plot(np.asarray(x)[idx], np.asarray(y)[idx], fmt, alpha=.6)
+            title_str         += " [min/max of {:,} of {:,} points]".format(len(idx), len(x))
+        else:
+            axes.plot(x, y, fmt, alpha=.6)
+        axes.set_xlabel(xlabel)
+        axes.set_ylabel(ylabel)
+        axes.set_title(title_str)
+    
+    # Histogram and Bar Chart
+    elif plot_type in ['Histogram', 'Bar Chart']:
+        for values, label, color in [(x, xlabel, 'blue'), (y, ylabel, 'green')]:
+            if values is None: continue
+            if plot_type == 'Histogram':
+                axes.hist(values, alpha=.6, label=label, color=color)
+            else:
+                axes.bar(np.unique(values), pd.value_counts(values), alpha=.6, label=label, 
+                         color=color)
+        
+        # Add labels and title
+        if x is not None and y is not None:
+            title_str = "{}: {} and {}".format(plot_type, xlabel, ylabel)
+            axes.set_xlabel(xlabel + ' and ' + ylabel)
+        
+        elif x is not None and y is None:
+            title_str = "{}: {}".format(plot_type, xlabel)
+            axes.set_xlabel(xlabel)
+        
+        else:
+            title_str = "{}: {}".format(plot_type, ylabel)
+            axes.set_xlabel(ylabel)
+
+        axes.set_title(title_str)
+        axes.set_ylabel('Count')
+        axes.legend(loc='best')
+
+    # Boxplot
+    else:
+        if x is not None and y is None:
+            axes.boxplot(x)
+            axes.set_ylabel('Value')
+            axes.set_title("Boxplot: {}".format(xlabel))
+
+        elif x is None and y is not None: 
+            axes.boxplot(y)
+            axes.set_ylabel('Value')
+            axes.set_title("Boxplot: {}".format(ylabel))
+
+        else:
+            fig.delaxes(axes)
+            state['axes'] = None
+
+            # X variable
+            state['axes_x'] = fig.add_subplot(121)
+            state['axes_x'].boxplot(x)
+            state['axes_x'].set_ylabel("Value")
+            state['axes_x'].set_title("Boxplot: {}".format(xlabel))
+
+            # Y variable
+            state['axes_y'] = fig.add_subplot(122)
+            state['axes_y'].boxplot(y)
+            state['axes_y'].set_title("Boxplot: {}".format(ylabel))
+
+    # Create better layout
+    fig.tight_layout()
+    return state
@@ -0,0 +1,35 @@
+from __future__ import print_function
+
+__description__= \
+"""
+Matplotlib plots drawn on any figure, shared by application and command line. Selecting the
+backend is left to the caller, so no GUI toolkit is imported here
+""".strip()
+
+import matplotlib.style
+import numpy as np
+import os
+import pandas as pd
+
+# Custom functions
+import utils
+
+# Set plotting style
+matplotlib.style.use('seaborn-darkgrid')
+
+
+###############
+"""CONSTANTS"""
+###############
+
+# Define colors to use
+REG_COLORS = ['red', 'orange', 'cyan', 'purple', 'teal', 'dodgerblue', 
+                'darkgreen', 'darksalmon', 'slategrey']
+CLF_COLORS = [['green', 'red'], ['darkgreen', 'darksalmon'], ['purple', 'orange']]
+
+# Scatter and line plots of more points than the threshold are drawn as densities or 
+# downsampled lines. Threshold can be overridden with an environment variable
+LARGE_DATA_THRESHOLD = int(os.environ.get('EDA_VIEWER_LARGE_DATA_THRESHOLD', 100000))
+HEXBIN_GRIDSIZE      = 100   # Number of hexagons across x-axis of density plots
+MAX_SAMPLE_POINTS    = 20000 # Points drawn for overlays on density plots
+DEFAULT_BUCKETS      = 1000  # Line buckets used before canvas has a size
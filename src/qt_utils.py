@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from qt_utils_api import *
+
+
+class UiLoader(QUiLoader):
+    """ADD DESCRIPTION"""
+    def __init__(self, base_instance):
+        QUiLoader.__init__(self, base_instance)
+        self.base_instance = base_instance
+
+
+    def createWidget(self, class_name, parent=None, name=''):
+        """ADD
+        
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        """
+        if parent is None and self.base_instance:
+            return self.base_instance
+        else:
+            # create a new widget for child widgets
+            widget = QUiLoader.createWidget(self, class_name, parent, name)
+            if self.base_instance: setattr(self.base_instance, name, widget)
+            return widget
+
+
+def load_ui(ui_file, base_instance=None):
+    """ADD
+    
+    Parameters
+    ----------
+    
+    Returns
+    -------
+    """
+    loader = UiLoader(base_instance)
+    widget = loader.load(ui_file)
+    QMetaObject.connectSlotsByName(widget)
+    return widget
+
+
+def message_box(message, informativeText, type, question=False):
+    """ADD
+    
+    Parameters
+    ----------
+    
+    Returns
+    -------
+    """
+    # TODO: ADD DETAILED TEXT WITH TRACEBACKS AND EXCEPTION CATCHING
+    msg = QMessageBox()
+    msg.setText(message)
+    msg.setInformativeText(informativeText)
+
+    if type == "warning":
+        msg.setIcon(QMessageBox.Warning)
+    elif type == "error":
+        msg.setIcon(QMessageBox.Critical)
+    else:
+        msg.setIcon(QMessageBox.Information)
+
+    if question:
+        msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        msg.setDefaultButton(QMessageBox.No)
+        return msg.exec_() # Return messagebox 
+    else:
+        msg.setStandardButtons(QMessageBox.Ok)
+        msg.exec_()
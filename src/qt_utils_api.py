@@ -0,0 +1,11 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Qt helper functions for application, kept apart from utils so that utils can be imported
+without PySide
+""".strip()
+
+from PySide.QtCore import QMetaObject
+from PySide.QtGui import QMessageBox
+from PySide.QtUiTools import QUiLoader
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from sketches_api import *
+
+
+def hash_values(values):
+    """Returns 64-bit hashes of values, equal values of any type hash the same
+
+    Parameters
+    ----------
+    values : 1d array-like
+        Values without missing values
+
+    Returns
+    -------
+    1d array-like
+        uint64 hash of each value
+    """
+    return pd.util.hash_array(np.asarray(values, dtype=object))
+
+
+class HyperLogLog(object):
+    """Mergeable distinct count sketch of Flajolet et al. (2007)
+
+    Each hash picks a register with its first bits and offers the position of the first set
+    bit of the remaining bits, registers keep the largest position offered. Small counts use
+    linear counting of empty registers instead.
+
+    Error bound: relative standard error of the estimate is 1.04/sqrt(2**p).
+
+    Parameters
+    ----------
+    p : int
+        Number of bits choosing register, controls accuracy
+    """
+    def __init__(self, p=HLL_PRECISION):
+        self.p         = p
+        self.m         = 2**p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+
+    def update(self, hashes):
+        """Adds a batch of hashes
+
+        Parameters
+        ----------
+        hashes : 1d array-like
+            uint64 hashes, see hash_values
+
+        Returns
+        -------
+        None
+        """
+        if hashes.shape[0] == 0: return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        idx    = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+
+        # Remaining bits shifted to top with a guard bit, so position is at most 65 - p
+        rest = (hashes << np.uint64(self.p)) | np.uint64(1 << (self.p - 1))
+
+        # Position of first set bit from highest set bit of each 32-bit half, which frexp
+        # finds exactly
+        high = (rest >> np.uint64(32)).astype(np.float64)
+        low  = (rest & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        rank = np.where(high > 0, 33 - np.frexp(high)[1], 65 - np.frexp(low)[1])
+
+        best = pd.Series(rank).groupby(idx).max()
+        self.registers[best.index.values] = np.maximum(self.registers[best.index.values], 
+                                                       best.values.astype(np.uint8))
+
+
+    def merge(self, other):
+        """Combines another sketch of same precision into this one"""
+        if other.p != self.p: raise ValueError("Sketches have different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+
+    def estimate(self):
+        """Returns estimated number of distinct values"""
+        alpha    = 0.7213/(1 + 1.079/self.m)
+        estimate = alpha*self.m**2/np.sum(2.0**-self.registers.astype(np.float64))
+        empty    = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5*self.m and empty > 0: estimate = self.m*np.log(self.m/float(empty))
+        return int(round(estimate))
+
+
+    def std_error(self):
+        """Returns relative standard error of estimate"""
+        return 1.04/np.sqrt(self.m)
+
+
+class TopKSketch(object):
+    """Mergeable heavy hitter sketch of Misra and Gries (1982), merged as in Agarwal et al. (2012)
+
+    Exact counts of each batch are added to the kept counters. When more than capacity values
+    are kept, the count of the (capacity + 1)-th largest is subtracted from every counter and
+    counters that reach zero are dropped. Batches are counted by hash with pandas, so no Python
+    loop runs per value.
+
+    Error bound: kept counts are never more than true counts and are short by at most error,
+    which is at most n/(capacity + 1). Any value occurring more than that is kept.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of counters kept, controls accuracy
+    """
+    def __init__(self, capacity=TOP_K_CAPACITY):
+        self.capacity = capacity
+        self.n        = 0
+        self.error    = 0
+        self.counts   = pd.Series([], index=np.array([], dtype=np.uint64), dtype=np.int64)
+        self.labels   = pd.Series([], index=np.array([], dtype=np.uint64), dtype=object)
+
+
+    def _combine(self, counts):
+        """Adds counters and keeps at most capacity of them, returning hashes that are newly
+        kept"""
+        counts = self.counts.add(counts, fill_value=0).astype(np.int64)
+        if counts.shape[0] > self.capacity:
+            cut         = counts.nlargest(self.capacity + 1).iloc[-1]
+            counts      = counts[counts > cut] - cut
+            self.error += cut
+
+        self.counts = counts
+        self.labels = self.labels[self.labels.index.isin(counts.index)]
+        return counts.index[~counts.index.isin(self.labels.index)]
+
+
+    def update(self, hashes, values, counts=None):
+        """Adds a batch of values
+
+        Parameters
+        ----------
+        hashes : 1d array-like
+            uint64 hash of each value, see hash_values
+
+        values : 1d array-like
+            Values without missing values
+
+        counts : 1d array-like
+            Number of times each value occurs if values are already counted, in which case
+            values must be distinct
+
+        Returns
+        -------
+        None
+        """
+        if hashes.shape[0] == 0: return
+        counts  = pd.value_counts(hashes) if counts is None else pd.Series(counts, index=hashes)
+        self.n += int(counts.sum())
+        new     = self._combine(counts)
+
+        # Only look up values of hashes that are newly kept, first occurrence of each
+        keep   = np.flatnonzero(pd.Series(hashes).isin(new).values)
+        labels = pd.Series(np.asarray(values, dtype=object)[keep], index=hashes[keep])
+        self.labels = pd.concat([self.labels, labels[~labels.index.duplicated()]])
+
+
+    def merge(self, other):
+        """Combines another sketch into this one"""
+        self.n     += other.n
+        self.error += other.error
+        new         = self._combine(other.counts)
+        self.labels = pd.concat([self.labels, other.labels[other.labels.index.isin(new)]])
+
+
+    def top(self, n=TOP_N):
+        """Returns counts of up to n most frequent values, at most error short of true counts
+
+        Parameters
+        ----------
+        n : int
+            Number of values
+
+        Returns
+        -------
+        pandas Series
+            Counts indexed by value, largest first
+        """
+        counts = self.counts.nlargest(n)
+        return pd.Series(counts.values, index=self.labels.reindex(counts.index).values)
+
+
+class FrequencySketch(object):
+    """Distinct count and most frequent values of a variable in bounded memory, see 
+    HyperLogLog and TopKSketch
+
+    Parameters
+    ----------
+    p : int
+        Precision of distinct count sketch
+
+    capacity : int
+        Counters kept by top-k sketch
+    """
+    def __init__(self, p=HLL_PRECISION, capacity=TOP_K_CAPACITY):
+        self.distinct = HyperLogLog(p=p)
+        self.top_k    = TopKSketch(capacity=capacity)
+
+
+    @property
+    def n(self):
+        """Number of values added"""
+        return self.top_k.n
+
+
+    def update(self, data, hashes=None, counts=None):
+        """Adds a batch of values, ignoring missing values
+
+        Parameters
+        ----------
+        data : pandas Series or 1d array-like
+            Values
+
+        hashes : 1d array-like
+            Hashes of values without missing values if already computed, see hash_values
+
+        counts : 1d array-like
+            Number of times each value occurs if values are already counted, in which case 
+            values must be distinct and not missing
+
+        Returns
+        -------
+        None
+        """
+        values = np.asarray(data, dtype=object)
+        if hashes is None:
+            if counts is None: values = values[pd.notnull(values)]
+            hashes = hash_values(values)
+        self.distinct.update(hashes)
+        self.top_k.update(hashes, values, counts=counts)
+
+
+    def merge(self, other):
+        """Combines another sketch into this one"""
+        self.distinct.merge(other.distinct)
+        self.top_k.merge(other.top_k)
+
+
+    def frequencies(self, n=TOP_N):
+        """Returns counts of up to n most frequent values and of all other values
+
+        Parameters
+        ----------
+        n : int
+            Number of values
+
+        Returns
+        -------
+        pandas Series
+            Counts indexed by value, largest first, with OTHER_LABEL last
+        """
+        counts = self.top_k.top(n)
+        other  = pd.Series([self.n - counts.sum()], index=[OTHER_LABEL])
+        return pd.concat([counts, other])
+
+
+    def statistics(self):
+        """Returns distinct count, mode, and their error bounds
+
+        Returns
+        -------
+        results : OrderedDict
+            Unique (estimated), Unique SE (standard error), Mode, and Count Error (most a 
+            count of a frequent value can be short by)
+        """
+        top     = self.top_k.top(1)
+        results = OrderedDict()
+        results['Unique']      = self.distinct.estimate()
+        results['Unique SE']   = int(round(results['Unique']*self.distinct.std_error()))
+        results['Mode']        = top.index[0] if top.shape[0] else np.nan
+        results['Count Error'] = int(self.top_k.error)
+        return results
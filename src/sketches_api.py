@@ -0,0 +1,30 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Sketches counting distinct and most frequent values of high-cardinality variables in bounded 
+memory for application
+""".strip()
+
+from collections import OrderedDict
+import numpy as np
+import os
+import pandas as pd
+
+
+###############
+"""CONSTANTS"""
+###############
+
+# HyperLogLog keeps 2**HLL_PRECISION one-byte registers, relative standard error of distinct
+# count is 1.04/sqrt(2**HLL_PRECISION), 0.8% for 14
+HLL_PRECISION = 14
+
+# Counters kept by top-k sketch, counts of kept values are short by at most n/(capacity + 1)
+TOP_K_CAPACITY = 1000
+
+# Variables with more distinct values than this get approximate frequency tables showing the
+# TOP_N most frequent values and an Other bucket
+APPROX_MIN_UNIQUE = int(os.environ.get('EDA_VIEWER_APPROX_MIN_UNIQUE', 10000))
+TOP_N             = 100
+OTHER_LABEL       = 'Other'
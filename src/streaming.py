@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from streaming_api import *
+
+
+class MomentAccumulator(object):
+    """Mergeable accumulator of count, mean, second to fourth central moment sums, minimum,
+    and maximum
+
+    Batches are summarized with NumPy and combined with the pairwise update formulas of
+    Pebay (2008), so results match a single pass over all data up to rounding regardless of
+    how the data was split.
+    """
+    def __init__(self):
+        self.n    = 0
+        self.mean = 0.0
+        self.M2   = 0.0
+        self.M3   = 0.0
+        self.M4   = 0.0
+        self.min  = np.inf
+        self.max  = -np.inf
+
+
+    def update(self, values):
+        """Adds a batch of values
+
+        Parameters
+        ----------
+        values : 1d array-like
+            Values without missing values
+
+        Returns
+        -------
+        None
+        """
+        if values.shape[0] == 0: return
+        batch      = MomentAccumulator()
+        batch.n    = values.shape[0]
+        batch.mean, m2, m3, m4 = utils.central_moments(values, shift=values.mean())
+        batch.M2, batch.M3, batch.M4 = batch.n*m2, batch.n*m3, batch.n*m4
+        batch.min, batch.max = values.min(), values.max()
+        self.merge(batch)
+
+
+    def merge(self, other):
+        """Combines another accumulator into this one
+
+        Parameters
+        ----------
+        other : MomentAccumulator
+            Accumulator to combine
+
+        Returns
+        -------
+        None
+        """
+        if other.n == 0: return
+        if self.n == 0:
+            self.__dict__.update(other.__dict__)
+            return
+
+        na, nb = float(self.n), float(other.n)
+        n      = na + nb
+        delta  = other.mean - self.mean
+
+        M2 = self.M2 + other.M2 + delta**2*na*nb/n
+        M3 = self.M3 + other.M3 + delta**3*na*nb*(na - nb)/n**2 + \
+             3*delta*(na*other.M2 - nb*self.M2)/n
+        M4 = self.M4 + other.M4 + delta**4*na*nb*(na**2 - na*nb + nb**2)/n**3 + \
+             6*delta**2*(na**2*other.M2 + nb**2*self.M2)/n**2 + \
+             4*delta*(na*other.M3 - nb*self.M3)/n
+
+        self.n, self.mean         = self.n + other.n, self.mean + delta*nb/n
+        self.M2, self.M3, self.M4 = M2, M3, M4
+        self.min, self.max        = min(self.min, other.min), max(self.max, other.max)
+
+
+    def variance(self):
+        """Returns biased variance"""
+        return self.M2/self.n if self.n > 0 else np.nan
+
+
+    def skewness(self):
+        """Returns biased skewness, same as scipy.stats.skew"""
+        if self.n == 0: return np.nan
+        return np.sqrt(self.n)*self.M3/self.M2**1.5 if self.M2 > 0 else 0.0
+
+
+    def kurtosis(self):
+        """Returns biased Fisher kurtosis, same as scipy.stats.kurtosis"""
+        if self.n == 0: return np.nan
+        return self.n*self.M4/self.M2**2 - 3 if self.M2 > 0 else -3.0
+
+
+class KLLSketch(object):
+    """Mergeable quantile sketch of Karnin, Lang, and Liberty (2016)
+
+    Values are kept in a hierarchy of compactors where an item at level h stands for 2**h
+    values. When a level exceeds its capacity it is sorted and every other item, starting at
+    a random offset, is promoted to the next level. Capacities shrink geometrically by KLL_C
+    towards lower levels, so the sketch holds about k/(1 - KLL_C) items no matter how many
+    values are added.
+
+    Error bound: the rank of any returned quantile is within about 1.65% of n of the true rank
+    with 99% confidence for k = 200 (KLL_K), with error decreasing roughly as 1/k.
+
+    Parameters
+    ----------
+    k : int
+        Capacity of highest compactor level, controls accuracy
+
+    seed : int or None
+        Seed for random offsets used when compacting
+    """
+    def __init__(self, k=KLL_K, seed=None):
+        self.k      = k
+        self.n      = 0
+        self.levels = [np.empty(0)]
+        self._rng   = np.random.RandomState(seed)
+
+
+    def _capacity(self, level):
+        """Returns capacity of compactor level"""
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k*KLL_C**depth)), KLL_MIN_LEVEL)
+
+
+    def _compress(self):
+        """Compacts every level that exceeds its capacity, from lowest level up"""
+        level = 0
+        while level < len(self.levels):
+            if self.levels[level].shape[0] > self._capacity(level):
+                if level + 1 == len(self.levels): self.levels.append(np.empty(0))
+                items = np.sort(self.levels[level])
+
+                # Odd item out stays at this level so no weight is lost
+                if items.shape[0] % 2:
+                    self.levels[level], items = items[-1:], items[:-1]
+                else:
+                    self.levels[level] = np.empty(0)
+
+                offset                 = self._rng.randint(2)
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], items[offset::2]])
+            level += 1
+
+
+    def update(self, values):
+        """Adds a batch of values
+
+        Parameters
+        ----------
+        values : 1d array-like
+            Values without missing values
+
+        Returns
+        -------
+        None
+        """
+        self.levels[0] = np.concatenate([self.levels[0], np.asarray(values, dtype=np.float64)])
+        self.n        += values.shape[0]
+        self._compress()
+
+
+    def merge(self, other):
+        """Combines another sketch into this one
+
+        Parameters
+        ----------
+        other : KLLSketch
+            Sketch to combine
+
+        Returns
+        -------
+        None
+        """
+        while len(self.levels) < len(other.levels): self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+
+
+    def _weighted_items(self):
+        """Returns sorted items and cumulative weights"""
+        items   = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level.shape[0], 2.0**h) for h, level in enumerate(self.levels)])
+        order   = np.argsort(items, kind='mergesort')
+        return items[order], np.cumsum(weights[order])
+
+
+    def quantiles(self, q):
+        """Estimates quantiles
+
+        Parameters
+        ----------
+        q : list
+            Quantiles to estimate, each in [0, 1]
+
+        Returns
+        -------
+        1d array-like
+            Estimated quantiles
+        """
+        if self.n == 0: return np.full(len(q), np.nan)
+        items, cumulative = self._weighted_items()
+        target = np.asarray(q, dtype=np.float64)*cumulative[-1]
+        idx    = np.minimum(np.searchsorted(cumulative, target, side='left'), items.shape[0] - 1)
+        return items[idx]
+
+
+    def cdf(self, values):
+        """Estimates fraction of values less than each given value
+
+        Parameters
+        ----------
+        values : 1d array-like
+            Values to evaluate
+
+        Returns
+        -------
+        1d array-like
+            Estimated fractions
+        """
+        if self.n == 0: return np.full(len(values), np.nan)
+        items, cumulative = self._weighted_items()
+        idx = np.searchsorted(items, values, side='left')
+        return np.where(idx > 0, cumulative[np.maximum(idx - 1, 0)], 0.0)/cumulative[-1]
+
+
+class StreamingStatistics(object):
+    """Descriptive statistics and frequency table of one variable accumulated chunk by chunk
+
+    Numeric variables use a MomentAccumulator and a KLLSketch, so memory does not grow with the
+    number of rows. Other variables keep exact counts of each unique value until there are
+    more than sketches.APPROX_MIN_UNIQUE of them, then switch to a sketches.FrequencySketch.
+
+    Parameters
+    ----------
+    name : str
+        Name of variable
+
+    k : int
+        Size of quantile sketch
+    """
+    def __init__(self, name, k=KLL_K):
+        self.name     = name
+        self.dtype    = None
+        self.numeric  = None
+        self.moments  = MomentAccumulator()
+        self.sketch   = KLLSketch(k=k)
+        self.counts   = None
+        self.frequent = None # Sketch replacing counts of high-cardinality variables
+        self.minimum  = None # Range of high-cardinality variables, which have no sorted counts
+        self.maximum  = None
+
+
+    def _update_range(self, values):
+        """Widens range of high-cardinality variable to include values"""
+        values = np.asarray(values, dtype=object)
+        if values.shape[0] == 0: return
+        lower, upper = np.min(values), np.max(values)
+        self.minimum = lower if self.minimum is None else min(self.minimum, lower)
+        self.maximum = upper if self.maximum is None else max(self.maximum, upper)
+
+
+    def _update_dtype(self, dtype):
+        """Widens data type to hold values of another chunk, numeric types are promoted and
+        any other mix becomes object"""
+        numeric = ('bool', 'int', 'uint', 'float')
+        if self.dtype is None or dtype == self.dtype:
+            self.dtype = dtype
+        elif self.dtype.startswith(numeric) and dtype.startswith(numeric):
+            self.dtype = str(np.promote_types(self.dtype, dtype))
+        else:
+            self.dtype = 'object'
+
+
+    def _approximate(self):
+        """Moves exact counts into a frequency sketch, which all later values are added to"""
+        self.frequent = sketches.FrequencySketch()
+        if self.counts is not None:
+            self._update_range(self.counts.index)
+            self.frequent.update(self.counts.index, counts=self.counts.values.astype(np.int64))
+        self.counts = None
+
+
+    def update(self, data):
+        """Adds a chunk of the variable
+
+        Parameters
+        ----------
+        data : pandas Series
+            Chunk of variable
+
+        Returns
+        -------
+        None
+        """
+        numeric = bool(utils.is_numeric(data))
+        self._update_dtype(str(data.dtypes))
+        if self.numeric is None:
+            self.numeric = numeric
+        elif self.numeric and not numeric:
+            raise ValueError("Variable %s contains non-numeric values after row %d" % \
+                             (self.name, self.moments.n))
+
+        if self.numeric:
+            values = np.asarray(data, dtype=np.float64)
+            values = values[~np.isnan(values)]
+            self.moments.update(values)
+            self.sketch.update(values)
+        elif self.frequent is not None:
+            values = data.dropna()
+            self._update_range(values)
+            self.frequent.update(values)
+        else:
+            counts      = pd.value_counts(data)
+            self.counts = counts if self.counts is None else self.counts.add(counts, fill_value=0)
+            if self.counts.shape[0] > sketches.APPROX_MIN_UNIQUE: self._approximate()
+
+
+    def merge(self, other):
+        """Combines statistics accumulated separately, such as from another file or process
+
+        Parameters
+        ----------
+        other : StreamingStatistics
+            Statistics to combine
+
+        Returns
+        -------
+        None
+        """
+        if self.numeric is None: self.numeric = other.numeric
+        if other.dtype is not None: self._update_dtype(other.dtype)
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        if other.frequent is not None or (other.counts is not None and self.frequent is not None):
+            if self.frequent is None: self._approximate()
+            if other.frequent is not None:
+                self._update_range([value for value in [other.minimum, other.maximum] 
+                                    if value is not None])
+                self.frequent.merge(other.frequent)
+            else:
+                self._update_range(other.counts.index)
+                self.frequent.update(other.counts.index, 
+                                     counts=other.counts.values.astype(np.int64))
+
+        elif other.counts is not None:
+            self.counts = other.counts if self.counts is None else \
+                          self.counts.add(other.counts, fill_value=0)
+            if self.counts.shape[0] > sketches.APPROX_MIN_UNIQUE: self._approximate()
+
+
+    def statistics(self):
+        """Returns statistics with same keys as utils.univariate_statistics
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        results : OrderedDict
+            Statistic names mapped to values, percentiles and median are estimates
+        """
+        results = OrderedDict()
+        if self.numeric:
+            m    = self.moments
+            pcts = self.sketch.quantiles([p/100.0 for p in STREAM_PERCENTILES])
+            results['Mean']     = m.mean if m.n > 0 else np.nan
+            results['Median']   = pcts[3]
+            results['Variance'] = m.variance()
+            results['SD']       = np.sqrt(results['Variance'])
+            results['Skewness'] = m.skewness()
+            results['Kurtosis'] = m.kurtosis()
+            results['CV']       = np.float64(results['SD'])/results['Mean']
+            results['Minimum']  = m.min if m.n > 0 else np.nan
+            results['Maximum']  = m.max if m.n > 0 else np.nan
+            results['P 0.5%']   = pcts[0]
+            results['P 2.5%']   = pcts[1]
+            results['P 25%']    = pcts[2]
+            results['P 75%']    = pcts[4]
+            results['P 97.5%']  = pcts[5]
+            results['P 99.5%']  = pcts[6]
+            results['IQR']      = results['P 75%'] - results['P 25%']
+
+        elif self.frequent is not None:
+            summary                = self.frequent.statistics()
+            results['Unique']      = summary['Unique']
+            results['Mode']        = summary['Mode']
+            results['Minimum']     = self.minimum
+            results['Maximum']     = self.maximum
+            results['Unique SE']   = summary['Unique SE']
+            results['Count Error'] = summary['Count Error']
+
+        else:
+            counts             = self.counts.sort_index()
+            results['Unique']  = counts.shape[0]
+            results['Mode']    = counts.idxmax()
+            results['Minimum'] = counts.index[0]
+            results['Maximum'] = counts.index[-1]
+
+        return results
+
+
+    def frequencies(self, rule=utils.DEFAULT_BIN_RULE, bin_width=None, n_bins=utils.QUANTILE_BINS):
+        """Returns frequency table in same format as the in-memory tables
+
+        For numeric variables, bins are chosen from the accumulated moments and quantile 
+        sketch, see utils.bin_edges, and counts per bin are estimated from the sketch, so they
+        carry the sketch's rank error.
+
+        Parameters
+        ----------
+        rule : str
+            One of utils.BIN_RULES
+
+        bin_width : float
+            Width of bins of Fixed Width rule
+
+        n_bins : int
+            Number of bins of Quantile rule
+
+        Returns
+        -------
+        pandas DataFrame or Series
+            Grouped frequency table for numeric variables, otherwise counts of each value or,
+            for high-cardinality variables, of most frequent values and all others
+        """
+        if not self.numeric:
+            if self.frequent is not None: return self.frequent.frequencies()
+            return self.counts.astype(int).sort_values(ascending=False)
+
+        m = self.moments
+        if m.n == 0: return pd.DataFrame([], columns=['Count'])
+
+        edges = utils.bin_edges(m.n, m.min, m.max, rule=rule, skewness=m.skewness(), 
+                                quantiles=self.sketch.quantiles, bin_width=bin_width, 
+                                n_bins=n_bins)
+
+        # Counts between edges from sketch, last bin closed on right
+        cdf     = self.sketch.cdf(edges)
+        cdf[-1] = 1.0
+        counts  = np.round(np.diff(cdf)*m.n).astype(int)
+        return pd.DataFrame(counts, columns=['Count'], index=utils.bin_labels(edges))
+
+
+def streaming_statistics(filename, columns=None, chunksize=utils.LOAD_CHUNK_SIZE, callback=None,
+                         bins=None, dtypes=None):
+    """Calculates statistics and frequency tables of variables from a chunked read of a file,
+    without holding any full variable in memory, so files larger than memory can be profiled
+    without loading them
+
+    Parameters
+    ----------
+    filename : str
+        Path to data file
+
+    columns : list or None
+        Names of columns in file, all columns if None
+
+    chunksize : int
+        Number of rows read per chunk
+
+    callback : callable or None
+        Called with (rows read, bytes read, total bytes) after each chunk, reading stops if it
+        returns True
+
+    bins : dict
+        Keyword arguments of StreamingStatistics.frequencies choosing bins, Doane's rule if
+        None
+
+    dtypes : dict
+        Names of columns mapped to data types each chunk is converted to before it is 
+        accumulated, see utils.safe_astype, columns not included keep their parsed data types
+
+    Returns
+    -------
+    results : OrderedDict or None
+        Column names mapped to (statistics, frequency table, is numeric, data type), None if 
+        reading was stopped by callback
+    """
+    columns      = None if columns is None else list(columns)
+    dtypes       = dtypes or {}
+    accumulators = None if columns is None else \
+                   OrderedDict((name, StreamingStatistics(name)) for name in columns)
+    n_rows       = 0
+    for chunk, bytes_read, total_bytes in utils.iter_data_chunks(filename, chunksize=chunksize,
+                                                                 columns=columns):
+        if accumulators is None:
+            accumulators = OrderedDict((name, StreamingStatistics(name)) for name in chunk.columns)
+
+        for name, accumulator in accumulators.iteritems():
+            data = chunk[name]
+            if name in dtypes and str(data.dtypes) != dtypes[name]:
+                data = utils.safe_astype(data, dtypes[name])
+            accumulator.update(data)
+
+        n_rows += chunk.shape[0]
+        if callback is not None and callback(n_rows, bytes_read, total_bytes): return None
+
+    bins = bins or {}
+    return OrderedDict((name, (accumulator.statistics(), accumulator.frequencies(**bins),
+                               int(accumulator.numeric), accumulator.dtype))
+                       for name, accumulator in (accumulators or OrderedDict()).iteritems())
@@ -0,0 +1,26 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Streaming statistics with mergeable accumulators and sketches for application
+""".strip()
+
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+# Custom functions
+import sketches
+import utils
+
+
+###############
+"""CONSTANTS"""
+###############
+
+# KLL sketch size. Rank error of quantiles is about 1.65% of the number of values with 99%
+# confidence for k = 200 and shrinks roughly in proportion to 1/k
+KLL_K              = 200
+KLL_C              = 2/3.0 # Capacity ratio between consecutive compactor levels
+KLL_MIN_LEVEL      = 2     # Minimum capacity of any compactor level
+STREAM_PERCENTILES = [0.5, 2.5, 25, 50, 75, 97.5, 99.5]
@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from sweep_api import *
+
+
+class Distribution(object):
+    """Distribution that random search and successive halving sample values from
+
+    Parameters
+    ----------
+    kind : str
+        Either 'uniform', 'loguniform', or 'randint' (high is exclusive)
+
+    low : float
+        Lower bound
+
+    high : float
+        Upper bound
+    """
+    def __init__(self, kind, low, high):
+        self.kind = kind
+        self.low  = low
+        self.high = high
+
+
+    def __repr__(self):
+        return '%s(%s, %s)' % (self.kind, self.low, self.high)
+
+
+    def sample(self, rng):
+        """Draws one value with a NumPy RandomState"""
+        if self.kind == 'uniform':
+            return float(rng.uniform(self.low, self.high))
+        elif self.kind == 'loguniform':
+            return float(np.exp(rng.uniform(np.log(self.low), np.log(self.high))))
+        else:
+            return int(rng.randint(self.low, self.high))
+
+
+def parse_search_value(value, default):
+    """Parses value of one parameter from parameter box into values to search over
+
+    Parameters
+    ----------
+    value : object
+        Value from parameter box. Lists and strings such as "range(1, 10)",
+        "linspace(0.1, 1, 10)", "logspace(-3, 3, 7)", "uniform(0, 1)", "loguniform(1e-3, 1e3)",
+        or "randint(1, 100)" are searched over
+
+    default : object
+        Default value of parameter, parameters that take lists are only searched over lists
+        of lists
+
+    Returns
+    -------
+    values : list, Distribution, or None
+        Values to search over, or None if value is fixed
+    """
+    if isinstance(value, basestring):
+        match = SEARCH_PATTERN.match(value)
+        if match is None: return None
+
+        kind = match.group(1)
+        try:
+            args = [float(arg) for arg in match.group(2).split(',')]
+        except ValueError:
+            raise ValueError('Invalid arguments in %s' % value)
+
+        if kind == 'range':
+            if not 1 <= len(args) <= 3: raise ValueError('range needs 1 to 3 arguments')
+            return list(range(*map(int, args)))
+        elif kind in ['linspace', 'logspace']:
+            if len(args) != 3: raise ValueError('%s needs start, stop, and number of values' % kind)
+            return getattr(np, kind)(args[0], args[1], int(args[2])).tolist()
+        else:
+            if len(args) != 2: raise ValueError('%s needs low and high' % kind)
+            return Distribution(kind, args[0], args[1])
+
+    if isinstance(value, list):
+        if isinstance(default, (list, tuple)) and not all(isinstance(v, list) for v in value):
+            return None
+        if not value: raise ValueError('Empty list of values')
+        return value
+
+    return None
+
+
+def parse_search_space(params, defaults):
+    """Splits parameters from parameter box into fixed values and values to search over
+
+    Parameters
+    ----------
+    params : dict
+        Parameters from parameter box
+
+    defaults : dict
+        Default parameters of model
+
+    Returns
+    -------
+    fixed : dict
+        Parameters with one value
+
+    space : OrderedDict
+        Parameters mapped to list of values or Distribution, empty if nothing is searched
+    """
+    fixed, space = {}, OrderedDict()
+    for key in sorted(params):
+        values = parse_search_value(params[key], defaults.get(key))
+        if values is None:
+            fixed[key] = params[key]
+        elif isinstance(values, list) and len(values) == 1:
+            fixed[key] = values[0]
+        else:
+            space[key] = values
+    return fixed, space
+
+
+def grid_candidates(space):
+    """Returns every combination of values in search space"""
+    for key, values in space.iteritems():
+        if isinstance(values, Distribution):
+            raise ValueError('Grid search needs lists or ranges, %s is %r' % (key, values))
+
+    keys = list(space.keys())
+    return [dict(zip(keys, combo)) for combo in itertools.product(*[space[key] for key in keys])]
+
+
+def random_candidates(space, n_trials, random_state):
+    """Samples distinct combinations of values in search space, or returns the full grid if
+    it has no more than n_trials combinations"""
+    if not any(isinstance(values, Distribution) for values in space.itervalues()):
+        if reduce(lambda n, values: n*len(values), space.itervalues(), 1) <= n_trials:
+            return grid_candidates(space)
+
+    rng, candidates, seen = np.random.RandomState(random_state), [], set()
+    for _ in xrange(10*n_trials):
+        if len(candidates) == n_trials: break
+        params = {}
+        for key, values in space.iteritems():
+            if isinstance(values, Distribution):
+                params[key] = values.sample(rng)
+            else:
+                params[key] = values[rng.randint(len(values))]
+
+        if repr(sorted(params.items())) in seen: continue
+        seen.add(repr(sorted(params.items())))
+        candidates.append(params)
+
+    return candidates
+
+
+class Trial(object):
+    """One combination of parameters evaluated by a sweep
+
+    Parameters
+    ----------
+    trial_id : int
+        Number of trial
+
+    params : dict
+        Parameters searched over
+    """
+    def __init__(self, trial_id, params):
+        self.id     = trial_id
+        self.params = params
+        self.scores = {} # Fold number mapped to score
+        self.status = 'Running'
+        self.rung   = 0
+        self.rows   = None
+
+
+    def loss(self, model_type):
+        """Mean score so far, oriented so lower is better"""
+        if not self.scores: return np.inf
+        mean = np.mean(self.scores.values())
+        return mean if model_type == 'Regression' else -mean
+
+
+    def summary(self):
+        """Returns dictionary describing trial"""
+        scores = self.scores.values()
+        return {'id': self.id, 'params': self.params, 'status': self.status, 'rung': self.rung,
+                'rows': self.rows, 'n_folds': len(scores),
+                'mean': np.mean(scores) if scores else np.nan,
+                'std': np.std(scores) if scores else np.nan}
+
+
+def leaderboard(trials, model_type, top_n=None):
+    """Ranks trials, those that got further first and then by mean score
+
+    Parameters
+    ----------
+    trials : list
+        Trials of sweep
+
+    model_type : str
+        Either 'Regression' or 'Classification'
+
+    top_n : int
+        Number of trials returned, all if None
+
+    Returns
+    -------
+    list
+        Summary of each trial from best to worst
+    """
+    ranked = sorted(trials, key=lambda t: (t.status.startswith('Failed'), -t.rung,
+                                           -len(t.scores), t.loss(model_type)))
+    return [trial.summary() for trial in ranked[:top_n]]
+
+
+def format_leaderboard(rows, model_type):
+    """Formats leaderboard as text for model summary
+
+    Parameters
+    ----------
+    rows : list
+        Trial summaries from leaderboard
+
+    model_type : str
+        Either 'Regression' or 'Classification'
+
+    Returns
+    -------
+    str
+        One line per trial
+    """
+    metric_str = 'Accuracy' if model_type == 'Classification' else 'Mean Squared Error'
+    lines      = []
+    for rank, row in enumerate(rows, 1):
+        rows_str = '' if row['rows'] is None else ', %d rows' % row['rows']
+        lines.append("%d. %s = %.3f +/- %.3f (%d folds%s) [%s]\n   %s" % \
+                     (rank, metric_str, row['mean'], row['std'], row['n_folds'], rows_str,
+                      row['status'], json.dumps(row['params'], sort_keys=True)))
+    return '\n'.join(lines) + '\n'
+
+
+def _fit_trial_fold(task):
+    """Fits one fold of one trial, returning its score or the error that stopped the fit"""
+    try:
+        return utils.fit_fold(task)[3], None
+    except Exception as e:
+        return None, str(e)
+
+
+def _evaluate(pool, pairs, splits, model, model_type, report, rows=None):
+    """Fits (trial, fold) pairs on pool, recording scores and failures on trials
+
+    Parameters
+    ----------
+    pool : multiprocessing Pool
+        Pool whose workers hold features and labels
+
+    pairs : list
+        (trial, fold number) to fit
+
+    splits : list
+        (train indices, test indices) of each fold
+
+    model : sklearn estimator
+        Model with fixed parameters set
+
+    model_type : str
+        Either 'Regression' or 'Classification'
+
+    report : function
+        Called with number of fits finished after each fit
+
+    rows : int
+        Number of training rows used per fold, all if None
+
+    Returns
+    -------
+    None
+    """
+    from sklearn.base import clone
+
+    tasks = []
+    for trial, fold in pairs:
+        train_idx, test_idx = splits[fold]
+        if rows is not None: train_idx = train_idx[:rows]
+        tasks.append((fold, train_idx, test_idx, clone(model).set_params(**trial.params),
+                      model_type, None, None))
+
+    for n_done, ((trial, fold), (score, error)) in \
+            enumerate(zip(pairs, pool.imap(_fit_trial_fold, tasks)), 1):
+        if error is not None:
+            trial.status = 'Failed: %s' % error
+        elif not trial.status.startswith('Failed'):
+            trial.scores[fold] = score
+        report(n_done)
+
+
+def _median_pruning(pool, trials, splits, model, model_type, progress):
+    """Evaluates trials one fold at a time, pruning trials whose mean score so far is worse
+    than the median of trials still running"""
+    n_splits = len(splits)
+    for fold in xrange(n_splits):
+        active = [trial for trial in trials if trial.status == 'Running']
+        report = lambda n_done: progress("Fold %d of %d: %d of %d trials" % \
+                                         (fold+1, n_splits, n_done, len(active)),
+                                         leaderboard(trials, model_type, LEADERBOARD_SIZE))
+        _evaluate(pool, [(trial, fold) for trial in active], splits, model, model_type, report)
+
+        active = [trial for trial in trials if trial.status == 'Running']
+        if fold < n_splits-1 and len(active) >= PRUNE_MIN_TRIALS:
+            median = np.median([trial.loss(model_type) for trial in active])
+            for trial in active:
+                if trial.loss(model_type) > median: trial.status = 'Pruned after fold %d' % (fold+1)
+
+    for trial in trials:
+        if trial.status == 'Running': trial.status = 'Complete'
+
+
+def _successive_halving(pool, trials, splits, model, model_type, progress):
+    """Evaluates trials on growing subsamples of rows, keeping the best 1/HALVING_FACTOR of
+    trials at each rung until the last rung uses all rows"""
+    n_train = min(len(train_idx) for train_idx, _ in splits)
+    n_rungs = int(np.ceil(np.log(max(len(trials), 1))/np.log(HALVING_FACTOR))) + 1
+    active  = list(trials)
+
+    for rung in xrange(n_rungs):
+        rows = n_train//HALVING_FACTOR**(n_rungs-rung-1)
+        rows = n_train if rung == n_rungs-1 else min(n_train, max(HALVING_MIN_ROWS, rows))
+        for trial in active: trial.rung, trial.rows, trial.scores = rung, rows, {}
+
+        pairs  = [(trial, fold) for trial in active for fold in xrange(len(splits))]
+        report = lambda n_done: progress("Rung %d of %d (%d rows): %d of %d fits" % \
+                                         (rung+1, n_rungs, rows, n_done, len(pairs)),
+                                         leaderboard(trials, model_type, LEADERBOARD_SIZE))
+        _evaluate(pool, pairs, splits, model, model_type, report, rows=rows)
+
+        active = sorted([trial for trial in active if trial.status == 'Running'],
+                        key=lambda trial: trial.loss(model_type))
+        if rung < n_rungs-1:
+            n_keep = int(np.ceil(len(active)/float(HALVING_FACTOR)))
+            for trial in active[n_keep:]: trial.status = 'Stopped at rung %d' % (rung+1)
+            active = active[:n_keep]
+
+    for trial in active: trial.status = 'Complete'
+
+
+def run_sweep(X, y, model, model_type, space, strategy, n_trials=SWEEP_N_TRIALS,
+              n_jobs=SWEEP_N_JOBS, random_state=utils.CV_RANDOM_STATE, progress=None):
+    """Searches over model parameters with cross-validation, used as the task run by sweep jobs
+
+    All trials share the same folds, and fits of different trials run concurrently on a
+    process pool whose workers receive the data once
+
+    Parameters
+    ----------
+    X : 2d array-like
+        Features
+
+    y : 1d array-like
+        Labels
+
+    model : sklearn estimator
+        Model with fixed parameters set
+
+    model_type : str
+        Either 'Regression' or 'Classification'
+
+    space : OrderedDict
+        Parameters mapped to list of values or Distribution
+
+    strategy : str
+        One of SWEEP_STRATEGIES
+
+    n_trials : int
+        Number of trials sampled by random search and successive halving
+
+    n_jobs : int
+        Number of worker processes
+
+    random_state : int
+        Seed of folds and sampled trials
+
+    progress : function
+        Called with a progress message and the current leaderboard
+
+    Returns
+    -------
+    list
+        Summary of every trial from best to worst
+    """
+    if model_type not in ['Regression', 'Classification']:
+        raise ValueError('Sweeps need a regression or classification model')
+    if progress is None: progress = lambda message, data=None: None
+
+    # Define trials
+    if strategy == 'Grid':
+        candidates = grid_candidates(space)
+    else:
+        candidates = random_candidates(space, n_trials, random_state)
+    trials = [Trial(i+1, params) for i, params in enumerate(candidates)]
+
+    # Shuffle training rows once, so subsamples of successive halving are nested and random
+    rng    = np.random.RandomState(random_state)
+    splits = [(rng.permutation(train_idx), test_idx)
+              for train_idx, test_idx in utils.cv_splits(X, y, model_type, random_state)]
+
+    pool = multiprocessing.Pool(processes=max(1, n_jobs), initializer=utils.init_fold_worker,
+                                initargs=(X, y))
+    try:
+        if strategy == 'Successive Halving':
+            _successive_halving(pool, trials, splits, model, model_type, progress)
+        else:
+            _median_pruning(pool, trials, splits, model, model_type, progress)
+    finally:
+        pool.terminate()
+        pool.join()
+
+    return leaderboard(trials, model_type)
@@ -0,0 +1,32 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Hyperparameter sweeps with cross-validation and early pruning for application
+""".strip()
+
+from collections import OrderedDict
+import itertools
+import json
+import multiprocessing
+import numpy as np
+import re
+
+# Custom functions
+import utils
+
+
+###############
+"""CONSTANTS"""
+###############
+
+SWEEP_STRATEGIES = ['Grid', 'Random', 'Successive Halving']
+SWEEP_N_TRIALS   = 20   # Trials sampled by random search and successive halving
+SWEEP_N_JOBS     = multiprocessing.cpu_count()
+PRUNE_MIN_TRIALS = 5    # Trials needed at a fold before trials worse than median are pruned
+HALVING_FACTOR   = 3    # Successive halving keeps best 1/HALVING_FACTOR trials per rung
+HALVING_MIN_ROWS = 1000 # Training rows per fold in first rung of successive halving
+LEADERBOARD_SIZE = 10
+
+# Search values written as strings in parameter box, e.g. "logspace(-3, 3, 7)"
+SEARCH_PATTERN   = re.compile(r'^\s*(range|linspace|logspace|uniform|loguniform|randint)\((.*)\)\s*$')
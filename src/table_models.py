@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from table_models_api import *
+
+
+def format_value(value):
+    """Formats a table value for display, showing counts as integers
+
+    Parameters
+    ----------
+    value : object
+        Value in table
+
+    Returns
+    -------
+    str
+        Formatted value
+    """
+    if value is None: return ''
+    if isinstance(value, (int, long, np.integer)) and not isinstance(value, (bool, np.bool_)):
+        return '%d' % value
+    return utils.format_statistic(value)
+
+
+class ResultTableModel(QtCore.QAbstractTableModel):
+    """Read-only table model holding results column by column
+
+    Values are only formatted when a view asks for a visible cell, so tables with millions of
+    rows are populated in one reset instead of one item per cell.
+
+    Parameters
+    ----------
+    headers : list
+        Names of columns
+
+    selectable : bool
+        Whether rows can be selected
+    """
+    def __init__(self, headers, parent=None, selectable=False):
+        QtCore.QAbstractTableModel.__init__(self, parent)
+        self.headers    = list(headers)
+        self.selectable = selectable
+        self._columns   = [[] for _ in self.headers]
+
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns[0])
+
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid(): return None
+        if role == QtCore.Qt.DisplayRole:
+            return format_value(self._columns[index.column()][index.row()])
+        elif role == QtCore.Qt.TextAlignmentRole:
+            return ALIGN_CENTER
+        return None
+
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+
+    def flags(self, index):
+        if self.selectable: return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        return QtCore.Qt.ItemIsEnabled
+
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """Sorts rows by values of a column, placing missing values last"""
+        values = self._columns[column]
+        rows   = sorted(xrange(len(values)), key=lambda i: (values[i] is None, values[i]),
+                        reverse=order == QtCore.Qt.DescendingOrder)
+
+        self.layoutAboutToBeChanged.emit()
+        self._columns = [[col[i] for i in rows] for col in self._columns]
+        self.layoutChanged.emit()
+
+
+    def set_columns(self, columns):
+        """Replaces all rows of table in bulk
+
+        Parameters
+        ----------
+        columns : list
+            One sequence of values per column, all of equal length
+
+        Returns
+        -------
+        None
+        """
+        self.beginResetModel()
+        self._columns = [col for col in columns]
+        self.endResetModel()
+
+
+    def set_frequencies(self, freq):
+        """Replaces all rows of table with a frequency table
+
+        Parameters
+        ----------
+        freq : pandas Series or pandas DataFrame
+            Counts indexed by value, or grouped frequency table with one count column
+
+        Returns
+        -------
+        None
+        """
+        counts = freq.iloc[:, 0] if isinstance(freq, pd.DataFrame) else freq
+        self.set_columns([map(str, counts.index), counts.values])
+
+
+    def append_row(self, row):
+        """Adds one row to bottom of table
+
+        Parameters
+        ----------
+        row : list
+            One value per column
+
+        Returns
+        -------
+        None
+        """
+        idx = self.rowCount()
+        self.beginInsertRows(QtCore.QModelIndex(), idx, idx)
+        for i, value in enumerate(row):
+            if not isinstance(self._columns[i], list): self._columns[i] = list(self._columns[i])
+            self._columns[i].append(value)
+        self.endInsertRows()
+
+
+    def clear(self):
+        """Removes all rows"""
+        self.set_columns([[] for _ in self.headers])
+
+
+    def to_frame(self):
+        """Returns table as pandas DataFrame with one column per header"""
+        return pd.DataFrame(OrderedDict(zip(self.headers, self._columns)), columns=self.headers)
+
+
+class VariableInfoModel(QtCore.QAbstractTableModel):
+    """Table model listing each variable with its data type
+
+    Edits are not applied by the model itself. Instead they are emitted as signals, and the
+    application calls set_name or set_dtype once an edit has been validated, so rejected
+    edits leave the table unchanged.
+    """
+    # Define signals
+    name_edited  = QtCore.Signal(int, str)
+    dtype_edited = QtCore.Signal(int, str)
+
+    HEADERS = ['Variable Name', 'Data Type']
+
+    def __init__(self, parent=None):
+        QtCore.QAbstractTableModel.__init__(self, parent)
+        self._names  = []
+        self._labels = []
+
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid(): return None
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self._names[index.row()] if index.column() == 0 else self._labels[index.row()]
+        elif role == QtCore.Qt.TextAlignmentRole:
+            return ALIGN_CENTER
+        return None
+
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+    def flags(self, index):
+        # Make 'Sample' variable not editable
+        if self._names[index.row()] == 'Sample': return QtCore.Qt.ItemIsEnabled
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEditable
+
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or role != QtCore.Qt.EditRole: return False
+        row, value = index.row(), str(value)
+        if index.column() == 0:
+            if value != self._names[row]: self.name_edited.emit(row, value)
+        else:
+            if value != self._labels[row]: self.dtype_edited.emit(row, value)
+        return False
+
+
+    def set_variables(self, names, dtypes):
+        """Replaces all variables in bulk
+
+        Parameters
+        ----------
+        names : list
+            Names of variables
+
+        dtypes : list
+            Data types of variables as strings
+
+        Returns
+        -------
+        None
+        """
+        self.beginResetModel()
+        self._names  = list(names)
+        self._labels = [utils.DTYPE_TO_LABEL.get(dtype, dtype) for dtype in dtypes]
+        self.endResetModel()
+
+
+    def set_name(self, row, name):
+        """Updates name of variable in a row"""
+        self._names[row] = name
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 0))
+
+
+    def set_dtype(self, row, dtype):
+        """Updates data type of variable in a row"""
+        self._labels[row] = utils.DTYPE_TO_LABEL.get(dtype, dtype)
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 1))
+
+
+    def clear(self):
+        """Removes all variables"""
+        self.set_variables([], [])
+
+
+class ComboBoxDelegate(QStyledItemDelegate):
+    """Item delegate editing a cell with a combo box, which is only created while the cell is
+    being edited instead of once per row
+
+    Parameters
+    ----------
+    items : list
+        Choices in combo box
+    """
+    def __init__(self, items, parent=None):
+        QStyledItemDelegate.__init__(self, parent)
+        self.items = list(items)
+
+
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.addItems(self.items)
+        editor.activated.connect(self._commit)
+        return editor
+
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentIndex(editor.findText(index.data(QtCore.Qt.EditRole),
+                                               QtCore.Qt.MatchFixedString))
+
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), QtCore.Qt.EditRole)
+
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+
+    def _commit(self):
+        """Applies choice as soon as it is made and closes editor"""
+        editor = self.sender()
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor, QStyledItemDelegate.NoHint)
@@ -0,0 +1,22 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Table models and delegates backing table views in application
+""".strip()
+
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from PySide import QtCore
+from PySide.QtGui import QComboBox, QStyledItemDelegate
+
+# Custom functions
+import utils
+
+
+###############
+"""CONSTANTS"""
+###############
+
+ALIGN_CENTER = QtCore.Qt.AlignHCenter | QtCore.Qt.AlignVCenter
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+# Import libraries from api
+from tracing_api import *
+
+
+def peak_rss_mb():
+    """Returns peak resident memory of current process in MB, or None if not available"""
+    if resource is None: return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/float(MAXRSS_TO_MB)
+
+
+def cpu_seconds():
+    """Returns user and system CPU time of current process in seconds"""
+    times = os.times()
+    return times[0] + times[1]
+
+
+class Stage(object):
+    """Context manager measuring wall time, CPU time, and peak memory of a stage of work
+
+    CPU time and peak memory are of the whole process, so they include other threads running
+    at the same time. Peak memory only grows, so growth is how much the stage raised the peak.
+    Set rows inside the block once the number of rows processed is known, and status to
+    record an outcome other than 'Finished' or 'Failed'.
+
+    Parameters
+    ----------
+    name : str
+        Name of stage
+
+    rows : int
+        Number of rows processed, if known before stage starts
+
+    profile_dir : str
+        Directory to write a cProfile dump of stage to, None to not profile
+
+    callback : function
+        Called with record of stage when it ends
+    """
+    def __init__(self, name, rows=None, profile_dir=None, callback=None):
+        self.name        = name
+        self.rows        = rows
+        self.status      = None
+        self.profile_dir = profile_dir
+        self.callback    = callback
+        self.record      = None
+        self._profiler   = None
+
+
+    def __enter__(self):
+        self._started = time.time()
+        self._cpu     = cpu_seconds()
+        self._rss     = peak_rss_mb()
+        if self.profile_dir is not None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        wall, cpu = time.time() - self._started, cpu_seconds() - self._cpu
+        rss       = peak_rss_mb()
+
+        # Profile is dumped next to log, named after when and what ran
+        profile = None
+        if self._profiler is not None:
+            self._profiler.disable()
+            name    = ''.join(c if c.isalnum() else '_' for c in self.name)
+            profile = os.path.join(self.profile_dir, '%s_%s_%d.prof' % \
+                                   (time.strftime('%Y%m%d_%H%M%S', time.localtime(self._started)),
+                                    name, threading.current_thread().ident))
+            try:
+                if not os.path.isdir(self.profile_dir): os.makedirs(self.profile_dir)
+                self._profiler.dump_stats(profile)
+            except (IOError, OSError):
+                profile = None
+
+        if exc_type is not None:
+            status = 'Failed: %s' % exc_value
+        else:
+            status = self.status or 'Finished'
+
+        self.record = {'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._started)),
+                       'stage': self.name, 'wall': wall, 'cpu': cpu, 'peak_rss': rss,
+                       'rss_growth': rss - self._rss if rss is not None else None, 
+                       'rows': self.rows, 'status': status, 'profile': profile, 
+                       'pid': os.getpid()}
+        if self.callback is not None: self.callback(self.record)
+        return False # Exceptions are raised as usual
+
+
+class Tracer(object):
+    """Records stages of work to a rolling log and keeps the latest records in memory
+
+    Records can come from any thread. Listeners are called in the thread a stage ran in, so
+    GUI listeners should hand records to the GUI thread with a signal.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of log and cProfile dumps
+
+    history_size : int
+        Number of records kept in memory
+    """
+    def __init__(self, directory=TRACE_DIR, history_size=TRACE_HISTORY_SIZE):
+        self.directory = directory
+        self.log_path  = os.path.join(directory, TRACE_LOG_NAME)
+        self.history   = deque(maxlen=history_size)
+        self.listeners = []
+        self.profiling = False # Whether stages are wrapped in cProfile
+        self._lock     = threading.Lock()
+
+        # A log that cannot be written should not stop the application, records are still
+        # kept in memory
+        self.logger = logging.getLogger('eda_viewer.trace.%d' % id(self))
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        try:
+            if not os.path.isdir(directory): os.makedirs(directory)
+            handler = RotatingFileHandler(self.log_path, maxBytes=TRACE_LOG_MAX_BYTES,
+                                          backupCount=TRACE_LOG_BACKUPS)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self.logger.addHandler(handler)
+        except (IOError, OSError):
+            self.log_path = None
+
+
+    def stage(self, name, rows=None):
+        """Returns a stage recorded by this tracer when it ends, see Stage
+
+        Parameters
+        ----------
+        name : str
+            Name of stage
+
+        rows : int
+            Number of rows processed, if known before stage starts
+
+        Returns
+        -------
+        Stage
+            Context manager timing the stage
+        """
+        return Stage(name, rows=rows, profile_dir=self.directory if self.profiling else None,
+                     callback=self.add)
+
+
+    def add(self, record):
+        """Adds record of a stage to history and log, and passes it to listeners
+
+        Parameters
+        ----------
+        record : dict
+            Record of stage, see Stage
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self.history.append(record)
+            self.logger.info(json.dumps(record, sort_keys=True))
+        for listener in self.listeners: listener(record)
+
+
+    def clear(self):
+        """Removes records kept in memory, log is kept"""
+        with self._lock:
+            self.history.clear()
+
+
+def record_row(record):
+    """Returns record of a stage as one value per column of TRACE_COLUMNS"""
+    profile = os.path.basename(record['profile']) if record.get('profile') else None
+    return [record['started'], record['stage'], record['wall'], record['cpu'], 
+            record['peak_rss'], record['rss_growth'], record['rows'], record['status'], profile]
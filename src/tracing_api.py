@@ -0,0 +1,40 @@
+from __future__ import division, print_function
+
+__description__ = \
+"""
+Timing and profiling of stages of work in application, recorded to a rolling log
+""".strip()
+
+import cProfile
+from collections import deque
+import json
+import logging
+from logging.handlers import RotatingFileHandler
+import os
+import sys
+import threading
+import time
+
+# Peak memory is not available on every platform
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+###############
+"""CONSTANTS"""
+###############
+
+# Log and cProfile dumps are written here, can be overridden with an environment variable
+TRACE_DIR           = os.environ.get('EDA_VIEWER_TRACE_DIR',
+                                     os.path.join(os.path.expanduser('~'), '.eda_viewer', 'trace'))
+TRACE_LOG_NAME      = 'trace.log'
+TRACE_LOG_MAX_BYTES = 1024**2 # Size at which log rolls over to a backup
+TRACE_LOG_BACKUPS   = 3       # Number of rolled over logs kept
+TRACE_HISTORY_SIZE  = 1000    # Records kept in memory for performance panel
+TRACE_COLUMNS       = ['Started', 'Stage', 'Wall (s)', 'CPU (s)', 'Peak RSS (MB)', 
+                       'RSS Growth (MB)', 'Rows', 'Status', 'Profile']
+
+# ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+MAXRSS_TO_MB        = 1024**2 if sys.platform == 'darwin' else 1024
@@ -8,286 +8,1599 @@ from utils_api import *
 """HELPER FUNCTIONS"""
 ######################
 
-class UiLoader(QUiLoader):
-    """ADD DESCRIPTION"""
-    def __init__(self, base_instance):
-        QUiLoader.__init__(self, base_instance)
-        self.base_instance = base_instance
+def get_model(model_name, model_type):
+    """Instantiates a model with default parameters, importing its module on first use so
+    scikit-learn is not imported when the application starts
+    
+    Parameters
+    ----------
+    model_name : str
+        Name of model
+
+    model_type : str
+        Either 'Regression', 'Classification', or 'Clustering'
+    
+    Returns
+    -------
+    sklearn estimator
+        Model
+    """
+    models = {
+        'Classification': {
+            'Random Forests':         'sklearn.ensemble.RandomForestClassifier',
+            'K-Nearest Neighbors':    'sklearn.neighbors.KNeighborsClassifier',
+            'Support Vector Machine': 'sklearn.svm.SVC',
+            'Neural Network':         'sklearn.neural_network.MLPClassifier',
+            'Gaussian Process':       'sklearn.gaussian_process.GaussianProcessClassifier',
+            'Linear Model':           'sklearn.linear_model.LogisticRegression',
+            'Extra Trees':            'sklearn.ensemble.ExtraTreesClassifier',
+            'Gradient Boosting':      'sklearn.ensemble.GradientBoostingClassifier',
+            'Decision Tree':          'sklearn.tree.DecisionTreeClassifier',
+            'SGD (Streaming)':            'sklearn.linear_model.SGDClassifier',
+            'Naive Bayes (Streaming)':    'sklearn.naive_bayes.GaussianNB',
+            'Neural Network (Streaming)': 'sklearn.neural_network.MLPClassifier'
+        },
+        'Regression': {
+            'Random Forests':         'sklearn.ensemble.RandomForestRegressor',
+            'K-Nearest Neighbors':    'sklearn.neighbors.KNeighborsRegressor',
+            'Support Vector Machine': 'sklearn.svm.SVR',
+            'Neural Network':         'sklearn.neural_network.MLPRegressor',
+            'Gaussian Process':       'sklearn.gaussian_process.GaussianProcessRegressor',
+            'Linear Model':           'sklearn.linear_model.LinearRegression',
+            'Extra Trees':            'sklearn.ensemble.ExtraTreesRegressor',
+            'Gradient Boosting':      'sklearn.ensemble.GradientBoostingRegressor',
+            'Decision Tree':          'sklearn.tree.DecisionTreeRegressor',
+            'SGD (Streaming)':            'sklearn.linear_model.SGDRegressor',
+            'Neural Network (Streaming)': 'sklearn.neural_network.MLPRegressor'
+            },
+        'Clustering': {
+            'K-Means':            'sklearn.cluster.KMeans',
+            'Mini-Batch K-Means': 'sklearn.cluster.MiniBatchKMeans',
+            'DBSCAN':             'sklearn.cluster.DBSCAN',
+            'Agglomerative':      'sklearn.cluster.AgglomerativeClustering',
+            'Mini-Batch K-Means (Streaming)': 'sklearn.cluster.MiniBatchKMeans'
+        }
+    }
+
+    module_name, class_name = models[model_type][model_name].rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def pretty_print_dict(model_params):
+    """ADD
+    
+    Parameters
+    ----------
+    
+    Returns
+    -------
+    """
+    if 'pooling_func' in model_params.keys(): 
+        model_params = {k:v for k,v in model_params.items() if k != 'pooling_func'}
+    return json.dumps(model_params, indent=4).replace('null', 'None')
+
+
+def text_to_dict(model_params):
+    """ADD
+    
+    Parameters
+    ----------
+    
+    Returns
+    -------
+    """
+    return json.loads(model_params.replace('None', 'null'))
+
+
+def _import_pyarrow():
+    """Imports pyarrow, which is only required for Parquet and Feather files
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    pa : module
+        pyarrow module
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet
+        return pa
+    except ImportError:
+        raise ImportError("pyarrow is required to read and write Parquet and Feather files")
+
+
+def iter_data_chunks(filename, chunksize=LOAD_CHUNK_SIZE, columns=None):
+    """Reads a data file in chunks of rows
+
+    Parameters
+    ----------
+    filename : str
+        Path to .csv, .tsv, .txt, .parquet, or .feather file
+
+    chunksize : int
+        Number of rows parsed per chunk
+
+    columns : list or None
+        Names of columns to read. If None, all columns are read
+
+    Returns
+    -------
+    generator
+        Yields (chunk, bytes_read, total_bytes) where chunk is a pandas DataFrame
+    """
+    # Get file extension and define parser arguments
+    _, file_extension = os.path.splitext(filename)
+    if file_extension == '.csv':
+        kwargs = {}
+    elif file_extension == '.tsv':
+        kwargs = {'sep': '\t'}
+    elif file_extension == '.txt':
+        kwargs = {'delim_whitespace': True}
+    elif file_extension in COLUMNAR_EXTENSIONS:
+        kwargs = None
+    else:
+        raise ValueError("File extension %s not supported" % file_extension)
+
+    total_bytes = os.path.getsize(filename)
+
+    # Parquet files are read one batch of row groups at a time, reading only requested columns
+    if file_extension == '.parquet':
+        pa           = _import_pyarrow()
+        parquet_file = pa.parquet.ParquetFile(filename)
+        n_rows, rows = parquet_file.metadata.num_rows, 0
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            rows += batch.num_rows
+            yield batch.to_pandas(), int(total_bytes*rows/float(max(n_rows, 1))), total_bytes
+
+    # Feather files are memory-mapped, so one chunk is produced without parsing
+    elif file_extension == '.feather':
+        yield read_columns(filename, columns), total_bytes, total_bytes
+
+    # Parse text from an open file handle so progress can be measured in bytes
+    else:
+        if columns is not None: kwargs['usecols'] = columns
+        with open(filename, 'rb') as handle:
+            for chunk in pd.read_csv(handle, chunksize=chunksize, **kwargs):
+                yield chunk, handle.tell(), total_bytes
+
+
+def read_schema(filename):
+    """Reads column names, data types, and number of rows of a columnar file without reading
+    any column data
+
+    Parameters
+    ----------
+    filename : str
+        Path to .parquet or .feather file
+
+    Returns
+    -------
+    dtypes : OrderedDict
+        Column names mapped to data type names
+
+    n_rows : int
+        Number of rows in file
+    """
+    pa                = _import_pyarrow()
+    _, file_extension = os.path.splitext(filename)
+    if file_extension == '.parquet':
+        parquet_file = pa.parquet.ParquetFile(filename)
+        schema       = parquet_file.schema.to_arrow_schema()
+        n_rows       = parquet_file.metadata.num_rows
+    elif file_extension == '.feather':
+        reader = pa.ipc.open_file(pa.memory_map(filename, 'r'))
+        schema = reader.schema
+        n_rows = sum(reader.get_batch(i).num_rows for i in xrange(reader.num_record_batches))
+    else:
+        raise ValueError("File extension %s is not a columnar format" % file_extension)
+
+    # Convert an empty table so data types match what pandas produces when columns are read
+    dtypes = schema.empty_table().to_pandas().dtypes
+    return OrderedDict((name, str(dtype)) for name, dtype in dtypes.iteritems()), n_rows
+
+
+def read_columns(filename, columns=None):
+    """Reads selected columns of a columnar file
+
+    Parameters
+    ----------
+    filename : str
+        Path to .parquet or .feather file
+
+    columns : list or None
+        Names of columns to read. If None, all columns are read
+
+    Returns
+    -------
+    pandas DataFrame
+        Selected columns
+    """
+    _import_pyarrow()
+    _, file_extension = os.path.splitext(filename)
+    if file_extension == '.parquet':
+        return pd.read_parquet(filename, columns=columns)
+    elif file_extension == '.feather':
+        return pd.read_feather(filename, columns=columns)
+    else:
+        raise ValueError("File extension %s is not a columnar format" % file_extension)
+
+
+def write_data(data, filename):
+    """Writes data in format based on file extension
+
+    Parameters
+    ----------
+    data : pandas DataFrame
+        Data to write
+
+    filename : str
+        Path to .csv, .tsv, .txt, .parquet, or .feather file
+
+    Returns
+    -------
+    None
+    """
+    _, file_extension = os.path.splitext(filename)
+    if file_extension == '.parquet':
+        _import_pyarrow()
+        data.to_parquet(filename)
+    elif file_extension == '.feather':
+        _import_pyarrow()
+        data.to_feather(filename)
+    elif file_extension == '.tsv':
+        data.to_csv(filename, sep='\t', index=False)
+    else:
+        data.to_csv(filename, index=False)
+
+
+class ChunkedFrameBuilder(object):
+    """Accumulates DataFrame chunks column by column and concatenates them into one
+    DataFrame without holding a second full copy of the data
+
+    Each chunk's columns are detached from the chunk as it arrives, so the chunk itself can
+    be freed immediately. When building, each column's pieces are concatenated and released
+    before moving on to the next column, and the DataFrame is then constructed from the
+    concatenated columns in one call, which avoids fragmenting it by inserting columns one
+    at a time.
+    """
+    def __init__(self):
+        self.columns = OrderedDict()
+        self.n_rows  = 0
+
+
+    def append(self, chunk):
+        """Adds a chunk of rows
+
+        Parameters
+        ----------
+        chunk : pandas DataFrame
+            Chunk of rows with the same columns as previous chunks
+
+        Returns
+        -------
+        None
+        """
+        for name in chunk.columns:
+            # np.array copies the column out of the chunk's block so the chunk can be freed
+            self.columns.setdefault(name, []).append(np.array(chunk[name].values))
+        self.n_rows += chunk.shape[0]
+
+
+    def build(self):
+        """Concatenates accumulated chunks into a DataFrame
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        data : pandas DataFrame
+            Concatenated data
+        """
+        names, arrays = list(self.columns.keys()), OrderedDict()
+        for name in names:
+            pieces       = self.columns.pop(name)
+            arrays[name] = pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+            del pieces
+        return pd.DataFrame(arrays, index=pd.RangeIndex(self.n_rows), columns=names, copy=False)
+
+
+def optimize_dtypes(data, category_max_ratio=CATEGORY_MAX_RATIO):
+    """Shrinks in-memory size of data by downcasting columns to compact data types
+
+    Integers are downcast to the smallest integer type that holds all values, floats are
+    downcast to float32 only when every value round-trips exactly, and object columns with
+    few unique values relative to the number of rows are converted to categories. Columns
+    are replaced in place one at a time.
+
+    Parameters
+    ----------
+    data : pandas DataFrame
+        Data to optimize
+
+    category_max_ratio : float
+        Maximum ratio of unique values to rows for converting an object column to a category
+
+    Returns
+    -------
+    data : pandas DataFrame
+        Optimized data
+
+    bytes_before : int
+        Memory usage in bytes before optimization
+
+    bytes_after : int
+        Memory usage in bytes after optimization
+    """
+    bytes_before = data.memory_usage(index=False, deep=True).sum()
+    n_rows       = data.shape[0]
+
+    for name in data.columns:
+        dtype = str(data[name].dtypes)
+
+        # Integers are always safe to downcast to the smallest width holding min and max
+        if 'int' in dtype:
+            data[name] = pd.to_numeric(data[name], downcast='integer')
+
+        # Floats only downcast if no precision is lost
+        elif dtype == 'float64':
+            values   = data[name].values
+            downcast = values.astype(np.float32)
+            if ((downcast == values) | np.isnan(values)).all(): data[name] = downcast
+
+        # Low cardinality object columns become categories
+        elif dtype == 'object' and n_rows > 0:
+            if data[name].nunique() <= category_max_ratio*n_rows:
+                data[name] = data[name].astype('category')
+
+    bytes_after = data.memory_usage(index=False, deep=True).sum()
+    return data, bytes_before, bytes_after
+
+
+def read_data(filename, columns=None, optimize=False):
+    """Reads data file, parsing row formats in chunks accumulated column-wise
+
+    Parameters
+    ----------
+    filename : str
+        Path to data file
+
+    columns : list or None
+        Names of columns to read. If None, all columns are read
+
+    optimize : bool
+        Whether to downcast to compact data types, see optimize_dtypes
+
+    Returns
+    -------
+    data : pandas DataFrame
+        Data
+
+    memory : list or None
+        Bytes used before and after downcasting, None if not optimized
+    """
+    _, file_extension = os.path.splitext(filename)
+    if file_extension in COLUMNAR_EXTENSIONS:
+        data = read_columns(filename, columns=columns)
+    else:
+        builder = ChunkedFrameBuilder()
+        for chunk, _, _ in iter_data_chunks(filename, columns=columns):
+            builder.append(chunk)
+            del chunk
+        data = builder.build()
+
+    if not optimize: return data, None
+    data, bytes_before, bytes_after = optimize_dtypes(data)
+    return data, [bytes_before, bytes_after]
+
+
+def safe_astype(data, dtype):
+    """Converts data to new data type, raising an error instead of silently overflowing
+    when values do not fit in a compact integer type
+
+    Parameters
+    ----------
+    data : pandas Series
+        Data to convert
+
+    dtype : str
+        Name of new data type
+
+    Returns
+    -------
+    pandas Series
+        Converted data
+    """
+    if dtype != 'category' and np.dtype(dtype).kind == 'i' and is_numeric(data) and data.shape[0] > 0:
+        info = np.iinfo(dtype)
+        if data.min() < info.min or data.max() > info.max:
+            raise ValueError("Values outside range [%d, %d] of %s" % (info.min, info.max, dtype))
+    return data.astype(dtype)
+
+
+def partition_percentiles(values, q, overwrite=False):
+    """Calculates percentiles from a single partition of the data
+
+    Uses the same linear interpolation between order statistics as np.percentile, but all
+    requested order statistics are placed with one call to np.partition instead of one sort
+    per percentile.
+
+    Parameters
+    ----------
+    values : 1d array-like
+        Data without missing values
+
+    q : list
+        Percentiles to calculate, each in [0, 100]
+
+    overwrite : bool
+        Whether values can be partitioned in place instead of partitioning a copy
+
+    Returns
+    -------
+    percentiles : 1d array-like
+        Percentiles in same order as q
+
+    partitioned : 1d array-like
+        Partitioned data
+    """
+    n         = values.shape[0]
+    positions = np.asarray(q, dtype=np.float64)/100.0*(n - 1)
+    lower     = np.floor(positions).astype(np.intp)
+    upper     = np.minimum(lower + 1, n - 1)
+    kth       = np.unique(np.concatenate([lower, upper]))
+
+    if overwrite:
+        values.partition(kth)
+        partitioned = values
+    else:
+        partitioned = np.partition(values, kth)
+
+    below, above = partitioned[lower], partitioned[upper]
+    return below + (above - below)*(positions - lower), partitioned
+
+
+def central_moments(values, shift, block_size=STATS_BLOCK_SIZE):
+    """Calculates mean and second to fourth central moments in one pass over the data
+
+    Power sums of deviations from a shift value are accumulated block by block, so the data
+    is read once and temporary arrays stay small. Shifting by a value near the center of the
+    data, such as the median, keeps the conversion to central moments numerically stable.
+
+    Parameters
+    ----------
+    values : 1d array-like
+        Data without missing values
+
+    shift : float
+        Value subtracted from data before accumulating power sums
+
+    block_size : int
+        Number of values processed per block
+
+    Returns
+    -------
+    mean : float
+        Mean of data
+
+    m2, m3, m4 : float
+        Second, third, and fourth central moments (biased, divided by n)
+    """
+    n              = values.shape[0]
+    s1, s2, s3, s4 = 0.0, 0.0, 0.0, 0.0
+    for start in xrange(0, n, block_size):
+        d   = values[start:start+block_size] - shift
+        d2  = d*d
+        s1 += d.sum()
+        s2 += d2.sum()
+        s3 += np.dot(d2, d)
+        s4 += np.dot(d2, d2)
+
+    # Convert raw moments about shift to central moments
+    a1, a2, a3, a4 = s1/n, s2/n, s3/n, s4/n
+    m2 = max(a2 - a1**2, 0.0)
+    m3 = a3 - 3*a1*a2 + 2*a1**3
+    m4 = a4 - 4*a1*a3 + 6*a1**2*a2 - 3*a1**4
+    return shift + a1, m2, m3, m4
+
+
+def univariate_statistics(data, counts=None):
+    """Calculates descriptive statistics of a variable
+
+    For numeric data, missing values are dropped, all percentiles (including minimum, median,
+    and maximum) come from one partition of the data, and all moments come from one pass over 
+    the data. For other data, unique values and mode come from counts, see count_values.
+
+    Parameters
+    ----------
+    data : pandas Series
+        Variable data
+
+    counts : tuple
+        Result of count_values for non-numeric data if already computed
+
+    Returns
+    -------
+    results : OrderedDict
+        Statistic names mapped to values
+    """
+    results = OrderedDict()
+    if 'int' in str(data.dtypes) or 'float' in str(data.dtypes):
+        # Convert to float64 and drop missing values, noting whether a copy was made
+        values = np.asarray(data)
+        copied = values.dtype != np.float64
+        if copied: values = values.astype(np.float64)
+        missing = np.isnan(values)
+        if missing.any():
+            values, copied = values[~missing], True
+        del missing
+
+        # All missing or empty
+        if values.shape[0] == 0:
+            for key in ['Mean', 'Median', 'Variance', 'SD', 'Skewness', 'Kurtosis', 'CV', 'Minimum',
+                        'Maximum', 'P 0.5%', 'P 2.5%', 'P 25%', 'P 75%', 'P 97.5%', 'P 99.5%', 'IQR']:
+                results[key] = np.nan
+            return results
+
+        # Order statistics from one partition, which can be done in place on a private copy
+        pcts, values = partition_percentiles(values, [0, 0.5, 2.5, 25, 50, 75, 97.5, 99.5, 100],
+                                             overwrite=copied)
+        
+        # Moments from one pass, shifted by the median for numerical stability
+        mean, m2, m3, m4 = central_moments(values, shift=pcts[4])
+
+        results['Mean']     = mean
+        results['Median']   = pcts[4]
+        results['Variance'] = m2
+        results['SD']       = np.sqrt(m2)
+        results['Skewness'] = m3/m2**1.5 if m2 > 0 else 0.0    # Same as ss.skew(bias=True)
+        results['Kurtosis'] = m4/m2**2 - 3 if m2 > 0 else -3.0 # Same as ss.kurtosis(fisher=True)
+        results['CV']       = np.float64(results['SD'])/mean
+        results['Minimum']  = pcts[0]
+        results['Maximum']  = pcts[8]
+        results['P 0.5%']   = pcts[1]
+        results['P 2.5%']   = pcts[2]
+        results['P 25%']    = pcts[3]
+        results['P 75%']    = pcts[5]
+        results['P 97.5%']  = pcts[6]
+        results['P 99.5%']  = pcts[7]
+        results['IQR']      = results['P 75%'] - results['P 25%']
+
+    else:
+        freq, summary = counts if counts is not None else count_values(data)
+
+        # Unordered categories do not support min/max, so work on underlying values
+        if str(data.dtypes) == 'category': data = np.asarray(data)
+
+        results['Unique']  = summary['Unique']
+        results['Mode']    = summary['Mode']
+        results['Minimum'] = np.min(data)
+        results['Maximum'] = np.max(data)
+
+        # Error bounds of approximate counts
+        for key in ['Unique SE', 'Count Error']:
+            if key in summary: results[key] = summary[key]
+
+    return results
+
+
+def is_numeric(data):
+    """ADD
+    
+    Parameters
+    ----------
+    
+    Returns
+    -------
+    """
+    if 'int' in str(data.dtypes) or 'float' in str(data.dtypes):
+        return 1
+    else:
+        return 0
+
+
+def bin_edges(n, minimum, maximum, rule=DEFAULT_BIN_RULE, skewness=0.0, quantiles=None, 
+              bin_width=None, n_bins=QUANTILE_BINS):
+    """Calculates edges of bins of a grouped frequency table from summaries of a variable, so
+    variables in memory and variables streamed from a file are binned the same way
+
+    Parameters
+    ----------
+    n : int
+        Number of values
+
+    minimum : float
+        Smallest value
+
+    maximum : float
+        Largest value
+
+    rule : str
+        One of BIN_RULES. Doane, Freedman-Diaconis, and Sturges choose the number of equal 
+        width bins as numpy.histogram does, Fixed Width uses bins of bin_width, and Quantile 
+        uses n_bins bins holding about the same number of values
+
+    skewness : float
+        Biased skewness of values, only used by Doane
+
+    quantiles : callable
+        Maps a list of quantiles in [0, 1] to values, only used by Freedman-Diaconis and 
+        Quantile
+
+    bin_width : float
+        Width of bins, only used by Fixed Width
+
+    n_bins : int
+        Number of bins, only used by Quantile
+
+    Returns
+    -------
+    edges : 1d array-like
+        Increasing edges, one more than number of bins
+    """
+    if rule not in BIN_RULES: raise ValueError("Bin rule %s not supported" % rule)
+
+    # One bin around value if there is no spread
+    spread = maximum - minimum
+    if spread <= 0: return np.array([minimum - 0.5, maximum + 0.5])
+
+    if rule == 'Quantile':
+        edges = np.unique(quantiles(np.linspace(0, 1, max(1, int(n_bins)) + 1)))
+        if edges.shape[0] < 2: return np.array([minimum, maximum])
+        edges[0], edges[-1] = minimum, maximum
+        return edges
+
+    if rule == 'Fixed Width':
+        if not bin_width or bin_width <= 0: raise ValueError("Bin width must be positive")
+        count = int(np.ceil(spread/bin_width))
+        if count > MAX_BINS: raise ValueError("Bin width %g gives more than %d bins" % \
+                                              (bin_width, MAX_BINS))
+        return minimum + bin_width*np.arange(max(1, count) + 1)
+
+    if rule == 'Doane':
+        if n > 2:
+            sg1   = np.sqrt(6.0*(n - 2)/((n + 1.0)*(n + 3)))
+            count = 1 + np.log2(n) + np.log2(1 + np.abs(skewness)/sg1)
+        else:
+            count = 1
+    elif rule == 'Sturges':
+        count = np.log2(n) + 1
+    else:
+        q25, q75 = quantiles([0.25, 0.75])
+        width    = 2.0*(q75 - q25)*n**(-1/3.0)
+        count    = spread/width if width > 0 else 1
+
+    count = int(min(np.ceil(count), MAX_BINS))
+    return np.linspace(minimum, maximum, max(1, count) + 1)
+
+
+def bin_labels(edges):
+    """Formats edges as interval labels, half-open except last bin which is closed
+
+    Parameters
+    ----------
+    edges : 1d array-like
+        Increasing edges of bins
+
+    Returns
+    -------
+    labels : 1d array-like
+        One label per bin, for example [0.000, 1.000)
+    """
+    formatted = np.char.mod('%.3f', np.asarray(edges, dtype=np.float64))
+    labels    = np.char.add(np.char.add(np.char.add('[', formatted[:-1]), ', '), 
+                            np.char.add(formatted[1:], ')'))
+    labels[-1] = labels[-1][:-1] + ']'
+    return labels
+
+
+def value_counts_grouped(data, rule=DEFAULT_BIN_RULE, bin_width=None, n_bins=QUANTILE_BINS):
+    """Calculates grouped frequency table of a numeric variable, ignoring missing and infinite 
+    values
+
+    Quantiles of bin rules that need them come from one in-place partition of values, counts 
+    are a binary search of bin edges for each value, and labels are formatted for all bins at 
+    once, so many bins stay cheap.
+
+    Parameters
+    ----------
+    data : pandas Series or 1d array-like
+        Numeric values
+
+    rule : str
+        One of BIN_RULES, see bin_edges
+
+    bin_width : float
+        Width of bins of Fixed Width rule
+
+    n_bins : int
+        Number of bins of Quantile rule
+
+    Returns
+    -------
+    pandas DataFrame
+        Count column indexed by interval of each bin
+    """
+    values = np.asarray(data, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    n      = values.shape[0]
+    if n == 0: return pd.DataFrame([], columns=['Count'])
+
+    # Quantiles are only needed by some rules, each asking for all of them at once. Finite values
+    # are already a copy and counts do not depend on order, so they are partitioned in place
+    quantiles = lambda q: partition_percentiles(values, np.asarray(q)*100, overwrite=True)[0]
+    skewness  = 0.0
+    if rule == 'Doane' and n > 2:
+        centered = values - values.mean()
+        m2       = np.dot(centered, centered)/n
+        skewness = np.dot(centered**2, centered)/n/m2**1.5 if m2 > 0 else 0.0
+
+    edges  = bin_edges(n, values.min(), values.max(), rule=rule, skewness=skewness, 
+                       quantiles=quantiles, bin_width=bin_width, n_bins=n_bins)
+    n_bins = edges.shape[0] - 1
+
+    # Bin of each value, values on last edge fall in closed last bin
+    idx    = np.minimum(np.searchsorted(edges, values, side='right') - 1, n_bins - 1)
+    counts = np.bincount(np.maximum(idx, 0), minlength=n_bins)
+
+    return pd.DataFrame(counts, columns=['Count'], index=bin_labels(edges))
+
+
+def count_values(data, top_n=sketches.TOP_N, min_unique=sketches.APPROX_MIN_UNIQUE):
+    """Counts values of a non-numeric variable, approximately if it has many distinct values
+
+    Distinct values are first estimated with a HyperLogLog sketch. Up to min_unique distinct
+    values are counted exactly, beyond that only the top_n most frequent values are kept, 
+    counted with a top-k sketch, so variables like user IDs stay fast and tables stay short.
+    Missing values are not counted.
+
+    Parameters
+    ----------
+    data : pandas Series
+        Variable data
+
+    top_n : int
+        Most frequent values shown when counts are approximate
+
+    min_unique : int
+        Distinct values above which counts are approximate
+
+    Returns
+    -------
+    freq : pandas Series
+        Counts indexed by value, largest first. When approximate, counts of top_n values are
+        short by at most Count Error and remaining values are counted under 
+        sketches.OTHER_LABEL
+
+    summary : OrderedDict
+        Unique and Mode, and when approximate Unique SE (standard error of Unique) and Count
+        Error, see sketches.FrequencySketch.statistics
+    """
+    values = np.asarray(data, dtype=object)
+    values = values[pd.notnull(values)]
+    hashes = sketches.hash_values(values)
+    sketch = sketches.FrequencySketch()
+    sketch.distinct.update(hashes)
+
+    if sketch.distinct.estimate() > min_unique:
+        sketch.top_k.update(hashes, values)
+        return sketch.frequencies(top_n), sketch.statistics()
+
+    freq    = pd.value_counts(data)
+    summary = OrderedDict([('Unique', freq.shape[0]), 
+                           ('Mode', freq.index[0] if freq.shape[0] else np.nan)])
+    return freq, summary
+
+
+def describe_variable(data, bins=None):
+    """Calculates descriptive statistics and frequency table of a variable
+
+    Parameters
+    ----------
+    data : pandas Series
+        Variable data
+
+    bins : dict
+        Keyword arguments of value_counts_grouped choosing bins, Doane's rule if None
+
+    Returns
+    -------
+    stats : OrderedDict
+        Descriptive statistics, see univariate_statistics
+
+    freq : pandas DataFrame or Series
+        Grouped frequency table for numeric variables, otherwise counts of each value, see
+        count_values
+    """
+    if is_numeric(data):
+        return univariate_statistics(data), value_counts_grouped(data, **(bins or {}))
+
+    counts = count_values(data)
+    return univariate_statistics(data, counts=counts), counts[0]
+
+
+# Variables shared with workers of profiling pools, set once per worker instead of sent per task
+_PROFILE_DATA = {}
+
+
+def init_profile_worker(columns):
+    """Stores variables in worker process of profiling pool
+
+    Forked workers inherit the variables from the parent process instead of receiving a pickled
+    copy with each task, so numeric data is shared copy-on-write
+
+    Parameters
+    ----------
+    columns : dict
+        Names of variables mapped to pandas Series with their data
+
+    Returns
+    -------
+    None
+    """
+    _PROFILE_DATA.clear()
+    _PROFILE_DATA.update(columns)
+
+
+def profile_column(column, bins=None):
+    """Calculates descriptive statistics and frequency table of one variable, used as the
+    task run by each worker process when profiling all variables
+
+    Parameters
+    ----------
+    column : tuple or str
+        Name of variable and pandas Series with its data, or only name of variable in pool 
+        workers holding it already, see init_profile_worker
+
+    bins : dict
+        Keyword arguments of value_counts_grouped choosing bins, Doane's rule if None
+
+    Returns
+    -------
+    name : str
+        Name of variable
+
+    dtype : str
+        Data type of variable
+
+    stats : OrderedDict
+        Descriptive statistics
+
+    freq : pandas DataFrame or Series
+        Grouped frequency table for numeric variables, otherwise counts of each value
+    """
+    if isinstance(column, tuple):
+        name, data = column
+    else:
+        name, data = column, _PROFILE_DATA[column]
+    stats, freq = describe_variable(data, bins=bins)
+    return name, str(data.dtypes), stats, freq
+
+
+def write_profile(profile_results, directory):
+    """Writes profile of variables as one summary table and one frequency table per variable
+
+    Parameters
+    ----------
+    profile_results : OrderedDict
+        Variable names mapped to data type, statistics, and frequency table, see profile_column
+
+    directory : str
+        Directory to write profile_summary.csv and profile_<variable>_freq.csv files to
+
+    Returns
+    -------
+    None
+    """
+    summary = []
+    for name, (dtype, stats, freq) in profile_results.iteritems():
+        summary.append(OrderedDict([('Variable', name), ('Data Type', dtype)] + stats.items()))
+        freq.to_csv(os.path.join(directory, 'profile_%s_freq.csv' % name))
+    
+    pd.DataFrame(summary, columns=PROFILE_COLUMNS).to_csv(
+        os.path.join(directory, 'profile_summary.csv'), index=False)
+
+
+def format_statistic(value):
+    """Formats a statistic for display in a table
+
+    Parameters
+    ----------
+    value : object
+        Statistic, possibly a length one array such as the mode
+
+    Returns
+    -------
+    str
+        Formatted statistic
+    """
+    if isinstance(value, np.ndarray) and value.size == 1: value = value.ravel()[0]
+    if isinstance(value, (int, long, float, np.number)) and not isinstance(value, bool):
+        return '%.3f' % value
+    return str(value)
 
 
-    def createWidget(self, class_name, parent=None, name=''):
-        """ADD
-        
-        Parameters
-        ----------
-        
-        Returns
-        -------
-        """
-        if parent is None and self.base_instance:
-            return self.base_instance
-        else:
-            # create a new widget for child widgets
-            widget = QUiLoader.createWidget(self, class_name, parent, name)
-            if self.base_instance: setattr(self.base_instance, name, widget)
-            return widget
+def is_categorical_feature(column):
+    """Returns whether a variable is one-hot encoded in a design matrix"""
+    return str(column.dtypes) == 'category' or column.dtype.kind == 'O'
 
 
-def load_ui(ui_file, base_instance=None):
-    """ADD
-    
+def feature_levels(column):
+    """Returns levels of a categorical variable in the order of their design matrix columns
+
     Parameters
     ----------
-    
+    column : pandas Series
+        Variable with object or category data type
+
     Returns
     -------
+    codes : 1d array-like
+        Level of each row, -1 for missing values
+
+    levels : 1d array-like
+        Unique levels
     """
-    loader = UiLoader(base_instance)
-    widget = loader.load(ui_file)
-    QMetaObject.connectSlotsByName(widget)
-    return widget
+    if str(column.dtypes) == 'category':
+        return column.cat.codes.values, column.cat.categories.values
+    return pd.factorize(column.values, sort=True)
 
 
-def get_model(model_name, model_type):
-    """ADD
-    
+def design_matrix_shape(columns, one_hot=True):
+    """Returns number of rows and columns of design matrix built from variables, without
+    building it
+
     Parameters
     ----------
-    
+    columns : list
+        Variables as pandas Series
+
+    one_hot : bool
+        Whether object and category variables are one-hot encoded
+
     Returns
     -------
+    tuple
+        Number of rows and number of columns
     """
-    models = {
-        'Classification': {
-            'Random Forests':         RandomForestClassifier,
-            'K-Nearest Neighbors':    KNeighborsClassifier,
-            'Support Vector Machine': SVC,
-            'Neural Network':         MLPClassifier,
-            'Gaussian Process':       GaussianProcessClassifier,
-            'Linear Model':           LogisticRegression,
-            'Extra Trees':            ExtraTreesClassifier,
-            'Gradient Boosting':      GradientBoostingClassifier,
-            'Decision Tree':          DecisionTreeClassifier
-        },
-        'Regression': {
-            'Random Forests':         RandomForestRegressor,
-            'K-Nearest Neighbors':    KNeighborsRegressor,
-            'Support Vector Machine': SVR,
-            'Neural Network':         MLPRegressor,
-            'Gaussian Process':       GaussianProcessRegressor,
-            'Linear Model':           LinearRegression,
-            'Extra Trees':            ExtraTreesRegressor,
-            'Gradient Boosting':      GradientBoostingRegressor,
-            'Decision Tree':          DecisionTreeRegressor
-            },
-        'Clustering': {
-            'K-Means':       KMeans,
-            'DBSCAN':        DBSCAN,
-            'Agglomerative': AgglomerativeClustering
-        }
-    }
+    n_features = 0
+    for column in columns:
+        if one_hot and is_categorical_feature(column):
+            if str(column.dtypes) == 'category':
+                n_features += len(column.cat.categories)
+            else:
+                n_features += column.nunique()
+        else:
+            n_features += 1
+    return (len(columns[0]) if columns else 0), n_features
 
-    return models[model_type][model_name]()
 
+def build_design_matrix(columns, dtype='float64', one_hot=True, max_levels=ONE_HOT_MAX_LEVELS,
+                        levels=None):
+    """Assembles variables into one contiguous design matrix
+
+    The matrix is allocated once in column-major order and each variable is cast directly into
+    its columns, so no per-variable float copies are made. A single numeric variable already of
+    dtype, the usual fit on the x variable alone, is not copied at all: the matrix is a view of
+    its values, so callers must only read the matrix, as model fits do.
 
-def pretty_print_dict(model_params):
-    """ADD
-    
     Parameters
     ----------
-    
+    columns : list
+        Variables as pandas Series
+
+    dtype : str
+        Data type of design matrix, one of DESIGN_DTYPES
+
+    one_hot : bool
+        Whether object and category variables are one-hot encoded, with missing values 
+        encoded as all zeros
+
+    max_levels : int
+        Most levels of a variable that is one-hot encoded
+
+    levels : dict
+        Names of variables mapped to fixed levels they are one-hot encoded with, so matrices 
+        built from different chunks of rows have the same columns. Values not in levels are 
+        encoded as all zeros
+
     Returns
     -------
+    X : 2d array-like
+        Design matrix
+
+    names : list
+        Name of each column of design matrix
     """
-    if 'pooling_func' in model_params.keys(): 
-        model_params = {k:v for k,v in model_params.items() if k != 'pooling_func'}
-    return json.dumps(model_params, indent=4).replace('null', 'None')
+    # Levels of categorical variables are found first, so the matrix size is known up front
+    encoded = []
+    for column in columns:
+        if levels is not None and column.name in levels:
+            codes = pd.Categorical(column.values, categories=levels[column.name]).codes
+            encoded.append((column, codes, levels[column.name]))
+        elif levels is not None and is_categorical_feature(column):
+            raise ValueError('Variable %s has no fixed levels to be one-hot encoded with' % column.name)
+        elif one_hot and is_categorical_feature(column):
+            codes, column_levels = feature_levels(column)
+            if len(column_levels) > max_levels:
+                raise ValueError('Variable %s has %d levels, more than the %d that can be one-hot '
+                                 'encoded' % (column.name, len(column_levels), max_levels))
+            encoded.append((column, codes, column_levels))
+        elif is_categorical_feature(column):
+            raise ValueError('Variable %s is not numeric, enable one-hot encoding to use it as a '
+                             'feature' % column.name)
+        else:
+            encoded.append((column, None, None))
 
+    if len(encoded) == 1 and encoded[0][2] is None:
+        values = np.asarray(columns[0])
+        if values.dtype == np.dtype(dtype): return values.reshape(-1, 1), [str(columns[0].name)]
+
+    n_rows     = len(columns[0])
+    n_features = sum(1 if column_levels is None else len(column_levels) 
+                     for _, _, column_levels in encoded)
+    X          = np.empty((n_rows, n_features), dtype=dtype, order='F')
+    names, j   = [], 0
+    for column, codes, column_levels in encoded:
+        if column_levels is None:
+            X[:, j] = column.values
+            names.append(str(column.name))
+            j      += 1
+        else:
+            for code, level in enumerate(column_levels):
+                np.equal(codes, code, out=X[:, j], casting='unsafe')
+                names.append('%s=%s' % (column.name, level))
+                j += 1
+
+    return X, names
+
+
+def stratified_sample_indices(labels, size, random_state=0):
+    """Returns indices of a random sample with each label represented in proportion to its 
+    count, and at least once
 
-def text_to_dict(model_params):
-    """ADD
-    
     Parameters
     ----------
-    
+    labels : 1d array-like
+        Label of each row
+
+    size : int
+        Approximate number of rows in sample
+
+    random_state : int
+        Seed of sample
+
     Returns
     -------
+    1d array-like
+        Sorted indices of sampled rows, all rows if there are no more than size
     """
-    return json.loads(model_params.replace('None', 'null'))
+    n = len(labels)
+    if n <= size: return np.arange(n)
 
+    rng     = np.random.RandomState(random_state)
+    _, inv  = np.unique(labels, return_inverse=True)
+    order   = np.argsort(inv, kind='mergesort')
+    bounds  = np.cumsum(np.bincount(inv))[:-1]
+    indices = []
+    for group in np.split(order, bounds):
+        k = max(1, int(round(len(group)*size/float(n))))
+        indices.append(rng.choice(group, size=min(k, len(group)), replace=False))
+
+    return np.sort(np.concatenate(indices))
+
+
+def cluster_labels(X, model, subsample_size=CLUSTER_SUBSAMPLE_SIZE, random_state=0):
+    """Fits clustering model and returns cluster of each row
+
+    Agglomerative clustering and DBSCAN need memory and time quadratic in rows, so above 
+    subsample_size rows they are fit on a random subsample. Agglomerative clustering assigns 
+    each remaining row to the cluster of its nearest subsampled row. DBSCAN assigns it to the
+    cluster of its nearest core sample within eps, otherwise to noise, and scales min_samples 
+    to the subsample so density thresholds stay comparable.
 
-def message_box(message, informativeText, type, question=False):
-    """ADD
-    
     Parameters
     ----------
-    
+    X : 2d array-like
+        Features
+
+    model : sklearn estimator
+        Clustering model
+
+    subsample_size : int
+        Number of rows above which models in SUBSAMPLED_CLUSTERING are fit on a subsample
+
+    random_state : int
+        Seed of subsample
+
     Returns
     -------
+    1d array-like
+        Cluster of each row
     """
-    # TODO: ADD DETAILED TEXT WITH TRACEBACKS AND EXCEPTION CATCHING
-    msg = QMessageBox()
-    msg.setText(message)
-    msg.setInformativeText(informativeText)
+    from sklearn.base import clone
+    from sklearn.cluster import AgglomerativeClustering, DBSCAN
+    from sklearn.neighbors import NearestNeighbors
 
-    if type == "warning":
-        msg.setIcon(QMessageBox.Warning)
-    elif type == "error":
-        msg.setIcon(QMessageBox.Critical)
-    else:
-        msg.setIcon(QMessageBox.Information)
+    n = X.shape[0]
+    if n <= subsample_size or not isinstance(model, (AgglomerativeClustering, DBSCAN)):
+        return model.fit_predict(X)
+
+    idx    = np.sort(np.random.RandomState(random_state).choice(n, size=subsample_size, replace=False))
+    X_fit  = X[idx]
+
+    if isinstance(model, DBSCAN):
+        frac  = subsample_size/float(n)
+        model = clone(model).set_params(min_samples=max(2, int(round(model.min_samples*frac))))
+        model.fit(X_fit)
+        if len(model.core_sample_indices_) == 0: return np.full(n, -1, dtype=int)
+
+        # Nearest core sample within eps, otherwise noise
+        nn             = NearestNeighbors(n_neighbors=1, metric=model.metric).fit(model.components_)
+        dist, nearest  = nn.kneighbors(X)
+        y_pred         = model.labels_[model.core_sample_indices_][nearest[:, 0]]
+        y_pred[dist[:, 0] > model.eps] = -1
 
-    if question:
-        msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        msg.setDefaultButton(QMessageBox.No)
-        return msg.exec_() # Return messagebox 
     else:
-        msg.setStandardButtons(QMessageBox.Ok)
-        msg.exec_()
+        labels = model.fit_predict(X_fit)
+        _, nearest = NearestNeighbors(n_neighbors=1).fit(X_fit).kneighbors(X)
+        y_pred = labels[nearest[:, 0]]
 
+    # Fitted rows keep their own cluster
+    y_pred[idx] = model.labels_
+    return y_pred
+
+
+def clustering_scores(X, y_pred, sample_size=SILHOUETTE_SAMPLE_SIZE, random_state=0):
+    """Calculates silhouette and Calinski-Harabaz scores of clusters
+
+    Silhouette scores need memory and time quadratic in rows, so above sample_size rows they
+    are calculated on a sample stratified by cluster
 
-def univariate_statistics(data):
-    """ADD
-    
     Parameters
     ----------
-    
+    X : 2d array-like
+        Features
+
+    y_pred : 1d array-like
+        Cluster of each row
+
+    sample_size : int
+        Number of rows above which silhouette score is calculated on a sample
+
+    random_state : int
+        Seed of sample
+
     Returns
     -------
+    list
+        Silhouette score and Calinski-Harabaz score
     """
-    results = OrderedDict()
-    if 'int' in str(data.dtypes) or 'float' in str(data.dtypes):
-        results['Mean']     = np.mean(data)
-        results['Median']   = np.median(data)
-        results['Variance'] = np.var(data)
-        results['SD']       = np.std(data)
-        results['Skewness'] = ss.skew(data)
-        results['Kurtosis'] = ss.kurtosis(data)
-        results['CV']       = results['SD']/results['Mean']
-        results['Minimum']  = np.min(data)
-        results['Maximum']  = np.max(data)
-        results['P 0.5%']   = np.percentile(data, 0.5)
-        results['P 2.5%']   = np.percentile(data, 2.5)
-        results['P 25%']    = np.percentile(data, 25)
-        results['P 75%']    = np.percentile(data, 75)
-        results['P 97.5%']  = np.percentile(data, 97.5)
-        results['P 99.5%']  = np.percentile(data, 99.5)
-        results['IQR']      = results['P 75%'] - results['P 25%']
+    from sklearn.metrics import calinski_harabaz_score, silhouette_score
 
-    else:
-        results['Unique']  = len(np.unique(data))
-        results['Mode']    = ss.mode(data)[0]
-        results['Minimum'] = np.min(data)
-        results['Maximum'] = np.max(data)
+    idx = stratified_sample_indices(y_pred, sample_size, random_state)
+    return [silhouette_score(X[idx], y_pred[idx]), calinski_harabaz_score(X, y_pred)]
 
-    return results
 
+def unsupervised_ml(X, model):
+    """Fits clustering model and calculates clustering metrics
 
-def is_numeric(data):
-    """ADD
-    
     Parameters
     ----------
-    
+    X : 2d array-like
+        Features
+
+    model : sklearn estimator
+        Clustering model
+
     Returns
     -------
+    y_pred : 1d array-like
+        Cluster of each row
+
+    scores : list
+        Silhouette score and Calinski-Harabaz score
     """
-    if 'int' in str(data.dtypes) or 'float' in str(data.dtypes):
-        return 1
-    else:
-        return 0
+    # Fit model, make class predictions, calculate clustering metrics
+    y_pred = cluster_labels(X, model)
+    scores = clustering_scores(X, y_pred)
 
+    return y_pred, scores
+
+
+# Data shared with fold workers of process pools, set once per worker instead of per fold
+_FOLD_DATA = {}
+
+
+def cv_splits(X, y, model_type, random_state=CV_RANDOM_STATE):
+    """Returns cross-validation folds, stratified by label for classification
 
-def value_counts_grouped(data, value_counts):
-    """ADD
-    
     Parameters
     ----------
-    
+    X : 2d array-like
+        Features
+
+    y : 1d array-like
+        Labels
+
+    model_type : str
+        Either 'Regression' or 'Classification'
+
+    random_state : int
+        Seed of fold assignment
+
     Returns
     -------
+    list
+        (train indices, test indices) of each fold
     """
-    # Calculate counts and bins
-    counts, bins  = np.histogram(data, bins='doane')
-    n_bins        = len(bins)
+    from sklearn.model_selection import KFold, StratifiedKFold
 
-    # Create grouped frequency table
-    index, values = [], []
-    for i in xrange(n_bins-1):
+    if model_type == 'Regression':
+        return list(KFold(n_splits=N_SPLITS, shuffle=True, random_state=random_state).split(X))
+    else:
+        return list(StratifiedKFold(n_splits=N_SPLITS, shuffle=True, 
+                                    random_state=random_state).split(X, y))
 
-        # Last interval is closed
-        if i == (n_bins-2):
-            index.append('[{:.3f}, {:.3f}]'.format(bins[i], bins[i+1]))
-        
-        # Other intervals are half-open (open to left, closed to right)
-        else:
-            index.append('[{:.3f}, {:.3f})'.format(bins[i], bins[i+1]))
-        
-        values.append(counts[i])
 
-    return pd.DataFrame(values, columns=['Count'], index=index)
+def init_fold_worker(X, y):
+    """Stores features and labels in worker process of cross-validation pool"""
+    _FOLD_DATA['X'], _FOLD_DATA['y'] = X, y
 
 
-def unsupervised_ml(X, model):
-    """ADD
-    
+def fold_data(train_idx, test_idx, X=None, y=None):
+    """Splits features and labels into a standardized train and test set of one fold
+
     Parameters
     ----------
-    
+    train_idx : 1d array-like
+        Train indices
+
+    test_idx : 1d array-like
+        Test indices
+
+    X : 2d array-like
+        Features, None in pool workers holding them already
+
+    y : 1d array-like
+        Labels, None in pool workers holding them already
+
     Returns
     -------
+    X_train, X_test, y_train, y_test : array-like
+        Standardized features and labels of train and test set
     """
-    # Fit model, make class predictions, calculate clustering metrics
-    y_pred  = model.fit_predict(X)
-    scores  = [silhouette_score(X, y_pred), calinski_harabaz_score(X, y_pred)]
+    if X is None: X, y = _FOLD_DATA['X'], _FOLD_DATA['y']
 
-    return y_pred, scores
+    # Separate into train/test and features/labels
+    X_train, X_test = X[train_idx], X[test_idx]
+    y_train, y_test = y[train_idx], y[test_idx]
 
+    # Standardize data in place, indexing above already made private copies
+    from sklearn.preprocessing import StandardScaler
+    scaler          = StandardScaler().fit(X_train)
+    X_train, X_test = scaler.transform(X_train, copy=False), scaler.transform(X_test, copy=False)
+
+    return X_train, X_test, y_train, y_test
+
+
+def fit_fold(task):
+    """Fits one cross-validation fold, used as the task run by each pool worker
 
-def supervised_ml(X, y, model, model_type):
-    """ADD
-    
     Parameters
     ----------
-    
+    task : tuple
+        Fold number, train indices, test indices, cloned model, model type, and features and 
+        labels (None when workers hold them already)
+
     Returns
     -------
+    fold : int
+        Fold number
+
+    test_idx : 1d array-like
+        Test indices
+
+    y_pred : 1d array-like
+        Predictions for test indices
+
+    score : float
+        Mean squared error for regression, accuracy for classification
     """
-    # Define cross-validation generator
-    y_pred, scores = np.zeros(y.shape), np.zeros(N_SPLITS)
+    fold, train_idx, test_idx, model, model_type, X, y = task
+    X_train, X_test, y_train, y_test = fold_data(train_idx, test_idx, X, y)
+
+    # Train and make predictions
+    model.fit(X_train, y_train)
+    y_pred = model.predict(X_test)
+
+    # Calculate score
+    from sklearn.metrics import accuracy_score, mean_squared_error
     if model_type == 'Regression':
-        cv_generator = KFold(n_splits=N_SPLITS, shuffle=True).split(X)
+        score = mean_squared_error(y_test, y_pred)
     else:
-        cv_generator = StratifiedKFold(n_splits=N_SPLITS, shuffle=True).split(X, y)
+        score = accuracy_score(y_test, y_pred)
 
-    # Iterate over train, test splits
-    fold = 0
-    for train_idx, test_idx in cv_generator:
-        
-        # Separate into train/test and features/labels
-        X_train, X_test = X[train_idx], X[test_idx]
-        y_train, y_test = y[train_idx], y[test_idx]
+    return fold, test_idx, y_pred, score
 
-        # Standardize data
-        scaler          = StandardScaler().fit(X_train)
-        X_train, X_test = scaler.transform(X_train), scaler.transform(X_test)
 
-        # Train and make predictions
-        model.fit(X_train, y_train)
-        y_pred[test_idx] = model.predict(X_test)
+def supervised_ml(X, y, model, model_type, n_jobs=CV_N_JOBS, backend=CV_BACKEND, 
+                  random_state=CV_RANDOM_STATE, callback=None):
+    """Cross-validates a model, fitting folds concurrently on a process or thread pool
 
-        # Calculate score
-        if model_type == 'Regression':
-            scores[fold] = mean_squared_error(y_test, y_pred[test_idx])
-        else:
-            scores[fold] = accuracy_score(y_test, y_pred[test_idx])
+    Parameters
+    ----------
+    X : 2d array-like
+        Features
+
+    y : 1d array-like
+        Labels
+
+    model : sklearn estimator
+        Model, each fold fits its own clone
+
+    model_type : str
+        Either 'Regression' or 'Classification'
+
+    n_jobs : int
+        Number of folds fit concurrently, 1 fits folds one after another
+
+    backend : str
+        Either 'process' or 'thread'. Threads avoid copying data and suit models that release
+        the GIL, processes suit models that hold it
+
+    random_state : int
+        Seed of fold assignment, so predictions and scores are reproducible
+
+    callback : function
+        Called with number of folds finished after each fold
+
+    Returns
+    -------
+    y_pred : 1d array-like
+        Out of fold predictions
+
+    scores : 1d array-like
+        Score of each fold in fold order
+    """
+    from sklearn.base import clone
+
+    # Define cross-validation folds
+    y_pred, scores = np.zeros(y.shape), np.zeros(N_SPLITS)
+    cv_generator   = cv_splits(X, y, model_type, random_state)
+
+    # One task per fold with a cloned model, process workers receive data once when started
+    n_jobs = max(1, min(n_jobs, N_SPLITS))
+    shared = n_jobs > 1 and backend == 'process'
+    tasks  = [(fold, train_idx, test_idx, clone(model), model_type, 
+               None if shared else X, None if shared else y) 
+              for fold, (train_idx, test_idx) in enumerate(cv_generator)]
 
-        fold += 1
+    if n_jobs == 1:
+        pool, results = None, (fit_fold(task) for task in tasks)
+    elif shared:
+        pool          = multiprocessing.Pool(processes=n_jobs, initializer=init_fold_worker, 
+                                             initargs=(X, y))
+        results       = pool.imap(fit_fold, tasks)
+    else:
+        pool          = ThreadPool(processes=n_jobs)
+        results       = pool.imap(fit_fold, tasks)
+
+    # Results arrive in fold order
+    try:
+        for fold, test_idx, fold_pred, score in results:
+            y_pred[test_idx] = fold_pred
+            scores[fold]     = score
+            if callback: callback(fold + 1)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
 
     # Return predictions
     return y_pred, scores
 
 
+def run_model(X, y, model, model_type, backend=CV_BACKEND, progress=None):
+    """Fits model and makes predictions, used as the task run by model fitting jobs
+
+    Parameters
+    ----------
+    X : 2d array-like
+        Features
+
+    y : 1d array-like
+        Labels, None for clustering, which is fit on every column of X
+
+    model : sklearn estimator
+        Model
+
+    model_type : str
+        Either 'Regression', 'Classification', or 'Clustering'
+
+    backend : str
+        Either 'process' or 'thread', pool fitting cross-validation folds, see supervised_ml
+
+    progress : function
+        Called with progress messages
+
+    Returns
+    -------
+    y_pred : 1d array-like
+        Predictions, out of fold for regression and classification
+
+    scores : 1d array-like
+        Fold scores for regression and classification, clustering metrics otherwise
+    """
+    # Clustering model
+    if model_type == 'Clustering':
+        if progress: progress('Fitting clusters')
+        return unsupervised_ml(X=X, model=model)
+
+    # Regression or classification model. Job workers lead their own process group, so fold
+    # processes stop with the worker when a job is cancelled
+    callback = None
+    if progress: callback = lambda n_done: progress('%d of %d folds finished' % (n_done, N_SPLITS))
+    return supervised_ml(X=X, y=y, model=model, model_type=model_type, backend=backend, 
+                         callback=callback)
+
+
+def holdout_mask(start, n, fraction=STREAM_HOLDOUT_FRACTION):
+    """Returns which rows of a chunk are held out for scoring
+
+    Rows are chosen by a multiplicative hash of their row number in the file, so the same rows
+    are held out however the file is split into chunks
+
+    Parameters
+    ----------
+    start : int
+        Row number of first row of chunk
+
+    n : int
+        Number of rows in chunk
+
+    fraction : float
+        Fraction of rows held out
+
+    Returns
+    -------
+    1d array-like
+        True for held out rows
+    """
+    rows = np.arange(start, start+n, dtype=np.uint64)
+    return (rows*np.uint64(2654435761) % np.uint64(2**32))/float(2**32) < fraction
+
+
+def incremental_ml(filename, features, label, model, model_type, levels=None, classes=None,
+                   dtype='float64', holdout_fraction=STREAM_HOLDOUT_FRACTION, 
+                   chunksize=STREAM_CHUNK_SIZE, progress=None):
+    """Trains a model with partial_fit on chunks read from a data file, used as the task run by
+    streaming model jobs
+
+    Held out rows of each chunk are scored by the model trained on all chunks before it, so
+    held out rows of the first chunk are not scored. The remaining rows are standardized with 
+    running means and variances and trained on. 
+    Rows with missing values are skipped. Only as many rows as one chunk, plus a sample of
+    held out rows for clustering metrics, are in memory at once.
+
+    Parameters
+    ----------
+    filename : str
+        Path to data file
+
+    features : list
+        Names of feature columns in data file
+
+    label : str
+        Name of label column in data file, None for clustering
+
+    model : sklearn estimator
+        Model supporting partial_fit
+
+    model_type : str
+        Either 'Regression', 'Classification', or 'Clustering'
+
+    levels : dict
+        Names of categorical feature columns mapped to levels they are one-hot encoded with
+
+    classes : 1d array-like
+        All classes of label, required for classification
+
+    dtype : str
+        Data type of design matrix of each chunk
+
+    holdout_fraction : float
+        Fraction of rows held out for scoring
+
+    chunksize : int
+        Number of rows read per chunk
+
+    progress : function
+        Called with a progress message and the running metrics
+
+    Returns
+    -------
+    dict
+        Name of metric, its value on all held out rows, its value after each chunk, numbers of
+        rows trained on and scored, and clustering metrics of a held out sample
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    if progress is None: progress = lambda message, data=None: None
+    if model_type == 'Classification' and classes is None:
+        raise ValueError('Classes of label are needed to train a streaming classifier')
+
+    metric  = {'Regression': 'Mean Squared Error', 'Classification': 'Accuracy',
+               'Clustering': 'Mean Squared Distance to Center'}[model_type]
+    scaler  = StandardScaler()
+    columns = list(features) + ([label] if label is not None and label not in features else [])
+    history, sample = [], []
+    n_rows = n_train = n_scored = n_sample = 0
+    total  = 0.0
+
+    for chunk, bytes_read, total_bytes in iter_data_chunks(filename, chunksize, columns):
+        X, _ = build_design_matrix([chunk[name] for name in features], dtype=dtype, 
+                                   levels=levels or {})
+        y    = chunk[label].values.astype(float) if label is not None else None
+        
+        # Skip rows with missing values
+        valid = ~np.isnan(X).any(axis=1)
+        if y is not None: valid &= ~np.isnan(y)
+        held  = holdout_mask(n_rows, chunk.shape[0], holdout_fraction)
+        n_rows += chunk.shape[0]
+
+        # Score held out rows with model trained on previous chunks
+        test = valid & held
+        if n_train and test.any():
+            X_test = scaler.transform(X[test], copy=False)
+            if model_type == 'Regression':
+                total += np.sum((y[test] - model.predict(X_test))**2)
+            elif model_type == 'Classification':
+                total += np.sum(y[test] == model.predict(X_test))
+            else:
+                total += -model.score(X_test)
+                if n_sample < SILHOUETTE_SAMPLE_SIZE:
+                    sample.append(X[test][:SILHOUETTE_SAMPLE_SIZE-n_sample])
+                    n_sample += sample[-1].shape[0]
+            n_scored += int(test.sum())
+
+        # Train on remaining rows
+        train = valid & ~held
+        if train.any():
+            X_train = X[train]
+            scaler.partial_fit(X_train)
+            X_train = scaler.transform(X_train, copy=False)
+            if model_type == 'Classification':
+                model.partial_fit(X_train, y[train], classes=classes)
+            elif model_type == 'Regression':
+                model.partial_fit(X_train, y[train])
+            else:
+                model.partial_fit(X_train)
+            n_train += int(train.sum())
+
+        running = total/n_scored if n_scored else np.nan
+        history.append((n_train, running))
+        progress('%d rows trained, %d scored (%.0f%% of file): %s = %.3f' % \
+                 (n_train, n_scored, 100.0*bytes_read/max(total_bytes, 1), metric, running),
+                 {'metric': metric, 'history': list(history)})
+        del chunk, X, y
+
+    if n_train == 0: raise ValueError('No rows without missing values to train on')
+
+    result = {'metric': metric, 'score': total/n_scored if n_scored else np.nan, 
+              'history': history, 'n_train': n_train, 'n_scored': n_scored, 'n_rows': n_rows}
+
+    # Clustering metrics of held out sample
+    if model_type == 'Clustering' and sample:
+        X_sample          = scaler.transform(np.concatenate(sample), copy=False)
+        result['metrics'] = clustering_scores(X_sample, model.predict(X_sample))
+    return result
+
+
 def model_metrics(y_true, y_pred, model_type):
     """ADD
     
@@ -300,6 +1613,76 @@ def model_metrics(y_true, y_pred, model_type):
     pass
 
 
+def minmax_indices(values, n_buckets):
+    """Selects points that keep the shape of a line when it is drawn with fewer points
+
+    Rows are split into n_buckets contiguous buckets, roughly one per pixel, and the minimum
+    and maximum of each bucket are kept so peaks are never dropped. Values that are not
+    numeric fall back to evenly spaced rows.
+
+    Parameters
+    ----------
+    values : 1d array-like
+        Values in the order they are drawn
+
+    n_buckets : int
+        Number of buckets
+
+    Returns
+    -------
+    idx : 1d array-like
+        Sorted row indices to draw
+    """
+    n = len(values)
+    if n <= 2*n_buckets: return np.arange(n)
+
+    try:
+        values = np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.unique(np.linspace(0, n-1, 2*n_buckets).astype(int))
+
+    # Pad with missing values so buckets form the rows of a matrix
+    size          = int(np.ceil(n/float(n_buckets)))
+    n_rows        = int(np.ceil(n/float(size)))
+    padded        = np.full(n_rows*size, np.nan)
+    padded[:n]    = values
+    padded        = padded.reshape(n_rows, size)
+    missing       = np.isnan(padded)
+    offsets       = np.arange(n_rows)*size
+
+    # Missing values never win unless a bucket holds nothing else
+    padded[missing] = -np.inf
+    highs           = offsets + np.argmax(padded, axis=1)
+    padded[missing] = np.inf
+    lows            = offsets + np.argmin(padded, axis=1)
+
+    idx = np.unique(np.concatenate([lows, highs, [0, n-1]]))
+    return idx[idx < n]
+
+
+def sample_indices(n, size, random_state=0):
+    """Draws a sorted random sample of row indices
+
+    Parameters
+    ----------
+    n : int
+        Number of rows
+
+    size : int
+        Maximum number of rows in sample
+
+    random_state : int
+        Seed of random number generator, so repeated plots show the same sample
+
+    Returns
+    -------
+    idx : 1d array-like
+        Sorted row indices without duplicates
+    """
+    if n <= size: return np.arange(n)
+    return np.unique(np.random.RandomState(random_state).randint(0, n, size))
+
+
 def get_spaced_colors(n, offset):
     """ADD
     
@@ -329,27 +1712,29 @@ def check_for_categorical_label(data):
     return np.sum(pd.value_counts(data) >= N_SPLITS)
 
 
-def tablewidgets_to_dataframes(data):
-    """ADD
-    
+def tablemodels_to_dataframes(data):
+    """Converts two column table models to pandas DataFrames
+
     Parameters
     ----------
-    
+    data : dict
+        Name of each table mapped to its table model
+
     Returns
     -------
+    dfs : dict
+        Name of each table mapped to pandas DataFrame indexed by first column of table, with
+        second column of table named after table
     """
     # Hold all dataframes
     dfs = {}
 
     # Iterate over each table
-    for col_name, table in data.iteritems():
-        n, df = table.rowCount(), {}
-        for row in xrange(n): df[str(table.item(row, 0).text())] = [float(table.item(row, 1).text())]
-        
-        # Make a column vector with variable named based on specified key
-        df = pd.DataFrame(df).T
-        df.columns = [col_name]
-        dfs[col_name] = df
+    for col_name, model in data.iteritems():
+        frame         = model.to_frame()
+        dfs[col_name] = pd.DataFrame(frame.iloc[:, 1].values, 
+                                     index=frame.iloc[:, 0].map(str).values, 
+                                     columns=[col_name])
 
     # Return dataframes
     return dfs
@@ -6,28 +6,19 @@ Helper functions for application
 """.strip()
 
 from collections import OrderedDict
+import importlib
 import json
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import numpy as np
 import os
 import pandas as pd
-from PySide.QtCore import QFile, QMetaObject
-from PySide.QtGui import QMessageBox
-from PySide.QtUiTools import QUiLoader
-import scipy.stats as ss
-from sklearn.cluster import AgglomerativeClustering, DBSCAN, KMeans
-from sklearn.ensemble import (ExtraTreesClassifier, ExtraTreesRegressor,
-                              GradientBoostingClassifier, GradientBoostingRegressor,
-                              RandomForestClassifier, RandomForestRegressor)
-from sklearn.gaussian_process import GaussianProcessClassifier, GaussianProcessRegressor
-from sklearn.linear_model import LinearRegression, LogisticRegression
-from sklearn.metrics import (accuracy_score, calinski_harabaz_score, mean_squared_error, 
-                             silhouette_score)
-from sklearn.model_selection import KFold, StratifiedKFold
-from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
-from sklearn.neural_network import MLPClassifier, MLPRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.svm import SVC, SVR
-from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+
+# scipy and scikit-learn take seconds to import, so they are imported inside the functions 
+# that use them instead, which only pay the cost when first called
+
+# Custom functions
+import sketches
 
 
 ###############
@@ -46,12 +37,56 @@ ICONS_PATH     = os.path.join(MAIN_DIR, 'icons')
 PLOTS_FOR_PRED = ['Scatter', 'Line', 'Scatter + Line']
 N_SPLITS       = 3
 
-DTYPE_TO_LABEL = {'int64': 'integer', 
-                  'float64': 'float',
-                  'object': 'object',
-                  'datetime64[ns]': 'datetime'}
+CV_N_JOBS        = multiprocessing.cpu_count() # Folds fit concurrently, capped at N_SPLITS
+CV_BACKEND       = 'process'                   # Either 'process' or 'thread'
+CV_RANDOM_STATE  = 1718                        # Seed of fold assignment
+
+# Clustering on large data. Silhouette scores use a sample stratified by cluster, and models
+# whose cost grows quadratically in rows are fit on a subsample with remaining rows assigned to
+# the nearest fitted row. Both sizes can be overridden with environment variables
+SILHOUETTE_SAMPLE_SIZE = int(os.environ.get('EDA_VIEWER_SILHOUETTE_SAMPLE_SIZE', 10000))
+CLUSTER_SUBSAMPLE_SIZE = int(os.environ.get('EDA_VIEWER_CLUSTER_SUBSAMPLE_SIZE', 10000))
+SUBSAMPLED_CLUSTERING  = ['Agglomerative', 'DBSCAN']
+
+DESIGN_DTYPES       = ['float64', 'float32'] # Data types of design matrix offered for model fits
+ONE_HOT_MAX_LEVELS  = 100                    # Most levels of a variable that is one-hot encoded
+
+LOAD_CHUNK_SIZE     = 100000 # Rows parsed per chunk when streaming files
+TEXT_EXTENSIONS     = ['.csv', '.tsv', '.txt']
+COLUMNAR_EXTENSIONS = ['.parquet', '.feather']
+
+# Streaming models are trained with partial_fit on chunks read from the data file, so data
+# larger than memory can be used. Rows are held out for scoring by a hash of their row number
+STREAMING_MODELS        = ['SGD (Streaming)', 'Naive Bayes (Streaming)', 'Neural Network (Streaming)',
+                           'Mini-Batch K-Means (Streaming)']
+STREAM_HOLDOUT_FRACTION = 0.2
+STREAM_CHUNK_SIZE       = LOAD_CHUNK_SIZE
+
+STATS_BLOCK_SIZE = 65536 # Values per block when accumulating moments
+
+# Rules choosing bins of grouped frequency tables of numeric variables
+BIN_RULES        = ['Doane', 'Freedman-Diaconis', 'Sturges', 'Fixed Width', 'Quantile']
+DEFAULT_BIN_RULE = 'Doane'
+QUANTILE_BINS    = 10    # Bins of quantile rule, each holding about the same number of values
+MAX_BINS         = 10000 # Bins at most, heavy tails can make Freedman-Diaconis bins tiny
+PROFILE_N_JOBS   = multiprocessing.cpu_count()
+PROFILE_COLUMNS  = ['Variable', 'Data Type', 'Mean', 'Median', 'Variance', 'SD', 'Skewness', 
+                    'Kurtosis', 'CV', 'Minimum', 'Maximum', 'P 0.5%', 'P 2.5%', 'P 25%', 'P 75%', 
+                    'P 97.5%', 'P 99.5%', 'IQR', 'Unique', 'Mode']
+
+DTYPE_TO_LABEL = OrderedDict([('int64', 'integer'), 
+                              ('int32', 'integer (32-bit)'),
+                              ('int16', 'integer (16-bit)'),
+                              ('int8', 'integer (8-bit)'),
+                              ('float64', 'float'),
+                              ('float32', 'float (32-bit)'),
+                              ('object', 'object'),
+                              ('category', 'category'),
+                              ('datetime64[ns]', 'datetime')])
 LABEL_TO_DTYPE = {value: key for key, value in DTYPE_TO_LABEL.iteritems()}
 
+CATEGORY_MAX_RATIO = 0.5 # Object columns with unique/rows at or below this become categories
+
 LINK_MODEL_API = {
     'Classification': {
         'Random Forests':         'http://scikit-learn.org/stable/modules/generated/sklearn.ensemble.RandomForestClassifier.html',
@@ -62,7 +97,10 @@ LINK_MODEL_API = {
         'Linear Model':           'http://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LogisticRegression.html',
         'Extra Trees':            'http://scikit-learn.org/stable/modules/generated/sklearn.ensemble.ExtraTreesClassifier.html',
         'Gradient Boosting':      'http://scikit-learn.org/stable/modules/generated/sklearn.ensemble.GradientBoostingClassifier.html',
-        'Decision Tree':          'http://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeClassifier.html'
+        'Decision Tree':          'http://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeClassifier.html',
+        'SGD (Streaming)':            'http://scikit-learn.org/stable/modules/generated/sklearn.linear_model.SGDClassifier.html',
+        'Naive Bayes (Streaming)':    'http://scikit-learn.org/stable/modules/generated/sklearn.naive_bayes.GaussianNB.html',
+        'Neural Network (Streaming)': 'http://scikit-learn.org/stable/modules/generated/sklearn.neural_network.MLPClassifier.html'
     },
     'Regression': {
         'Random Forests':         'http://scikit-learn.org/stable/modules/generated/sklearn.ensemble.RandomForestRegressor.html',
@@ -73,11 +111,15 @@ LINK_MODEL_API = {
         'Linear Model':           'http://scikit-learn.org/stable/modules/generated/sklearn.linear_model.LinearRegression.html',
         'Extra Trees':            'http://scikit-learn.org/stable/modules/generated/sklearn.ensemble.ExtraTreesRegressor.html',
         'Gradient Boosting':      'http://scikit-learn.org/stable/modules/generated/sklearn.ensemble.GradientBoostingRegressor.html',
-        'Decision Tree':          'http://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeRegressor.html'
+        'Decision Tree':          'http://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeRegressor.html',
+        'SGD (Streaming)':            'http://scikit-learn.org/stable/modules/generated/sklearn.linear_model.SGDRegressor.html',
+        'Neural Network (Streaming)': 'http://scikit-learn.org/stable/modules/generated/sklearn.neural_network.MLPRegressor.html'
     },
     'Clustering': {
-        'K-Means':       'http://scikit-learn.org/stable/modules/generated/sklearn.cluster.KMeans.html',
-        'DBSCAN':        'http://scikit-learn.org/stable/modules/generated/sklearn.cluster.DBSCAN.html',
-        'Agglomerative': 'http://scikit-learn.org/stable/modules/generated/sklearn.cluster.AgglomerativeClustering.html'
+        'K-Means':            'http://scikit-learn.org/stable/modules/generated/sklearn.cluster.KMeans.html',
+        'Mini-Batch K-Means': 'http://scikit-learn.org/stable/modules/generated/sklearn.cluster.MiniBatchKMeans.html',
+        'DBSCAN':             'http://scikit-learn.org/stable/modules/generated/sklearn.cluster.DBSCAN.html',
+        'Agglomerative':      'http://scikit-learn.org/stable/modules/generated/sklearn.cluster.AgglomerativeClustering.html',
+        'Mini-Batch K-Means (Streaming)': 'http://scikit-learn.org/stable/modules/generated/sklearn.cluster.MiniBatchKMeans.html'
     }
 }
\ No newline at end of file
@@ -22,6 +22,10 @@ class MplCanvas(FigureCanvas):
         self._reg_predictions_added   = 0
         self._clf_predictions_added   = 0
         self._clust_predictions_added = 0
+        self.large_data_threshold     = LARGE_DATA_THRESHOLD
+        self.reduction                = None # How the current plot reduces points, if at all
+        self.sample_idx               = None
+        self.colorbar                 = None
 
         FigureCanvas.__init__(self, self.fig)
         self.setParent(parent)
@@ -63,11 +67,43 @@ class DynamicMplCanvas(MplCanvas):
         except:
             pass
 
+        if self.colorbar is not None:
+            try:
+                self.colorbar.remove()
+            except:
+                pass
+            self.colorbar = None
+
+
+    def _n_buckets(self):
+        """Returns number of line buckets, one per pixel across the axes"""
+        width = int(self.axes.bbox.width)
+        return width if width > 0 else DEFAULT_BUCKETS
+
+
+    def _overlay_indices(self, values):
+        """Returns row indices of overlay points, reduced the same way as the current plot
+
+        Parameters
+        ----------
+        values : 1d array-like
+            Values of overlay along y-axis
+
+        Returns
+        -------
+        idx : 1d array-like
+            Row indices to draw
+        """
+        if self.reduction == 'minmax':
+            return utils.minmax_indices(values, self._n_buckets())
+        elif self.reduction in ['density', 'sample']:
+            return self.sample_idx
+        else:
+            return np.arange(len(values))
+
 
     def update_plot(self, x, y, xlabel, ylabel, plot_type, plot_generated, checkbox):
-        """Updates plot based on user input and plot type
-        # TODO: Fix axis x-axis tick marks and labels for bar charts, especially when two
-        # variables plotted together
+        """Updates plot based on user input and plot type, see plots.draw_plot
         
         Parameters
         ----------
@@ -99,113 +135,19 @@ class DynamicMplCanvas(MplCanvas):
         """
         # Clear plotting canvas and define variables used for plotting
         self._reset_plots() 
-        self.x = x
-        self.y = y
+        self.x          = x
+        self.y          = y
+        self.reduction  = None
+        self.sample_idx = None
 
         try:
-            # Scatter plot
-            if plot_type == 'Scatter':
-                title_str = "Scatter: {} x {}".format(xlabel, ylabel)
-                self.axes.scatter(x, y, alpha=.6)
-                self.axes.set_xlabel(xlabel)
-                self.axes.set_ylabel(ylabel)
-                self.axes.set_title(title_str)
-
-            # Line plot
-            elif plot_type == 'Line':
-                title_str = "Line: {} x {}".format(xlabel, ylabel)
-                self.axes.plot(x, y, alpha=.6)
-                self.axes.set_xlabel(xlabel)
-                self.axes.set_ylabel(ylabel)
-                self.axes.set_title(title_str)
-            
-            # Scatter + Line plot
-            elif plot_type == 'Scatter + Line':
-                title_str = "Scatter + Line: {} x {}".format(xlabel, ylabel)
-                self.axes.plot(x, y, '-o', alpha=.6)
-                self.axes.set_xlabel(xlabel)
-                self.axes.set_ylabel(ylabel)
-                self.axes.set_title(title_str)
-            
-            # Histogram
-            elif plot_type == 'Histogram':
-                if x is not None: self.axes.hist(x, alpha=.6, label=xlabel, color='blue')
-                if y is not None: self.axes.hist(y, alpha=.6, label=ylabel, color='green')
-                
-                # Add labels and title
-                if x is not None and y is not None:
-                    title_str = "Histogram: {} and {}".format(xlabel, ylabel)
-                    self.axes.set_xlabel(xlabel + ' and ' + ylabel)
-                
-                elif x is not None and y is None:
-                    title_str = "Histogram: {}".format(xlabel)
-                    self.axes.set_xlabel(xlabel)
-                
-                else:
-                    title_str = "Histogram: {}".format(ylabel)
-                    self.axes.set_xlabel(ylabel)
-
-                # Set title for any histogram
-                self.axes.set_title(title_str)
-                self.axes.set_ylabel('Count')
-                plt.legend(loc='best')
-
-            # Bar Chart
-            elif plot_type == 'Bar Chart':
-                if x is not None:
-                    self.axes.bar(np.unique(x), pd.value_counts(x), alpha=.6, label=xlabel, color='blue')
-
-                if y is not None: 
-                    self.axes.bar(np.unique(y), pd.value_counts(y), alpha=.6, label=ylabel, color='green')
-
-                # Add labels and title
-                if x is not None and y is not None:
-                    title_str = "Bar Chart: {} and {}".format(xlabel, ylabel)
-                    self.axes.set_xlabel(xlabel + ' and ' + ylabel)
-                
-                elif x is not None and y is None:
-                    title_str = "Bar Chart: {}".format(xlabel)
-                    self.axes.set_xlabel(xlabel)
-
-                else:
-                    title_str = "Bar Chart: {}".format(ylabel)
-                    self.axes.set_xlabel(ylabel)
-
-                # Set title for any bar chart
-                self.axes.set_title(title_str)
-                self.axes.set_ylabel('Count')
-                plt.legend(loc='best')
-
-            # Boxplot
-            else:
-                if x is not None and y is None:
-                    title_str = "Boxplot: {}".format(xlabel)
-                    self.axes.boxplot(x)
-                    self.axes.set_ylabel('Value')
-                    self.axes.set_title(title_str)
-
-                elif x is None and y is not None: 
-                    title_str = "Boxplot: {}".format(ylabel)
-                    self.axes.boxplot(y)
-                    self.axes.set_ylabel('Value')
-                    self.axes.set_title(title_str)
-
-                else:
-                    self.fig.delaxes(self.axes)
-
-                    # X variable
-                    self.axes_x = self.fig.add_subplot(121)
-                    self.axes_x.boxplot(x)
-                    self.axes_x.set_ylabel("Value")
-                    self.axes_x.set_title("Boxplot: {}".format(xlabel))
-
-                    # Y variable
-                    self.axes_y = self.fig.add_subplot(122)
-                    self.axes_y.boxplot(y)
-                    self.axes_y.set_title("Boxplot: {}".format(ylabel))
-
-            # Create better layout and draw
-            plt.tight_layout()
+            state = plots.draw_plot(self.fig, self.axes, x, y, xlabel, ylabel, plot_type, 
+                                    n_buckets=self._n_buckets(), 
+                                    large_data_threshold=self.large_data_threshold)
+            if state['axes_x'] is not None: self.axes_x, self.axes_y = state['axes_x'], state['axes_y']
+            self.colorbar   = state['colorbar']
+            self.reduction  = state['reduction']
+            self.sample_idx = state['sample_idx']
             self.draw()
 
             # Update plot status
@@ -250,10 +192,14 @@ class DynamicMplCanvas(MplCanvas):
             Status of method
         """
         try:
+            # Overlays are reduced the same way as the plot they are drawn on
+            y_pred = np.asarray(y_pred)
+
             if model_type == 'Regression':
                 if self._reg_predictions_added > (len(REG_COLORS)-1): self._reg_predictions_added = 0
                 
-                self.axes.scatter(self.x, y_pred, label='Predicted: {}'.format(model_name),
+                idx = self._overlay_indices(y_pred)
+                self.axes.scatter(self.x.iloc[idx], y_pred[idx], label='Predicted: {}'.format(model_name),
                                   color=REG_COLORS[self._reg_predictions_added], alpha=.6)
                 self._reg_predictions_added += 1
             
@@ -261,7 +207,9 @@ class DynamicMplCanvas(MplCanvas):
                 if self._clf_predictions_added > (len(CLF_COLORS)-1): self._clf_predictions_added = 0
                 
                 # Plot hits and misses
-                hits, misses = np.where(y_pred == self.y)[0], np.where(y_pred != self.y)[0]
+                idx          = self._overlay_indices(y_pred)
+                correct      = y_pred[idx] == np.asarray(self.y)[idx]
+                hits, misses = idx[correct], idx[~correct]
                 self.axes.scatter(self.x.iloc[hits], y_pred[hits], 
                                   label='Correct: {}'.format(model_name), alpha=.6, facecolors='none', 
                                   edgecolors=CLF_COLORS[self._clf_predictions_added][0])
@@ -274,8 +222,9 @@ class DynamicMplCanvas(MplCanvas):
                 cluster_ids  = np.unique(y_pred)
                 CLUST_COLORS = utils.get_spaced_colors(len(cluster_ids)+1, offset=self._clust_predictions_added)
 
+                plotted = self._overlay_indices(self.y)
                 for i, label in enumerate(cluster_ids):
-                    idx = np.where(y_pred == label)[0]
+                    idx = plotted[y_pred[plotted] == label]
                     self.axes.scatter(self.x.iloc[idx], self.y.iloc[idx], 
                                       label='Cluster {}: {}'.format(i, model_name),
                                       color=next(CLUST_COLORS),
@@ -10,20 +10,14 @@ import matplotlib
 matplotlib.use('Qt4Agg')
 matplotlib.rcParams['backend.qt4'] = 'PySide'
 from matplotlib.backends.backend_qt4agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt4agg import NavigationToolbar2QT as NavigationToolbar
 import matplotlib.pyplot as plt
 
 from PySide.QtGui import QSizePolicy
 
 import numpy as np
-import pandas as pd
 
 # Custom functions
+from plots import CLF_COLORS, DEFAULT_BUCKETS, LARGE_DATA_THRESHOLD, REG_COLORS
+import plots
 import utils
-
-# Set plotting style
-plt.style.use('seaborn-darkgrid')
-
-# Define colors to use
-REG_COLORS = ['red', 'orange', 'cyan', 'purple', 'teal', 'dodgerblue', 
-                'darkgreen', 'darksalmon', 'slategrey']
-CLF_COLORS = [['green', 'red'], ['darkgreen', 'darksalmon'], ['purple', 'orange']]
\ No newline at end of file
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from __future__ import division, print_function
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import sketches
+
+
+def zipf_values(n, seed=0):
+    """Skewed values with a few heavy hitters and a long tail of rare values"""
+    return np.random.RandomState(seed).zipf(1.3, size=n).astype(np.int64)
+
+
+# HyperLogLog
+
+@pytest.mark.parametrize('n_distinct', [100, 5000, 200000])
+def test_hyperloglog_within_error_bound(n_distinct):
+    hll    = sketches.HyperLogLog()
+    values = np.arange(n_distinct).astype(str)
+    for batch in np.array_split(values, 7): hll.update(sketches.hash_values(batch))
+
+    # Four standard errors, so a correct sketch fails far less than once in 10000 runs
+    error = abs(hll.estimate() - n_distinct)/float(n_distinct)
+    assert error <= 4*hll.std_error()
+
+
+def test_hyperloglog_ignores_repeats():
+    hll    = sketches.HyperLogLog()
+    hashes = sketches.hash_values(np.arange(1000))
+    for _ in range(5): hll.update(hashes)
+    assert abs(hll.estimate() - 1000) <= 4*hll.std_error()*1000
+
+
+def test_hyperloglog_merge_equals_union():
+    left, right, union = sketches.HyperLogLog(), sketches.HyperLogLog(), sketches.HyperLogLog()
+    a, b               = np.arange(0, 60000), np.arange(40000, 100000)
+    left.update(sketches.hash_values(a))
+    right.update(sketches.hash_values(b))
+    union.update(sketches.hash_values(np.concatenate([a, b])))
+
+    left.merge(right)
+    np.testing.assert_array_equal(left.registers, union.registers)
+    assert left.estimate() == union.estimate()
+
+
+def test_hash_values_equal_across_types():
+    np.testing.assert_array_equal(sketches.hash_values(np.array([1, 2], dtype=object)),
+                                  sketches.hash_values([1, 2]))
+
+
+# TopKSketch
+
+def check_top_k(sketch, values):
+    """Kept counts are never more than true counts, are short by at most error, and error is
+    at most n/(capacity + 1)"""
+    true = pd.Series(values).value_counts()
+    top  = sketch.top(sketch.capacity)
+
+    assert sketch.n == values.shape[0]
+    assert sketch.error <= values.shape[0]/(sketch.capacity + 1.0)
+    assert (top.values <= true.reindex(top.index).values).all()
+    assert (true.reindex(top.index).values - top.values <= sketch.error).all()
+
+    # Every value occurring more than error times is kept
+    assert set(true[true > sketch.error].index) <= set(top.index)
+
+
+@pytest.mark.parametrize('capacity', [10, 50, 1000])
+def test_top_k_within_error_bound(capacity):
+    values = zipf_values(100000)
+    sketch = sketches.TopKSketch(capacity=capacity)
+    for batch in np.array_split(values, 13):
+        sketch.update(sketches.hash_values(batch), batch)
+    check_top_k(sketch, values)
+
+
+def test_top_k_merge_within_error_bound():
+    values = zipf_values(100000, seed=1)
+    merged = sketches.TopKSketch(capacity=50)
+    for part in np.array_split(values, 4):
+        sketch = sketches.TopKSketch(capacity=50)
+        for batch in np.array_split(part, 3):
+            sketch.update(sketches.hash_values(batch), batch)
+        merged.merge(sketch)
+    check_top_k(merged, values)
+
+
+def test_top_k_exact_below_capacity():
+    values = np.array(list('aabbbcddddd'), dtype=object)
+    sketch = sketches.TopKSketch(capacity=10)
+    sketch.update(sketches.hash_values(values), values)
+    assert sketch.error == 0
+    assert sketch.top(2).to_dict() == {'d': 5, 'b': 3}
+
+
+def test_frequency_sketch_other_bucket_holds_remaining_count():
+    values = zipf_values(50000).astype(object)
+    sketch = sketches.FrequencySketch(capacity=100)
+    sketch.update(values)
+    table  = sketch.frequencies(n=10)
+
+    assert table.index[-1] == sketches.OTHER_LABEL
+    assert table.shape[0] == 11
+    assert table.sum() == values.shape[0]
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+from __future__ import division, print_function
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import streaming
+
+
+@pytest.fixture
+def values():
+    """Skewed data, so third and fourth moments are far from zero"""
+    return np.random.RandomState(1718).lognormal(size=200000)
+
+
+def split(values, n_parts, seed=0):
+    """Splits values into parts of random sizes"""
+    cuts = np.sort(np.random.RandomState(seed).choice(np.arange(1, values.shape[0]), n_parts - 1,
+                                                      replace=False))
+    return np.split(values, cuts)
+
+
+def rank_errors(values, estimates, q):
+    """Distance between fraction of values below each estimate and its target quantile"""
+    ordered = np.sort(values)
+    lower   = np.searchsorted(ordered, estimates, side='left')/float(values.shape[0])
+    upper   = np.searchsorted(ordered, estimates, side='right')/float(values.shape[0])
+    q       = np.asarray(q)
+    return np.where(q < lower, lower - q, np.where(q > upper, q - upper, 0.0))
+
+
+# MomentAccumulator
+
+def check_moments(accumulator, values):
+    centered = values - values.mean()
+    m2       = np.mean(centered**2)
+    assert accumulator.n == values.shape[0]
+    np.testing.assert_allclose([accumulator.mean, accumulator.variance(), accumulator.skewness(),
+                                accumulator.kurtosis()],
+                               [values.mean(), m2, np.mean(centered**3)/m2**1.5,
+                                np.mean(centered**4)/m2**2 - 3], rtol=1e-9)
+    assert accumulator.min == values.min() and accumulator.max == values.max()
+
+
+@pytest.mark.parametrize('n_parts', [1, 2, 37])
+def test_moment_accumulator_updates_match_numpy(values, n_parts):
+    accumulator = streaming.MomentAccumulator()
+    for part in split(values, n_parts): accumulator.update(part)
+    check_moments(accumulator, values)
+
+
+@pytest.mark.parametrize('n_workers', [2, 3, 8])
+def test_moment_accumulator_merges_match_numpy(values, n_workers):
+    # Parts are accumulated round robin by separate accumulators, as by separate processes
+    workers = [streaming.MomentAccumulator() for _ in range(n_workers)]
+    for i, part in enumerate(split(values, 40)): workers[i % n_workers].update(part)
+
+    merged = streaming.MomentAccumulator()
+    for worker in workers: merged.merge(worker)
+    check_moments(merged, values)
+
+
+def test_moment_accumulator_merge_with_empty(values):
+    accumulator, empty = streaming.MomentAccumulator(), streaming.MomentAccumulator()
+    accumulator.update(values)
+    accumulator.merge(empty)
+    empty.merge(accumulator)
+    check_moments(accumulator, values)
+    check_moments(empty, values)
+
+
+# KLLSketch
+
+QUANTILES = [0.005, 0.025, 0.25, 0.5, 0.75, 0.975, 0.995]
+
+
+@pytest.mark.parametrize('n_parts', [1, 10, 113])
+def test_kll_quantiles_within_rank_error(values, n_parts):
+    sketch = streaming.KLLSketch(seed=0)
+    for part in split(values, n_parts): sketch.update(part)
+
+    assert sketch.n == values.shape[0]
+    assert rank_errors(values, sketch.quantiles(QUANTILES), QUANTILES).max() <= 0.0165
+
+    # Memory stays bounded by the sketch size rather than number of values
+    assert sum(level.shape[0] for level in sketch.levels) < 4*streaming.KLL_K
+
+
+def test_kll_merged_quantiles_within_rank_error(values):
+    sketches = [streaming.KLLSketch(seed=seed) for seed in range(4)]
+    for i, part in enumerate(split(values, 20)): sketches[i % 4].update(part)
+
+    merged = streaming.KLLSketch(seed=0)
+    for sketch in sketches: merged.merge(sketch)
+    assert merged.n == values.shape[0]
+    assert rank_errors(values, merged.quantiles(QUANTILES), QUANTILES).max() <= 0.0165
+
+
+def test_kll_exact_below_capacity():
+    values = np.random.RandomState(0).permutation(100).astype(float)
+    sketch = streaming.KLLSketch()
+    sketch.update(values)
+    np.testing.assert_array_equal(sketch.quantiles([0, 1]), [0, 99])
+    np.testing.assert_allclose(sketch.cdf([50.0]), [0.5])
+
+
+# streaming_statistics
+
+@pytest.fixture
+def data_file(tmpdir):
+    rng  = np.random.RandomState(0)
+    data = pd.DataFrame({'x': rng.normal(size=5000), 'n': rng.randint(0, 10, size=5000),
+                         'c': rng.choice(['a', 'b', 'c'], size=5000)})
+    path = str(tmpdir.join('data.csv'))
+    data.to_csv(path, index=False)
+    return data, path
+
+
+def test_streaming_statistics_reads_all_columns(data_file):
+    data, path = data_file
+    results    = streaming.streaming_statistics(path, chunksize=700)
+
+    assert list(results.keys()) == list(data.columns)
+    stats, freq, numeric, dtype = results['x']
+    assert numeric == 1 and dtype == 'float64'
+    np.testing.assert_allclose(stats['Mean'], data['x'].mean())
+    assert freq['Count'].sum() == data.shape[0]
+
+    stats, freq, numeric, _ = results['c']
+    assert numeric == 0 and stats['Unique'] == 3
+    assert freq.to_dict() == data['c'].value_counts().to_dict()
+
+
+def test_streaming_statistics_converts_chunks_to_dtypes(data_file):
+    data, path = data_file
+    results    = streaming.streaming_statistics(path, columns=['n', 'c'], chunksize=700,
+                                                dtypes={'n': 'float32', 'c': 'category'})
+    assert results['n'][3] == 'float32'
+    assert results['c'][3] == 'category'
+    np.testing.assert_allclose(results['n'][0]['Mean'], data['n'].mean(), rtol=1e-6)
+
+
+def test_streaming_statistics_stops_when_callback_returns_true(data_file):
+    _, path = data_file
+    calls   = []
+    stop    = lambda n_rows, bytes_read, total_bytes: calls.append(n_rows) or len(calls) == 2
+    assert streaming.streaming_statistics(path, chunksize=700, callback=stop) is None
+    assert calls == [700, 1400]
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+from __future__ import division, print_function
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import utils
+
+
+@pytest.fixture
+def values():
+    """Skewed data with ties, so order statistics and moments are not trivial"""
+    rng = np.random.RandomState(1718)
+    return np.round(rng.lognormal(size=100003), 2)
+
+
+def skewness(values):
+    """Biased skewness, as used by numpy's Doane rule"""
+    centered = values - values.mean()
+    return np.mean(centered**3)/np.mean(centered**2)**1.5
+
+
+# partition_percentiles
+
+def test_partition_percentiles_matches_numpy(values):
+    q       = [0, 0.5, 2.5, 25, 50, 75, 97.5, 99.5, 100]
+    pcts, _ = utils.partition_percentiles(values, q)
+    np.testing.assert_allclose(pcts, np.percentile(values, q), rtol=0, atol=1e-12)
+
+
+def test_partition_percentiles_overwrite_partitions_in_place(values):
+    copy              = values.copy()
+    pcts, partitioned = utils.partition_percentiles(copy, [50], overwrite=True)
+    assert partitioned is copy
+    assert pcts[0] == np.median(values)
+    np.testing.assert_array_equal(np.sort(copy), np.sort(values))
+
+
+def test_partition_percentiles_leaves_input_unchanged(values):
+    copy = values.copy()
+    utils.partition_percentiles(copy, [25, 75])
+    np.testing.assert_array_equal(copy, values)
+
+
+def test_partition_percentiles_single_value():
+    pcts, _ = utils.partition_percentiles(np.array([3.0]), [0, 50, 100])
+    np.testing.assert_array_equal(pcts, [3.0, 3.0, 3.0])
+
+
+# central_moments
+
+@pytest.mark.parametrize('block_size', [1, 7, 1000, utils.STATS_BLOCK_SIZE])
+def test_central_moments_match_numpy(values, block_size):
+    mean, m2, m3, m4 = utils.central_moments(values, shift=np.median(values), block_size=block_size)
+    centered         = values - values.mean()
+    np.testing.assert_allclose([mean, m2, m3, m4],
+                               [values.mean(), np.mean(centered**2), np.mean(centered**3),
+                                np.mean(centered**4)], rtol=1e-9)
+
+
+def test_central_moments_stable_with_large_offset(values):
+    shifted        = values + 1e9
+    mean, m2, _, _ = utils.central_moments(shifted, shift=np.median(shifted))
+    np.testing.assert_allclose(mean, values.mean() + 1e9, rtol=1e-12)
+    np.testing.assert_allclose(m2, values.var(), rtol=1e-6)
+
+
+# bin_edges
+
+@pytest.mark.parametrize('rule, numpy_rule', [('Doane', 'doane'),
+                                              ('Freedman-Diaconis', 'fd'),
+                                              ('Sturges', 'sturges')])
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_bin_edges_match_numpy(rule, numpy_rule, seed):
+    rng       = np.random.RandomState(seed)
+    data      = rng.gamma(2.0, size=5000)
+    quantiles = lambda q: np.percentile(data, np.asarray(q)*100)
+    edges     = utils.bin_edges(data.shape[0], data.min(), data.max(), rule=rule,
+                                skewness=skewness(data), quantiles=quantiles)
+    np.testing.assert_allclose(edges, np.histogram_bin_edges(data, bins=numpy_rule))
+
+
+def test_bin_edges_fixed_width():
+    edges = utils.bin_edges(10, 0.0, 1.0, rule='Fixed Width', bin_width=0.25)
+    np.testing.assert_allclose(edges, [0.0, 0.25, 0.5, 0.75, 1.0])
+
+
+def test_bin_edges_fixed_width_too_many_bins():
+    with pytest.raises(ValueError):
+        utils.bin_edges(10, 0.0, 1.0, rule='Fixed Width', bin_width=1.0/(utils.MAX_BINS + 1))
+
+
+def test_bin_edges_quantile_bins_hold_equal_counts():
+    data      = np.random.RandomState(0).exponential(size=10000)
+    quantiles = lambda q: np.percentile(data, np.asarray(q)*100)
+    edges     = utils.bin_edges(data.shape[0], data.min(), data.max(), rule='Quantile',
+                                quantiles=quantiles, n_bins=4)
+    counts, _ = np.histogram(data, bins=edges)
+    np.testing.assert_array_equal(counts, [2500]*4)
+
+
+def test_bin_edges_without_spread():
+    np.testing.assert_array_equal(utils.bin_edges(5, 2.0, 2.0), [1.5, 2.5])
+
+
+@pytest.mark.parametrize('rule, numpy_rule', [('Sturges', 'sturges'),
+                                              ('Freedman-Diaconis', 'fd')])
+def test_value_counts_grouped_matches_numpy_histogram(values, rule, numpy_rule):
+    table     = utils.value_counts_grouped(values, rule=rule)
+    counts, _ = np.histogram(values, bins=numpy_rule)
+    np.testing.assert_array_equal(table['Count'].values, counts)
+
+
+def test_value_counts_grouped_quantile_bins_leave_input_unchanged(values):
+    copy  = values.copy()
+    table = utils.value_counts_grouped(copy, rule='Quantile', n_bins=4)
+    np.testing.assert_array_equal(copy, values)
+    assert table['Count'].sum() == values.shape[0]
+
+
+# build_design_matrix
+
+def test_build_design_matrix_one_hot_encodes_several_categorical_variables():
+    columns = [pd.Series(['b', 'a', None, 'b'], name='x'),
+               pd.Series(['u', 'v', 'w', 'u'], dtype='category', name='c'),
+               pd.Series([1.5, 2.5, 3.5, 4.5], name='n')]
+    X, names = utils.build_design_matrix(columns)
+
+    assert X.shape == (4, 6)
+    assert names == ['x=a', 'x=b', 'c=u', 'c=v', 'c=w', 'n']
+    np.testing.assert_array_equal(X, [[0, 1, 1, 0, 0, 1.5],
+                                      [1, 0, 0, 1, 0, 2.5],
+                                      [0, 0, 0, 0, 1, 3.5],
+                                      [0, 1, 1, 0, 0, 4.5]])
+
+
+# holdout_mask
+
+@pytest.mark.parametrize('chunksize', [1, 7, 1000, 4096, 100000])
+def test_holdout_mask_independent_of_chunk_size(chunksize):
+    n        = 20000
+    expected = utils.holdout_mask(0, n)
+    mask     = np.concatenate([utils.holdout_mask(start, min(chunksize, n - start))
+                               for start in range(0, n, chunksize)])
+    np.testing.assert_array_equal(mask, expected)
+
+
+def test_holdout_mask_fraction():
+    mask = utils.holdout_mask(0, 100000, fraction=0.2)
+    assert abs(mask.mean() - 0.2) < 0.01
+
+
+# stratified_sample_indices
+
+def test_stratified_sample_keeps_cluster_proportions():
+    labels = np.repeat([0, 1, 2, 3], [50000, 30000, 19990, 10])
+    np.random.RandomState(0).shuffle(labels)
+    idx    = utils.stratified_sample_indices(labels, 1000, random_state=0)
+
+    assert np.all(np.diff(idx) > 0)
+    sampled = np.bincount(labels[idx], minlength=4)
+    np.testing.assert_array_equal(sampled, [500, 300, 200, 1])
+
+
+def test_stratified_sample_is_reproducible():
+    labels = np.random.RandomState(0).randint(0, 5, size=20000)
+    first  = utils.stratified_sample_indices(labels, 500, random_state=3)
+    second = utils.stratified_sample_indices(labels, 500, random_state=3)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_stratified_sample_small_data_uses_all_rows():
+    labels = np.array([1, 1, 0])
+    np.testing.assert_array_equal(utils.stratified_sample_indices(labels, 10), [0, 1, 2])